@@ -0,0 +1,93 @@
+"""Compare /info throughput of the blocking API client against AsyncInfo.
+
+A local mock server answers every POST after a fixed delay that stands in for network latency. The sync client
+issues requests one after another (the way a single strategy thread does today), the async client keeps
+`--concurrency` requests in flight on one event loop.
+
+    python benchmarks/async_api_benchmark.py --requests 500 --concurrency 100 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.info import Info
+from hyperliquid.utils.types import Meta, SpotMeta
+
+EMPTY_META: Meta = {"universe": []}
+EMPTY_SPOT_META: SpotMeta = {"universe": [], "tokens": []}
+RESPONSE = json.dumps({"assetPositions": [], "marginSummary": {"accountValue": "0.0"}}).encode()
+
+
+def start_mock_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(RESPONSE)))
+            self.end_headers()
+            self.wfile.write(RESPONSE)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_sync(base_url: str, n_requests: int) -> float:
+    info = Info(base_url, skip_ws=True, meta=EMPTY_META, spot_meta=EMPTY_SPOT_META)
+    start = time.perf_counter()
+    for i in range(n_requests):
+        info.user_state(f"0x{i:040x}")
+    return n_requests / (time.perf_counter() - start)
+
+
+async def bench_async(base_url: str, n_requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with await AsyncInfo.create(
+        base_url, skip_ws=True, meta=EMPTY_META, spot_meta=EMPTY_SPOT_META, max_connections=concurrency
+    ) as info:
+
+        async def one(i):
+            async with semaphore:
+                await info.user_state(f"0x{i:040x}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+        return n_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark sync vs async info requests against a local mock server")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = start_mock_server(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        sync_rps = bench_sync(base_url, args.requests)
+        async_rps = asyncio.run(bench_async(base_url, args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+
+    print(f"sync  Info.user_state:      {sync_rps:10.1f} req/s")
+    print(f"async AsyncInfo.user_state: {async_rps:10.1f} req/s (concurrency {args.concurrency})")
+    print(f"speed-up: {async_rps / sync_rps:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
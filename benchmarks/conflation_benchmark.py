@@ -0,0 +1,95 @@
+"""CPU spent on bursty l2Book traffic with and without conflated subscriptions.
+
+Feeds bursts of 20-level l2Book messages through WebsocketManager.on_message to a callback that applies each book to a
+LocalBook and then does a fixed amount of strategy work. Without conflation every message is processed on the
+websocket thread, with Info.subscribe(..., conflate=True) semantics the callback only sees the newest book whenever it
+becomes free. Reports the callbacks run, the process CPU time and the delay until the final book of the run was seen.
+
+    python benchmarks/conflation_benchmark.py --bursts 20 --burst-size 200 --work-us 200
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+
+import websocket
+
+from hyperliquid.utils.local_book import LocalBook
+from hyperliquid.websocket_manager import WebsocketManager
+
+LEVELS = 20
+
+
+class NullWebsocket(websocket.WebSocketApp):
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        pass
+
+    def close(self, **kwargs):
+        pass
+
+
+def make_messages(n_messages):
+    rng = random.Random(0)
+    messages = []
+    for t in range(n_messages):
+        mid = 2000 + rng.uniform(-5, 5)
+        levels = [
+            [{"px": f"{mid - 0.5 - i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)],
+            [{"px": f"{mid + 0.5 + i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)],
+        ]
+        messages.append(json.dumps({"channel": "l2Book", "data": {"coin": "ETH", "time": t, "levels": levels}}))
+    return messages
+
+
+def run(messages, burst_size, gap, work_us, conflate):
+    manager = WebsocketManager("http://localhost")
+    manager.ws = NullWebsocket(manager.ws_url)
+    manager.on_open(manager.ws)
+    book = LocalBook("ETH")
+    calls = 0
+    done = threading.Event()
+    last_time = len(messages) - 1
+
+    def on_book(msg):
+        nonlocal calls
+        calls += 1
+        book.on_message(msg)
+        deadline = time.perf_counter() + work_us / 1e6
+        while time.perf_counter() < deadline:
+            pass
+        if book.time == last_time:
+            done.set()
+
+    manager.subscribe({"type": "l2Book", "coin": "ETH"}, on_book, policy="conflate" if conflate else None)
+    cpu_start = time.process_time()
+    for start in range(0, len(messages), burst_size):
+        for message in messages[start : start + burst_size]:
+            manager.on_message(None, message)
+        time.sleep(gap)
+    sent = time.perf_counter()
+    done.wait()
+    latency = time.perf_counter() - sent
+    cpu = time.process_time() - cpu_start
+    manager.stop()
+    return calls, cpu, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark conflated l2Book subscriptions under bursty load")
+    parser.add_argument("--bursts", type=int, default=20)
+    parser.add_argument("--burst-size", type=int, default=200)
+    parser.add_argument("--gap", type=float, default=0.01, help="seconds between bursts")
+    parser.add_argument("--work-us", type=float, default=200, help="strategy work per callback in microseconds")
+    args = parser.parse_args()
+
+    messages = make_messages(args.bursts * args.burst_size)
+    for conflate in (False, True):
+        calls, cpu, latency = run(messages, args.burst_size, args.gap, args.work_us, conflate)
+        label = "conflated" if conflate else "every message"
+        print(f"{label:14} {calls:7d} callbacks   cpu {cpu:6.2f}s   last book seen {latency * 1e3:8.1f} ms after send")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Time from deciding to pull all orders until the cancel and scheduleCancel requests are handed to the HTTP client.
+
+Signing on demand builds and signs a cancel of --orders open orders and a scheduleCancel (Exchange.bulk_cancel and
+Exchange.schedule_cancel), EmergencyCancels.fire() sends actions that were signed beforehand. The HTTP call itself is
+replaced by a no-op, so only the work on the critical path before the request is measured. Best of --rounds.
+
+    python benchmarks/emergency_cancels_benchmark.py --orders 50 --rounds 20
+"""
+
+import argparse
+import time
+
+import eth_account
+
+from hyperliquid.emergency_cancels import EmergencyCancels
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.utils.signing import CancelRequest
+from hyperliquid.utils.types import Any, Dict, List
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+
+
+class NullPostExchange(Exchange):
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        return {"status": "ok"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark pre-signed emergency cancels")
+    parser.add_argument("--orders", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    info = Info(
+        skip_ws=True, meta={"universe": [{"name": "ETH", "szDecimals": 4}]}, spot_meta={"universe": [], "tokens": []}
+    )
+    exchange = NullPostExchange(WALLET, info=info)
+    open_orders: List[Dict[str, Any]] = [{"coin": "ETH", "oid": oid} for oid in range(args.orders)]
+    cancels: List[CancelRequest] = [{"coin": "ETH", "oid": oid} for oid in range(args.orders)]
+    emergency = EmergencyCancels(exchange, open_orders=lambda: open_orders)
+
+    def sign_on_demand():
+        exchange.bulk_cancel(cancels)
+        exchange.schedule_cancel(int(time.time() * 1000) + 10000)
+
+    for name, target in (("sign on demand", sign_on_demand), ("pre-signed", emergency.fire)):
+        best = float("inf")
+        for _ in range(args.rounds):
+            emergency.refresh()
+            start = time.perf_counter()
+            target()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:15} {best * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
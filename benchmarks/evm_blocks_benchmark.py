@@ -0,0 +1,132 @@
+"""Throughput and memory of indexing HyperEVM block files.
+
+Writes --blocks synthetic <height>.rmp.lz4 files with Buffer encoded fields, then indexes them in separate processes
+the way examples/evm_block_indexer.py used to (every block converted to a dict of hex strings, kept in a list and
+dumped as JSON) and with index_evm_block_files (streamed into Parquet with raw bytes and decoded integers), and
+reports blocks/s, transactions/s, peak RSS and output size.
+
+    python benchmarks/evm_blocks_benchmark.py --blocks 5000 --txs 20
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import shutil
+import tempfile
+import time
+
+import lz4.frame
+import msgpack
+
+from hyperliquid.utils.evm_blocks import index_evm_block_files, read_evm_block_file
+from hyperliquid.utils.types import Tuple
+
+
+def buffer(data):
+    return {"type": "Buffer", "data": list(data)}
+
+
+def make_block(rng, number, n_txs):
+    transactions = []
+    for i in range(n_txs):
+        content = {
+            "chainId": buffer(b"\x03\xe7"),
+            "nonce": buffer(i.to_bytes(2, "big")),
+            "gas": buffer(rng.randrange(21000, 10**6).to_bytes(3, "big")),
+            "to": buffer(rng.randbytes(20)),
+            "value": buffer(rng.randrange(10**20).to_bytes(9, "big")),
+            "input": buffer(rng.randbytes(rng.choice([0, 4, 68, 260]))),
+            "maxFeePerGas": buffer(b"\x3b\x9a\xca\x00"),
+            "maxPriorityFeePerGas": buffer(b"\x01"),
+            "accessList": [],
+        }
+        signature = [buffer(rng.randbytes(32)), buffer(rng.randbytes(32)), buffer(b"\x01")]
+        transactions.append({"transaction": {"Eip1559": content}, "signature": signature})
+    header = {
+        field: buffer(rng.randbytes(32)) for field in ("parentHash", "stateRoot", "transactionsRoot", "receiptsRoot")
+    }
+    header.update(
+        sha3Uncles=buffer(b"\x00" * 32),
+        miner=buffer(b"\x00" * 20),
+        number=buffer(number.to_bytes(4, "big")),
+        gasLimit=buffer((30_000_000).to_bytes(4, "big")),
+        gasUsed=buffer((21_000 * n_txs).to_bytes(4, "big")),
+        timestamp=buffer((1_700_000_000 + number).to_bytes(4, "big")),
+        extraData=buffer(b""),
+        baseFeePerGas=buffer(b"\x07"),
+    )
+    reth_block = {
+        "header": {"hash": buffer(rng.randbytes(32)), "header": header},
+        "body": {"transactions": transactions},
+    }
+    return {"block": {"Reth115": reth_block}}
+
+
+def hexify(data):
+    # the recursive Buffer to hex string conversion of the previous example
+    if isinstance(data, dict):
+        if data.get("type") == "Buffer":
+            return "0x" + "".join(f"{x:02x}" for x in data["data"])
+        return {k: hexify(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [hexify(item) for item in data]
+    return data
+
+
+def list_and_json(paths, out_dir):
+    blocks = []
+    for path in paths:
+        for block_data in read_evm_block_file(path, decode_buffers=False):
+            blocks.append(hexify(block_data["block"]["Reth115"]))
+    out_path = os.path.join(out_dir, "processed_blocks.json")
+    with open(out_path, "w") as f:
+        json.dump({"blocks": blocks, "totalBlocks": len(blocks)}, f, indent=2)
+    return os.path.getsize(out_path)
+
+
+def parquet(paths, out_dir):
+    prefix = os.path.join(out_dir, "processed_")
+    index_evm_block_files(paths, prefix)
+    return os.path.getsize(prefix + "blocks.parquet") + os.path.getsize(prefix + "transactions.parquet")
+
+
+def run(target, paths, out_dir, results):
+    start = time.perf_counter()
+    size = target(paths, out_dir)
+    results.put((time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark evm block indexing")
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--txs", type=int, default=20, help="transactions per block")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    data_dir = tempfile.mkdtemp()
+    try:
+        paths = []
+        for number in range(1, args.blocks + 1):
+            path = os.path.join(data_dir, f"{number}.rmp.lz4")
+            with open(path, "wb") as f:
+                f.write(lz4.frame.compress(msgpack.packb(make_block(rng, number, rng.randrange(2 * args.txs + 1)))))
+            paths.append(path)
+        for name, target in (("list + json", list_and_json), ("parquet", parquet)):
+            results: "multiprocessing.Queue[Tuple[float, float, int]]" = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run, args=(target, paths, data_dir, results))
+            process.start()
+            elapsed, peak_mb, size = results.get()
+            process.join()
+            print(
+                f"{name:12} {args.blocks / elapsed:8.0f} blocks/s  {args.blocks * args.txs / elapsed:8.0f} txs/s"
+                f"  peak RSS {peak_mb:7.1f} MB  output {size / 2**20:7.1f} MB"
+            )
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
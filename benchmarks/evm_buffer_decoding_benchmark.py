@@ -0,0 +1,121 @@
+"""Time spent turning the Buffer fields of HyperEVM blocks into hex strings and integers.
+
+Packs a corpus of synthetic blocks with {"type": "Buffer", "data": [...]} fields, then unpacks and converts every
+block the way the previous block indexer example did (a f"{x:02x}" per byte, bytes() rebuilt from the int list for
+every integer) and with read_evm_block_file's object hook, which makes each Buffer contiguous bytes while
+unpacking, followed by buffer_to_hex / buffer_to_int. Both produce identical output, the best of --rounds is reported.
+
+    python benchmarks/evm_buffer_decoding_benchmark.py --blocks 1000 --txs 50
+"""
+
+import argparse
+import random
+import time
+
+import msgpack
+
+from hyperliquid.utils.evm_blocks import (
+    BLOCK_BYTES_FIELDS,
+    BLOCK_INT_FIELDS,
+    TX_INT_FIELDS,
+    buffer_to_hex,
+    buffer_to_int,
+    decode_buffer_object,
+)
+
+
+def buffer(data):
+    return {"type": "Buffer", "data": list(data)}
+
+
+def make_block(rng, number, n_txs):
+    transactions = []
+    for i in range(n_txs):
+        content = {
+            "chainId": buffer(b"\x03\xe7"),
+            "nonce": buffer(i.to_bytes(2, "big")),
+            "gas": buffer(rng.randrange(21000, 10**6).to_bytes(3, "big")),
+            "to": buffer(rng.randbytes(20)),
+            "value": buffer(rng.randrange(10**20).to_bytes(9, "big")),
+            "input": buffer(rng.randbytes(rng.choice([0, 4, 68, 260, 1000]))),
+            "maxFeePerGas": buffer(b"\x3b\x9a\xca\x00"),
+            "maxPriorityFeePerGas": buffer(b"\x01"),
+        }
+        signature = [buffer(rng.randbytes(32)), buffer(rng.randbytes(32)), buffer(b"\x01")]
+        transactions.append({"transaction": {"Eip1559": content}, "signature": signature})
+    header = {field: buffer(rng.randbytes(32)) for field in BLOCK_BYTES_FIELDS}
+    header.update({field: buffer(rng.randbytes(4)) for field in BLOCK_INT_FIELDS})
+    header["number"] = buffer(number.to_bytes(4, "big"))
+    reth_block = {
+        "header": {"hash": buffer(rng.randbytes(32)), "header": header},
+        "body": {"transactions": transactions},
+    }
+    return {"block": {"Reth115": reth_block}}
+
+
+# the conversions of the previous examples/evm_block_indexer.py
+def legacy_hex(value):
+    if isinstance(value, dict) and value.get("type") == "Buffer":
+        return "0x" + "".join(f"{x:02x}" for x in value["data"])
+    return str(value)
+
+
+def legacy_int(value):
+    if isinstance(value, dict) and value.get("type") == "Buffer":
+        return int.from_bytes(bytes(value["data"]), byteorder="big")
+    return 0
+
+
+def convert(block_data, to_hex, to_int):
+    reth_block = block_data["block"]["Reth115"]
+    header = reth_block["header"]["header"]
+    row = {"hash": to_hex(reth_block["header"]["hash"])}
+    row.update({field: to_hex(header[field]) for field in BLOCK_BYTES_FIELDS})
+    row.update({field: to_int(header[field]) for field in BLOCK_INT_FIELDS})
+    txs = []
+    for tx in reth_block["body"]["transactions"]:
+        content = tx["transaction"]["Eip1559"]
+        processed = {field: to_int(content[field]) for field in TX_INT_FIELDS if field in content}
+        processed.update(
+            to=to_hex(content["to"]),
+            value=to_int(content["value"]),
+            input=to_hex(content["input"]),
+            signature=[to_hex(part) for part in tx["signature"]],
+        )
+        txs.append(processed)
+    row["transactions"] = txs
+    return row
+
+
+def run_legacy(packed_blocks):
+    return [convert(msgpack.unpackb(packed), legacy_hex, legacy_int) for packed in packed_blocks]
+
+
+def run_decoded(packed_blocks):
+    return [
+        convert(msgpack.unpackb(packed, object_hook=decode_buffer_object), buffer_to_hex, buffer_to_int)
+        for packed in packed_blocks
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark EVM block Buffer decoding")
+    parser.add_argument("--blocks", type=int, default=1000)
+    parser.add_argument("--txs", type=int, default=50, help="transactions per block")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    packed_blocks = [msgpack.packb(make_block(rng, number, args.txs)) for number in range(1, args.blocks + 1)]
+    assert run_legacy(packed_blocks[:10]) == run_decoded(packed_blocks[:10])
+    for name, target in (("per byte", run_legacy), ("bytes", run_decoded)):
+        best = float("inf")
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            target(packed_blocks)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:9} {args.blocks / best:8.0f} blocks/s  {args.blocks * args.txs / best:9.0f} txs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Cost of formatting order prices and sizes for the wire.
+
+Compares the previous Decimal based float_to_wire against the current implementation, both with a cold cache (every
+value new) and for a quoting workload that re-sends orders on a small set of price levels, and times
+order_request_to_order_wire for a ladder of orders.
+
+    python benchmarks/float_to_wire_benchmark.py --values 100000 --levels 200
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from hyperliquid.utils.signing import OrderRequest, float_to_wire, order_request_to_order_wire
+from hyperliquid.utils.types import List
+
+
+def decimal_float_to_wire(x):
+    rounded = f"{x:.8f}"
+    if abs(float(rounded) - x) >= 1e-12:
+        raise ValueError("float_to_wire causes rounding", x)
+    normalized = Decimal(rounded).normalize()
+    return f"{normalized:f}"
+
+
+def ns_per_value(fn, values, clear_cache=False):
+    best = float("inf")
+    for _ in range(5):
+        if clear_cache:
+            float_to_wire.cache_clear()
+        start = time.perf_counter()
+        for x in values:
+            fn(x)
+        best = min(best, time.perf_counter() - start)
+    return best / len(values) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark float_to_wire")
+    parser.add_argument("--values", type=int, default=100000)
+    parser.add_argument("--levels", type=int, default=200, help="distinct price levels of the quoting workload")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    unique = [round(rng.uniform(1, 100000), rng.randrange(6)) for _ in range(args.values)]
+    levels = [round(2000 + 0.1 * i, 1) for i in range(args.levels)]
+    quoting = [rng.choice(levels) for _ in range(args.values)]
+    assert all(float_to_wire(x) == decimal_float_to_wire(x) for x in unique)
+
+    for name, values in (("unique values", unique), ("quoting levels", quoting)):
+        previous = ns_per_value(decimal_float_to_wire, values)
+        current = ns_per_value(float_to_wire, values, clear_cache=True)
+        print(f"{name:15} Decimal {previous:7.0f} ns  current {current:7.0f} ns  speed-up {previous / current:.1f}x")
+
+    orders: List[OrderRequest] = [
+        {
+            "coin": "ETH",
+            "is_buy": True,
+            "sz": round(rng.uniform(0.01, 5), 4),
+            "limit_px": px,
+            "reduce_only": False,
+            "order_type": {"limit": {"tif": "Alo"}},
+        }
+        for px in levels
+    ]
+    best = float("inf")
+    for _ in range(20):
+        start = time.perf_counter()
+        for order in orders:
+            order_request_to_order_wire(order, 4)
+        best = min(best, time.perf_counter() - start)
+    print(f"order_request_to_order_wire: {best / len(orders) * 1e6:.2f} us per order")
+
+
+if __name__ == "__main__":
+    main()
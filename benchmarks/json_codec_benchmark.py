@@ -0,0 +1,63 @@
+"""Decoding throughput of the JSON codecs over the recorded API responses in tests/cassettes.
+
+Every response body recorded by the test suite is decoded repeatedly with each installed codec, once from bytes as
+API.post receives it and once from str as WebsocketManager.on_message receives it. The largest payloads (l2Book
+snapshots, clearinghouse state, fills) dominate the totals, like they do in a live profile.
+
+    python benchmarks/json_codec_benchmark.py --rounds 200
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import yaml
+
+from hyperliquid.utils.json_codec import JSON_CODECS, get_json_codec
+
+CASSETTES = os.path.join(os.path.dirname(__file__), "..", "tests", "cassettes", "**", "*.yaml")
+
+
+def load_payloads():
+    payloads = []
+    for path in sorted(glob.glob(CASSETTES, recursive=True)):
+        with open(path) as f:
+            cassette = yaml.safe_load(f)
+        for interaction in cassette["interactions"]:
+            body = interaction["response"]["body"]["string"]
+            if body:
+                payloads.append(body.encode() if isinstance(body, str) else body)
+    return payloads
+
+
+def decode_rate(codec, payloads, rounds):
+    n_bytes = sum(len(payload) for payload in payloads) * rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            codec.loads(payload)
+    return n_bytes / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark JSON codecs on recorded API responses")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = load_payloads()
+    texts = [payload.decode() for payload in payloads]
+    print(f"{len(payloads)} payloads, {sum(len(payload) for payload in payloads) / 1e3:.1f} kB")
+    for name in JSON_CODECS:
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            print(f"{name:8} not installed")
+            continue
+        bytes_rate = decode_rate(codec, payloads, args.rounds)
+        str_rate = decode_rate(codec, texts, args.rounds)
+        print(f"{name:8} bytes: {bytes_rate:8.1f} MB/s   str: {str_rate:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Cost of building and signing a ladder of orders on one coin.
+
+Compares the Exchange.bulk_orders path (an OrderRequest dict per order, then order_request_to_order_wire with a
+name_to_asset lookup each) against ladder_to_order_wires on NumPy arrays of prices, sizes and sides, and times
+signing the resulting action, for ladders of 10, 100 and 1000 orders.
+
+    python benchmarks/ladder_benchmark.py --sizes 10 100 1000
+"""
+
+import argparse
+import time
+
+import eth_account
+import numpy as np
+
+from hyperliquid.info import Info
+from hyperliquid.utils.quantizer import Quantizer
+from hyperliquid.utils.signing import (
+    OrderRequest,
+    OrderType,
+    ladder_to_order_wires,
+    order_request_to_order_wire,
+    order_wires_to_order_action,
+    sign_l1_action,
+)
+from hyperliquid.utils.types import List, Meta
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+ORDER_TYPE: OrderType = {"limit": {"tif": "Alo"}}
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark order ladder construction and signing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    meta: Meta = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+    info = Info(skip_ws=True, meta=meta, spot_meta={"universe": [], "tokens": []})
+    quantizer = Quantizer(info.asset_to_sz_decimals)
+    for n in args.sizes:
+        offsets = np.arange(n)
+        # bids below and asks above 1900, 0.1 apart
+        sides = offsets % 2 == 0
+        levels = offsets // 2 * 0.1
+        prices = quantizer.round_px_array(1, np.where(sides, 1899.9 - levels, 1900.1 + levels))
+        sizes = quantizer.round_sz_array(1, 0.05 + 0.001 * offsets)
+
+        def per_order():
+            order_requests: List[OrderRequest] = [
+                {"coin": "ETH", "is_buy": b, "sz": s, "limit_px": p, "order_type": ORDER_TYPE, "reduce_only": False}
+                for b, s, p in zip(sides.tolist(), sizes.tolist(), prices.tolist())
+            ]
+            return [order_request_to_order_wire(order, info.name_to_asset(order["coin"])) for order in order_requests]
+
+        def ladder():
+            return ladder_to_order_wires(1, sides, sizes, prices, ORDER_TYPE)
+
+        assert per_order() == ladder()
+        action = order_wires_to_order_action(ladder())
+        build_per_order = best_of(per_order, args.rounds)
+        build_ladder = best_of(ladder, args.rounds)
+        sign = best_of(lambda: sign_l1_action(WALLET, action, None, 0, None, True), max(3, args.rounds // 4))
+        print(
+            f"{n:5d} orders  build: per order {build_per_order * 1e3:7.2f} ms  ladder {build_ladder * 1e3:7.2f} ms"
+            f" ({build_per_order / build_ladder:.1f}x)   sign {sign * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
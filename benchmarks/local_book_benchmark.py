@@ -0,0 +1,61 @@
+"""Throughput of LocalBook updates and queries.
+
+Feeds synthetic 20-level l2Book messages (the depth the websocket channel publishes) through LocalBook.on_message,
+then times the query methods a quoting loop typically calls after each update.
+
+    python benchmarks/local_book_benchmark.py --messages 50000
+"""
+
+import argparse
+import random
+import time
+
+from hyperliquid.utils.local_book import LocalBook
+
+LEVELS = 20
+
+
+def make_messages(n_messages):
+    rng = random.Random(0)
+    messages = []
+    for t in range(n_messages):
+        mid = 2000 + rng.uniform(-5, 5)
+        bids = [
+            {"px": f"{mid - 0.5 - i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)
+        ]
+        asks = [
+            {"px": f"{mid + 0.5 + i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)
+        ]
+        messages.append({"channel": "l2Book", "data": {"coin": "ETH", "time": t, "levels": (bids, asks)}})
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark LocalBook update and query throughput")
+    parser.add_argument("--messages", type=int, default=50000)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    book = LocalBook("ETH")
+
+    start = time.perf_counter()
+    for msg in messages:
+        book.on_message(msg)
+    update_elapsed = time.perf_counter() - start
+
+    book = LocalBook("ETH")
+    start = time.perf_counter()
+    for msg in messages:
+        book.on_message(msg)
+        book.best_bid()
+        book.best_ask()
+        book.cumulative_depth("A", 50_000)
+        book.vwap("B", 10)
+    query_elapsed = time.perf_counter() - start
+
+    print(f"updates:                  {args.messages / update_elapsed:12.0f} msg/s")
+    print(f"updates + 4 queries each: {args.messages / query_elapsed:12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
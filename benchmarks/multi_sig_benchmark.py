@@ -0,0 +1,82 @@
+"""Time to collect multi-sig signatures on an order action from N local wallets.
+
+Compares calling sign_multi_sig_l1_action_payload once per wallet (the envelope is hashed again for every
+signature) against sign_multi_sig_l1_action_payloads signing serially after hashing once, with a process pool created for the call,
+and with a ProcessPoolExecutor reused across calls. The speed-up of the pools is bounded by the number of CPUs.
+
+    python benchmarks/multi_sig_benchmark.py --signers 3 10 30
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import eth_account
+
+from hyperliquid.utils.signing import (
+    action_hash,
+    l1_signable_message,
+    sign_multi_sig_l1_action_payload,
+    sign_multi_sig_l1_action_payloads,
+    sign_signable_message,
+)
+
+MULTI_SIG_USER = "0x0000000000000000000000000000000000000005"
+ACTION = {
+    "type": "order",
+    "orders": [{"a": 4, "b": True, "p": "1100", "s": "0.2", "r": False, "t": {"limit": {"tif": "Gtc"}}}],
+    "grouping": "na",
+}
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def hash_once_serial(wallets, sign_args):
+    action, is_mainnet, vault_address, timestamp, expires_after, multi_sig_user, outer_signer = sign_args
+    envelope = [multi_sig_user.lower(), outer_signer.lower(), action]
+    message = l1_signable_message(action_hash(envelope, vault_address, timestamp, expires_after), is_mainnet)
+    return [sign_signable_message(wallet, message) for wallet in wallets]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark multi-sig signature collection")
+    parser.add_argument("--signers", type=int, nargs="+", default=[3, 10, 30])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.workers} pool workers")
+    with ProcessPoolExecutor(args.workers) as executor:
+        # start the workers before timing
+        list(executor.map(abs, range(args.workers)))
+        for n in args.signers:
+            wallets = [eth_account.Account.from_key(i.to_bytes(32, "big")) for i in range(1, n + 1)]
+            sign_args = (ACTION, False, None, 1677777606040, None, MULTI_SIG_USER, wallets[0].address)
+
+            def per_wallet():
+                return [sign_multi_sig_l1_action_payload(wallet, *sign_args) for wallet in wallets]
+
+            expected = per_wallet()
+            assert sign_multi_sig_l1_action_payloads(wallets, *sign_args, executor=executor) == expected
+            assert hash_once_serial(wallets, sign_args) == expected
+            timings = {
+                "per wallet": best_of(per_wallet, args.rounds),
+                "hash once, serial": best_of(lambda: hash_once_serial(wallets, sign_args), args.rounds),
+                "pool per call": best_of(lambda: sign_multi_sig_l1_action_payloads(wallets, *sign_args), 1),
+                "reused pool": best_of(
+                    lambda: sign_multi_sig_l1_action_payloads(wallets, *sign_args, executor=executor), args.rounds
+                ),
+            }
+            print(f"{n:3d} signers  " + "  ".join(f"{name} {t * 1e3:7.1f} ms" for name, t in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
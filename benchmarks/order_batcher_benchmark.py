@@ -0,0 +1,73 @@
+"""Wall time for a burst of single orders and cancels with and without OrderBatcher.
+
+A strategy thread emits --orders orders and as many cancels as fast as it can, each through Exchange.order /
+Exchange.cancel (one signed action and one round trip per call) or through OrderBatcher, which coalesces them into
+bulk actions. /exchange is simulated with a sleep of --latency-ms per request, signing is real. Reports the time
+until every call has its status and the number of actions sent.
+
+    python benchmarks/order_batcher_benchmark.py --orders 40 --latency-ms 20
+"""
+
+import argparse
+import time
+
+import eth_account
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.order_batcher import OrderBatcher
+from hyperliquid.utils.signing import OrderType
+from hyperliquid.utils.types import Any, List, Meta
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+GTC: OrderType = {"limit": {"tif": "Gtc"}}
+
+
+class SimulatedExchange(Exchange):
+    """Exchange whose /exchange requests sleep for the given latency and are recorded in actions."""
+
+    def __init__(self, latency):
+        meta: Meta = {"universe": [{"name": "ETH", "szDecimals": 4}]}
+        super().__init__(WALLET, info=Info(skip_ws=True, meta=meta, spot_meta={"universe": [], "tokens": []}))
+        self.latency = latency
+        self.actions: List[Any] = []
+
+    def _post_action(self, action, signature, nonce):
+        time.sleep(self.latency)
+        self.actions.append(action)
+        count = len(action.get("orders", action.get("cancels", [])))
+        statuses = ["success"] * count if action["type"] == "cancel" else [{"resting": {"oid": 1}}] * count
+        return {"status": "ok", "response": {"type": action["type"], "data": {"statuses": statuses}}}
+
+
+def run_direct(exchange, n_orders):
+    for i in range(n_orders):
+        exchange.order("ETH", True, 0.1, 1900 + i, GTC)
+    for oid in range(n_orders):
+        exchange.cancel("ETH", oid)
+
+
+def run_batched(exchange, n_orders):
+    with OrderBatcher(exchange, window=0.001) as batcher:
+        futures = [batcher.order("ETH", True, 0.1, 1900 + i, GTC) for i in range(n_orders)]
+        futures += [batcher.cancel("ETH", oid) for oid in range(n_orders)]
+        for future in futures:
+            future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark micro-batching of order and cancel calls")
+    parser.add_argument("--orders", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    for name, target in (("one by one", run_direct), ("batched", run_batched)):
+        exchange = SimulatedExchange(args.latency_ms / 1e3)
+        start = time.perf_counter()
+        target(exchange, args.orders)
+        elapsed = time.perf_counter() - start
+        print(f"{name:11} {elapsed * 1e3:8.1f} ms  {len(exchange.actions):4d} actions for {2 * args.orders} calls")
+
+
+if __name__ == "__main__":
+    main()
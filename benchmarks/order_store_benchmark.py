@@ -0,0 +1,61 @@
+"""Cost of finding an order by cloid and of listing a coin's open orders, scanning an open_orders result vs OrderStore.
+
+Scanning walks the list returned by Info.frontend_open_orders, as a strategy polling it would, OrderStore answers from
+its oid, cloid and coin indexes. Neither includes the request that polling needs before each scan. --orders open orders
+spread over --coins coins, average over --lookups lookups.
+
+    python benchmarks/order_store_benchmark.py --orders 500 --coins 20 --lookups 20000
+"""
+
+import argparse
+import random
+import time
+
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.types import Cloid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark OrderStore lookups")
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--coins", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    open_orders = [
+        {
+            "coin": f"COIN{oid % args.coins}",
+            "side": "B",
+            "limitPx": "100.0",
+            "sz": "1.0",
+            "origSz": "1.0",
+            "oid": oid,
+            "cloid": Cloid.from_int(oid).to_raw(),
+        }
+        for oid in range(args.orders)
+    ]
+    store = OrderStore()
+    store.reconcile(open_orders, 0)
+    rng = random.Random(0)
+    cloids = [open_orders[rng.randrange(args.orders)]["cloid"] for _ in range(args.lookups)]
+    coins = [f"COIN{rng.randrange(args.coins)}" for _ in range(args.lookups)]
+
+    def scan():
+        for cloid, coin in zip(cloids, coins):
+            next(order for order in open_orders if order["cloid"] == cloid)
+            [order for order in open_orders if order["coin"] == coin]
+
+    def indexed():
+        for cloid, coin in zip(cloids, coins):
+            store.get_by_cloid(cloid)
+            store.live_orders(coin)
+
+    for name, target in (("scan open_orders", scan), ("OrderStore", indexed)):
+        start = time.perf_counter()
+        target()
+        elapsed = time.perf_counter() - start
+        print(f"{name:17} {elapsed / args.lookups * 1e6:8.2f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Wall time for a sequence of signed actions with Exchange and PipelinedExchange.
+
+Places --actions single orders. /exchange is simulated with a sleep of --latency-ms per request, signing is real.
+Exchange signs and then waits for each response, PipelinedExchange signs the next action while up to --in-flight
+earlier ones are being sent.
+
+    python benchmarks/pipelined_exchange_benchmark.py --actions 50 --latency-ms 20 --in-flight 4
+"""
+
+import argparse
+import time
+
+import eth_account
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.pipelined_exchange import PipelinedExchange
+from hyperliquid.utils.signing import OrderType
+from hyperliquid.utils.types import Any
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+GTC: OrderType = {"limit": {"tif": "Gtc"}}
+
+
+class SimulatedLatency:
+    """Answers every request with ok after sleeping for latency seconds."""
+
+    latency = 0.0
+
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        time.sleep(self.latency)
+        return {"status": "ok"}
+
+
+class SimulatedExchange(SimulatedLatency, Exchange):
+    pass
+
+
+class SimulatedPipelinedExchange(SimulatedLatency, PipelinedExchange):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark pipelined exchange submission")
+    parser.add_argument("--actions", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--in-flight", type=int, default=4)
+    args = parser.parse_args()
+
+    info = Info(
+        skip_ws=True, meta={"universe": [{"name": "ETH", "szDecimals": 4}]}, spot_meta={"universe": [], "tokens": []}
+    )
+    exchanges = (
+        ("sequential", SimulatedExchange(WALLET, info=info)),
+        ("pipelined", SimulatedPipelinedExchange(WALLET, info=info, max_in_flight=args.in_flight)),
+    )
+    for name, exchange in exchanges:
+        exchange.latency = args.latency_ms / 1e3
+        start = time.perf_counter()
+        results = [exchange.order("ETH", True, 0.1, 1900 + i, GTC) for i in range(args.actions)]
+        if isinstance(exchange, PipelinedExchange):
+            results = [future.result() for future in results]
+            exchange.close()
+        elapsed = time.perf_counter() - start
+        print(f"{name:10} {elapsed * 1e3:8.1f} ms  {args.actions / elapsed:7.1f} actions/s")
+
+
+if __name__ == "__main__":
+    main()
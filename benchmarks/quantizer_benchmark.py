@@ -0,0 +1,55 @@
+"""Cost of rounding order prices to the exchange's tick sizes.
+
+Compares the format based rounding previously done by Exchange._slippage_price (5 significant figures via "%.5g",
+then round to the decimal cap) with Quantizer.round_px, and with Quantizer.round_px_array over a whole ladder.
+
+    python benchmarks/quantizer_benchmark.py --orders 1000
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from hyperliquid.utils.quantizer import Quantizer
+
+ASSET = 1
+SZ_DECIMALS = 4
+
+
+def format_round_px(px):
+    return round(float(f"{px:.5g}"), 6 - SZ_DECIMALS)
+
+
+def best_of(fn, rounds=20):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark price quantization")
+    parser.add_argument("--orders", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    prices = [rng.uniform(1000, 3000) for _ in range(args.orders)]
+    array = np.array(prices)
+    quantizer = Quantizer({ASSET: SZ_DECIMALS})
+    assert quantizer.round_px_array(ASSET, array).tolist() == [quantizer.round_px(ASSET, px) for px in prices]
+
+    previous = best_of(lambda: [format_round_px(px) for px in prices])
+    scalar = best_of(lambda: [quantizer.round_px(ASSET, px) for px in prices])
+    vectorized = best_of(lambda: quantizer.round_px_array(ASSET, array))
+    n = args.orders
+    print(f"format based  {previous / n * 1e9:8.0f} ns/price")
+    print(f"round_px      {scalar / n * 1e9:8.0f} ns/price")
+    print(f"round_px_array{vectorized / n * 1e9:8.0f} ns/price  ({previous / vectorized:.0f}x vs format based)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Time and peak memory of scanning an lz4 replica cmds file for tokenDelegate actions.
+
+Writes a synthetic replica cmds file of the requested decompressed size (pass e.g. --size-mb 4096 for a multi-GB
+file), then compares in separate processes the approach of the token delegate example before the streaming reader
+(decompress the whole file to disk, readlines() and parse the matching lines) against read_replica_signed_actions.
+
+    python benchmarks/replica_cmds_benchmark.py --size-mb 512 --dir /tmp
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import time
+
+import lz4.frame
+
+from hyperliquid.utils.replica_cmds import read_replica_signed_actions
+from hyperliquid.utils.types import Any, Dict, Tuple
+
+
+def write_replica_file(path, size_mb, delegate_every):
+    rng = random.Random(0)
+    target = size_mb * 1024 * 1024
+    written = 0
+    height = 0
+    with lz4.frame.open(path, "wb") as f:
+        while written < target:
+            height += 1
+            signed_actions = []
+            for i in range(rng.randrange(20, 60)):
+                action_type = "tokenDelegate" if (height * 64 + i) % delegate_every == 0 else "order"
+                action: Dict[str, Any] = {
+                    "type": action_type,
+                    "orders": [{"a": 4, "b": True, "p": "1900.1", "s": "0.1", "r": False}],
+                }
+                if action_type == "tokenDelegate":
+                    action = {"type": action_type, "validator": "0x" + "5a" * 20, "wei": 10**8, "isUndelegate": False}
+                signature = {"r": "0x" + "1" * 64, "s": "0x" + "2" * 64, "v": 27}
+                signed_actions.append({"action": action, "signature": signature, "nonce": height * 1000 + i})
+            block = {
+                "abci_block": {
+                    "time": "2025-01-01T00:00:00.000000",
+                    "round": height,
+                    "signed_action_bundles": [["0x" + "ab" * 32, {"signed_actions": signed_actions}]],
+                },
+                "resps": None,
+            }
+            line = (json.dumps(block, separators=(",", ":")) + "\n").encode()
+            f.write(line)
+            written += len(line)
+    return height
+
+
+def decompress_and_readlines(path, out_path):
+    with open(path, "rb") as f_in:
+        decompressed_data = lz4.frame.decompress(f_in.read())
+    with open(out_path, "wb") as f_out:
+        f_out.write(decompressed_data)
+    del decompressed_data
+    count = 0
+    with open(out_path) as f:
+        lines = f.readlines()
+    for line in lines:
+        if "tokenDelegate" not in line:
+            continue
+        for bundle in json.loads(line)["abci_block"]["signed_action_bundles"]:
+            for signed_action in bundle[1]["signed_actions"]:
+                count += signed_action["action"]["type"] == "tokenDelegate"
+    os.remove(out_path)
+    return count
+
+
+def streaming(path, _out_path):
+    return sum(1 for _ in read_replica_signed_actions(path, ["tokenDelegate"]))
+
+
+def run(target, path, out_path, results):
+    start = time.perf_counter()
+    count = target(path, out_path)
+    elapsed = time.perf_counter() - start
+    results.put((count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark streaming replica cmds reading")
+    parser.add_argument("--size-mb", type=int, default=512, help="decompressed size of the synthetic file")
+    parser.add_argument("--dir", default="/tmp")
+    parser.add_argument("--delegate-every", type=int, default=5000, help="one tokenDelegate per this many actions")
+    args = parser.parse_args()
+
+    path = os.path.join(args.dir, "replica_cmds_benchmark.lz4")
+    start = time.perf_counter()
+    blocks = write_replica_file(path, args.size_mb, args.delegate_every)
+    print(
+        f"wrote {blocks} blocks, {args.size_mb} MB decompressed, {os.path.getsize(path) / 2**20:.0f} MB compressed"
+        f" in {time.perf_counter() - start:.1f} s"
+    )
+    try:
+        counts = []
+        for name, target in (("decompress + readlines", decompress_and_readlines), ("streaming", streaming)):
+            results: "multiprocessing.Queue[Tuple[int, float, float]]" = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run, args=(target, path, path + ".out", results))
+            process.start()
+            count, elapsed, peak_mb = results.get()
+            process.join()
+            counts.append(count)
+            print(f"{name:24} {elapsed:7.2f} s  {args.size_mb / elapsed:7.1f} MB/s  peak RSS {peak_mb:8.1f} MB")
+        assert counts[0] == counts[1]
+        print(f"{counts[0]} tokenDelegate actions")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
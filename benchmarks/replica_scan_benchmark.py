@@ -0,0 +1,92 @@
+"""Time to aggregate the actions of a range of replica cmds files, sequentially and across a process pool.
+
+Writes --files synthetic lz4 replica cmds files named like the real ones (one per 10000 blocks), then folds the
+count of each action type per file with scan_replica_signed_actions, once with a single worker and once with
+--workers processes. The speed-up is bounded by the number of CPUs.
+
+    python benchmarks/replica_scan_benchmark.py --files 8 --size-mb 64 --workers 8
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import lz4.frame
+
+from hyperliquid.utils.replica_cmds import REPLICA_CMDS_BATCH_SIZE, replica_cmds_paths, scan_replica_signed_actions
+
+ACTION_TYPES = ["order", "cancel", "batchModify", "tokenDelegate"]
+
+
+def write_replica_file(path, size_mb, seed):
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    with lz4.frame.open(path, "wb") as f:
+        while written < target:
+            signed_actions = [
+                {
+                    "action": {"type": rng.choice(ACTION_TYPES), "orders": [{"a": rng.randrange(100), "p": "1900.1"}]},
+                    "signature": {"r": "0x" + "1" * 64, "s": "0x" + "2" * 64, "v": 27},
+                    "nonce": rng.randrange(10**13),
+                }
+                for _ in range(rng.randrange(20, 60))
+            ]
+            block = {
+                "abci_block": {
+                    "round": written,
+                    "signed_action_bundles": [["0x00", {"signed_actions": signed_actions}]],
+                }
+            }
+            line = (json.dumps(block, separators=(",", ":")) + "\n").encode()
+            f.write(line)
+            written += len(line)
+
+
+def count_type(counts, signed_action):
+    action_type = signed_action["action"]["type"]
+    counts[action_type] = counts.get(action_type, 0) + 1
+    return counts
+
+
+def add_counts(counts, later):
+    for action_type, count in later.items():
+        counts[action_type] = counts.get(action_type, 0) + count
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark parallel replica cmds scanning")
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-mb", type=int, default=32, help="decompressed size of each file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        for i in range(args.files):
+            write_replica_file(os.path.join(data_dir, f"{i * REPLICA_CMDS_BATCH_SIZE + 1}.lz4"), args.size_mb, i)
+        paths = replica_cmds_paths(data_dir, 1, args.files * REPLICA_CMDS_BATCH_SIZE + 1)
+        results = []
+        for workers in (1, args.workers):
+            start = time.perf_counter()
+            with ProcessPoolExecutor(workers) as executor:
+                results.append(scan_replica_signed_actions(paths, count_type, dict, add_counts, executor=executor))
+            elapsed = time.perf_counter() - start
+            total_mb = args.files * args.size_mb
+            print(
+                f"{workers:3d} workers  {elapsed:7.2f} s  {total_mb / elapsed:7.1f} MB/s  {sum(results[-1].values())} actions"
+            )
+        assert results[0] == results[1]
+        print(f"{os.cpu_count()} CPUs")
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
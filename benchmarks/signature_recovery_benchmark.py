@@ -0,0 +1,117 @@
+"""Throughput of recovering the signers of tokenDelegate actions, as done when auditing replica cmds.
+
+Compares recover_user_from_user_signed_action per action (encode_typed_data and recovery for each) against
+hashing with the cached type and domain hashes of recover_user_signed_action_signers, serially and with the
+process pool of recover_user_signed_action_signers.
+Recovery itself dominates, so the pool scales with the number of CPUs and eth_keys is much faster with coincurve.
+
+    python benchmarks/signature_recovery_benchmark.py --actions 200 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import eth_account
+import eth_keys
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+from hyperliquid.utils.signature_recovery import recover_user_signed_action_signers, user_signed_signable_message
+from hyperliquid.utils.signing import (
+    TOKEN_DELEGATE_TYPES,
+    recover_user_from_user_signed_action,
+    sign_token_delegate_action,
+    user_signed_payload,
+)
+
+PRIMARY_TYPE = "HyperliquidTransaction:TokenDelegate"
+
+
+def make_signed_actions(n_actions):
+    wallets = [eth_account.Account.from_key(i.to_bytes(32, "big")) for i in range(1, 11)]
+    signed_actions = []
+    for i in range(n_actions):
+        action = {
+            "type": "tokenDelegate",
+            "validator": "0x5ac99df645f3414876c816caa18b2d234024b487",
+            "wei": 100_000_000 * (i + 1),
+            "isUndelegate": i % 2 == 1,
+            "nonce": 1700000000000 + i,
+        }
+        signature = sign_token_delegate_action(wallets[i % len(wallets)], action, True)
+        signed_actions.append((action, signature))
+    return signed_actions
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark batch signature recovery")
+    parser.add_argument("--actions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+
+    signed_actions = make_signed_actions(args.actions)
+    print(f"{os.cpu_count()} CPUs, eth_keys backend {type(eth_keys.KeyAPI().backend).__name__}")
+
+    expected, per_call = timed(
+        lambda: [
+            recover_user_from_user_signed_action(dict(action), signature, TOKEN_DELEGATE_TYPES, PRIMARY_TYPE, True)
+            for action, signature in signed_actions
+        ]
+    )
+    serial, batch_serial = timed(
+        lambda: [
+            Account.recover_message(
+                user_signed_signable_message(action, TOKEN_DELEGATE_TYPES, PRIMARY_TYPE, True),
+                vrs=(signature["v"], signature["r"], signature["s"]),
+            )
+            for action, signature in signed_actions
+        ]
+    )
+    with ProcessPoolExecutor(args.workers) as executor:
+        list(executor.map(abs, range(args.workers)))
+        pooled, batch_pool = timed(
+            lambda: list(
+                recover_user_signed_action_signers(
+                    signed_actions,
+                    TOKEN_DELEGATE_TYPES,
+                    PRIMARY_TYPE,
+                    True,
+                    executor=executor,
+                    chunk_size=args.chunk_size,
+                )
+            )
+        )
+    assert serial == expected and pooled == expected
+    _, encode = timed(
+        lambda: [
+            encode_typed_data(
+                full_message=user_signed_payload(
+                    PRIMARY_TYPE, TOKEN_DELEGATE_TYPES, dict(action, hyperliquidChain="Mainnet")
+                )
+            )
+            for action, _ in signed_actions
+        ]
+    )
+    _, cached = timed(
+        lambda: [
+            user_signed_signable_message(action, TOKEN_DELEGATE_TYPES, PRIMARY_TYPE, True)
+            for action, _ in signed_actions
+        ]
+    )
+    n = args.actions
+    print(f"typed data hashing: encode_typed_data {encode / n * 1e6:7.1f} us  cached {cached / n * 1e6:7.1f} us")
+    for name, elapsed in (("per call", per_call), ("cached hashing", batch_serial), ("batch, pool", batch_pool)):
+        print(f"{name:14} {n / elapsed:8.1f} actions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Microbenchmark of L1 action signing.
+
+Compares the generic EIP-712 path (building the l1_payload dict and running encode_typed_data for every action)
+against the precomputed domain separator / Agent type hash used by sign_l1_action, both for the typed data hashing
+step alone and for the full sign call.
+
+    python benchmarks/signing_benchmark.py --iterations 2000
+"""
+
+import argparse
+import time
+
+import eth_account
+from eth_account.messages import encode_typed_data
+
+from hyperliquid.utils.signing import (
+    action_hash,
+    construct_phantom_agent,
+    l1_payload,
+    l1_signable_message,
+    order_request_to_order_wire,
+    order_wires_to_order_action,
+    sign_inner,
+    sign_l1_action,
+)
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+ORDER_ACTION = order_wires_to_order_action(
+    [
+        order_request_to_order_wire(
+            {
+                "coin": "ETH",
+                "is_buy": True,
+                "sz": 0.0147,
+                "limit_px": 1670.1,
+                "reduce_only": False,
+                "order_type": {"limit": {"tif": "Gtc"}},
+            },
+            4,
+        )
+    ]
+)
+
+
+def sign_l1_action_generic(wallet, action, active_pool, nonce, expires_after, is_mainnet):
+    hash = action_hash(action, active_pool, nonce, expires_after)
+    return sign_inner(wallet, l1_payload(construct_phantom_agent(hash, is_mainnet)))
+
+
+def timeit(fn, iterations):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark L1 action signing")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    connection_id = action_hash(ORDER_ACTION, None, 0, None)
+    assert l1_signable_message(connection_id, True) == encode_typed_data(
+        full_message=l1_payload(construct_phantom_agent(connection_id, True))
+    )
+    assert sign_l1_action(WALLET, ORDER_ACTION, None, 0, None, True) == sign_l1_action_generic(
+        WALLET, ORDER_ACTION, None, 0, None, True
+    )
+
+    generic_hash = timeit(
+        lambda _: encode_typed_data(full_message=l1_payload(construct_phantom_agent(connection_id, True))),
+        args.iterations,
+    )
+    fast_hash = timeit(lambda _: l1_signable_message(connection_id, True), args.iterations)
+    generic_sign = timeit(lambda i: sign_l1_action_generic(WALLET, ORDER_ACTION, None, i, None, True), args.iterations)
+    fast_sign = timeit(lambda i: sign_l1_action(WALLET, ORDER_ACTION, None, i, None, True), args.iterations)
+
+    print(f"typed data hashing: generic {generic_hash:8.1f} us  precomputed {fast_hash:8.1f} us")
+    print(f"sign_l1_action:     generic {generic_sign:8.1f} us  precomputed {fast_sign:8.1f} us")
+    print(f"speed-up: hashing {generic_hash / fast_hash:.1f}x, end to end {generic_sign / fast_sign:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
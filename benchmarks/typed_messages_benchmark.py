@@ -0,0 +1,105 @@
+"""Decoding cost of market data websocket messages as dicts of strings versus typed msgspec Structs.
+
+For synthetic 20-level l2Book and 10-trade trades messages, times decoding followed by the work every consumer has to
+do with the dict form anyway (reading each level's price and size as floats), and measures the memory held by a
+batch of decoded messages with tracemalloc.
+
+    python benchmarks/typed_messages_benchmark.py --messages 20000
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from hyperliquid.utils.json_codec import get_json_codec
+from hyperliquid.utils.typed_messages import TypedMessageDecoder
+
+LEVELS = 20
+TRADES = 10
+
+
+def make_messages(n_messages):
+    rng = random.Random(0)
+    books, trades = [], []
+    for t in range(n_messages):
+        mid = 2000 + rng.uniform(-5, 5)
+        levels = [
+            [{"px": f"{mid - 0.5 - i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)],
+            [{"px": f"{mid + 0.5 + i * 0.1:.1f}", "sz": f"{rng.uniform(0.1, 20):.4f}", "n": 1} for i in range(LEVELS)],
+        ]
+        books.append(json.dumps({"channel": "l2Book", "data": {"coin": "ETH", "time": t, "levels": levels}}))
+        batch = [
+            {
+                "coin": "ETH",
+                "side": rng.choice("AB"),
+                "px": f"{mid:.1f}",
+                "sz": f"{rng.uniform(0.01, 5):.4f}",
+                "time": t,
+                "hash": "0x" + "0" * 64,
+                "tid": t * TRADES + i,
+                "users": ["0x" + "1" * 40, "0x" + "2" * 40],
+            }
+            for i in range(TRADES)
+        ]
+        trades.append(json.dumps({"channel": "trades", "data": batch}))
+    return books, trades
+
+
+def book_notional_dict(msg):
+    bids, asks = msg["data"]["levels"]
+    return sum(float(level["px"]) * float(level["sz"]) for level in bids + asks)
+
+
+def book_notional_typed(msg):
+    bids, asks = msg.data.levels
+    return sum(level.px * level.sz for level in bids + asks)
+
+
+def trades_volume_dict(msg):
+    return sum(float(trade["sz"]) for trade in msg["data"])
+
+
+def trades_volume_typed(msg):
+    return sum(trade.sz for trade in msg.data)
+
+
+def rate(messages, decode, consume):
+    start = time.perf_counter()
+    for message in messages:
+        consume(decode(message))
+    return len(messages) / (time.perf_counter() - start)
+
+
+def retained_kb(messages, decode):
+    tracemalloc.start()
+    decoded = [decode(message) for message in messages]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return size / 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark typed websocket message decoding")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--retained", type=int, default=1000, help="messages held when measuring memory")
+    args = parser.parse_args()
+
+    books, trades = make_messages(args.messages)
+    typed = TypedMessageDecoder().decode
+    decoders = [("json", json.loads), ("orjson", get_json_codec("orjson").loads), ("typed", typed)]
+    for channel, messages, consumers in (
+        ("l2Book", books, (book_notional_dict, book_notional_typed)),
+        ("trades", trades, (trades_volume_dict, trades_volume_typed)),
+    ):
+        for name, decode in decoders:
+            consume = consumers[1] if decode is typed else consumers[0]
+            msgs_per_s = rate(messages, decode, consume)
+            kb = retained_kb(messages[: args.retained], decode)
+            print(f"{channel:7} {name:7} {msgs_per_s:10.0f} msg/s   {kb:8.0f} kB for {args.retained} messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Throughput of websocket message routing through WebsocketManager.on_message.
+
+Subscribes a WebsocketManager with a no-op socket to allMids plus l2Book, trades and bbo for a set of coins, then
+feeds it pre-encoded messages in a realistic mix, and separately times the identifier lookup alone on decoded
+messages. Both are repeated with the if/elif identifier functions the manager used before the dispatch tables.
+
+    python benchmarks/websocket_routing_benchmark.py --coins 30 --messages 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from collections import defaultdict
+
+import websocket
+
+from hyperliquid import websocket_manager
+from hyperliquid.utils.types import Any, Dict
+from hyperliquid.websocket_manager import WebsocketManager
+
+
+def legacy_subscription_to_identifier(subscription):
+    if subscription["type"] == "allMids":
+        return "allMids"
+    elif subscription["type"] == "l2Book":
+        return f'l2Book:{subscription["coin"].lower()}'
+    elif subscription["type"] == "trades":
+        return f'trades:{subscription["coin"].lower()}'
+    elif subscription["type"] == "userEvents":
+        return "userEvents"
+    elif subscription["type"] == "userFills":
+        return f'userFills:{subscription["user"].lower()}'
+    elif subscription["type"] == "candle":
+        return f'candle:{subscription["coin"].lower()},{subscription["interval"]}'
+    elif subscription["type"] == "orderUpdates":
+        return "orderUpdates"
+    elif subscription["type"] == "userFundings":
+        return f'userFundings:{subscription["user"].lower()}'
+    elif subscription["type"] == "userNonFundingLedgerUpdates":
+        return f'userNonFundingLedgerUpdates:{subscription["user"].lower()}'
+    elif subscription["type"] == "webData2":
+        return f'webData2:{subscription["user"].lower()}'
+    elif subscription["type"] == "bbo":
+        return f'bbo:{subscription["coin"].lower()}'
+    elif subscription["type"] == "activeAssetCtx":
+        return f'activeAssetCtx:{subscription["coin"].lower()}'
+
+
+def legacy_ws_msg_to_identifier(ws_msg):
+    if ws_msg["channel"] == "pong":
+        return "pong"
+    elif ws_msg["channel"] == "allMids":
+        return "allMids"
+    elif ws_msg["channel"] == "l2Book":
+        return f'l2Book:{ws_msg["data"]["coin"].lower()}'
+    elif ws_msg["channel"] == "trades":
+        trades = ws_msg["data"]
+        if len(trades) == 0:
+            return None
+        else:
+            return f'trades:{trades[0]["coin"].lower()}'
+    elif ws_msg["channel"] == "user":
+        return "userEvents"
+    elif ws_msg["channel"] == "userFills":
+        return f'userFills:{ws_msg["data"]["user"].lower()}'
+    elif ws_msg["channel"] == "candle":
+        return f'candle:{ws_msg["data"]["s"].lower()},{ws_msg["data"]["i"]}'
+    elif ws_msg["channel"] == "orderUpdates":
+        return "orderUpdates"
+    elif ws_msg["channel"] == "userFundings":
+        return f'userFundings:{ws_msg["data"]["user"].lower()}'
+    elif ws_msg["channel"] == "userNonFundingLedgerUpdates":
+        return f'userNonFundingLedgerUpdates:{ws_msg["data"]["user"].lower()}'
+    elif ws_msg["channel"] == "webData2":
+        return f'webData2:{ws_msg["data"]["user"].lower()}'
+    elif ws_msg["channel"] == "bbo":
+        return f'bbo:{ws_msg["data"]["coin"].lower()}'
+    elif ws_msg["channel"] == "activeAssetCtx" or ws_msg["channel"] == "activeSpotAssetCtx":
+        return f'activeAssetCtx:{ws_msg["data"]["coin"].lower()}'
+
+
+def make_messages(coins, n_messages):
+    rng = random.Random(0)
+    mids = {coin: "1000.0" for coin in coins}
+    messages = []
+    for t in range(n_messages):
+        coin = rng.choice(coins)
+        kind = rng.random()
+        msg: Dict[str, Any]
+        if kind < 0.05:
+            msg = {"channel": "allMids", "data": {"mids": mids}}
+        elif kind < 0.6:
+            level = {"px": "1000.0", "sz": "1.0", "n": 1}
+            msg = {"channel": "l2Book", "data": {"coin": coin, "time": t, "levels": [[level], [level]]}}
+        elif kind < 0.8:
+            trade = {"coin": coin, "side": "B", "px": "1000.0", "sz": "0.1", "time": t, "hash": "0x0", "tid": t}
+            msg = {"channel": "trades", "data": [trade]}
+        else:
+            level = {"px": "1000.0", "sz": "1.0", "n": 1}
+            msg = {"channel": "bbo", "data": {"coin": coin, "time": t, "bbo": [level, level]}}
+        messages.append(json.dumps(msg))
+    return messages
+
+
+class NullWebsocket(websocket.WebSocketApp):
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        pass
+
+
+def make_manager(coins):
+    manager = WebsocketManager("http://localhost")
+    manager.ws = NullWebsocket(manager.ws_url)
+    manager.on_open(None)
+    manager.subscribe({"type": "allMids"}, lambda _: None)
+    for coin in coins:
+        manager.subscribe({"type": "l2Book", "coin": coin}, lambda _: None)
+        manager.subscribe({"type": "trades", "coin": coin}, lambda _: None)
+        manager.subscribe({"type": "bbo", "coin": coin}, lambda _: None)
+    return manager
+
+
+def on_message_rate(coins, messages, subscription_to_identifier, ws_msg_to_identifier):
+    websocket_manager.subscription_to_identifier = subscription_to_identifier
+    websocket_manager.ws_msg_to_identifier = ws_msg_to_identifier
+    manager = make_manager(coins)
+    start = time.perf_counter()
+    for message in messages:
+        manager.on_message(None, message)
+    return len(messages) / (time.perf_counter() - start)
+
+
+def identifier_rate(decoded, ws_msg_to_identifier):
+    start = time.perf_counter()
+    for ws_msg in decoded:
+        ws_msg_to_identifier(ws_msg)
+    return len(decoded) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark websocket message routing throughput")
+    parser.add_argument("--coins", type=int, default=30)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=5, help="the best of this many interleaved runs is reported")
+    args = parser.parse_args()
+
+    coins = [f"COIN{i}" for i in range(args.coins)]
+    messages = make_messages(coins, args.messages)
+    decoded = [json.loads(message) for message in messages]
+    legacy = (legacy_subscription_to_identifier, legacy_ws_msg_to_identifier)
+    dispatch = (websocket_manager.subscription_to_identifier, websocket_manager.ws_msg_to_identifier)
+
+    rates = defaultdict(list)
+    for _ in range(args.rounds):
+        for name, (subscription_to_identifier, ws_msg_to_identifier) in (
+            ("if/elif chain", legacy),
+            ("dispatch table", dispatch),
+        ):
+            rates[f"on_message, {name}"].append(
+                on_message_rate(coins, messages, subscription_to_identifier, ws_msg_to_identifier)
+            )
+            rates[f"identifier only, {name}"].append(identifier_rate(decoded, ws_msg_to_identifier))
+    for label, label_rates in rates.items():
+        print(f"{label + ':':34}{max(label_rates):12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
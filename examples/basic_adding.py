@@ -82,6 +82,8 @@ class BasicAdder:
             "B": {"type": "cancelled"},
         }
         self.recently_cancelled_oid_to_time: Dict[int, int] = {}
+        # Our orders, kept up to date from the orderUpdates and userFills channels
+        self.order_store = info.order_store(address)
 
         # Subscribe to updates
         self.subscribe_to_updates()
@@ -122,6 +124,12 @@ class BasicAdder:
 
         provide_state = self.provide_state[side]
 
+        if provide_state["type"] == "resting":
+            order = self.order_store.get(provide_state["oid"])
+            if order is not None and not order.is_live:
+                # The order was filled or cancelled, replace it
+                provide_state = self.provide_state[side] = {"type": "cancelled"}
+
         if provide_state["type"] == "resting":
             self.maybe_cancel_order(side, provide_state, ideal_price, ideal_distance)
         elif provide_state["type"] == "in_flight_order":
@@ -175,16 +183,14 @@ class BasicAdder:
             with open("fills", "a+") as f:
                 f.write(json.dumps(user_events["data"]["fills"]) + "\n")
         # Set the position to None so that we don't place more orders without knowing our position
-        # You might want to also update provide_state to account for the fill. This could help avoid sending an
-        # unneeded cancel or failing to send a new order to replace the filled order, but we skipped this logic
-        # to make the example simpler
+        # Orders that were filled are replaced in handle_order_placement, which reads their status from the order store
         self.position = None
 
     def poll(self) -> None:
         """Poll open orders and user positions periodically."""
         while True:
-            # Fetch open orders
-            open_orders = self.info.open_orders(self.exchange.wallet.address)
+            # Read open orders from the order store, which reconciles itself with the exchange every minute
+            open_orders = self.order_store.live_orders(COIN)
             print("open_orders", open_orders)
 
             # Collect valid order IDs (from recently cancelled orders and resting orders)
@@ -195,9 +201,9 @@ class BasicAdder:
 
             # Cancel any unknown orders
             for open_order in open_orders:
-                if open_order["coin"] == COIN and open_order["oid"] not in ok_oids:
-                    print("Cancelling unknown oid", open_order["oid"])
-                    self.exchange.cancel(open_order["coin"], open_order["oid"])
+                if open_order.oid not in ok_oids:
+                    print("Cancelling unknown oid", open_order.oid)
+                    self.exchange.cancel(open_order.coin, open_order.oid)
 
             # Clean up recently cancelled orders after a timeout
             current_time = get_timestamp_ms()
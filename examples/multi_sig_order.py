@@ -1,7 +1,7 @@
 import example_utils
 
 from hyperliquid.utils import constants
-from hyperliquid.utils.signing import get_timestamp_ms, sign_multi_sig_l1_action_payload
+from hyperliquid.utils.signing import get_timestamp_ms, sign_multi_sig_l1_action_payloads
 
 
 def main():
@@ -25,22 +25,20 @@ def main():
     }
 
     timestamp = get_timestamp_ms()
-    signatures = []
 
     # Collect signatures from each wallet in multi_sig_wallets. Each wallet must belong to a user.
-    for wallet in multi_sig_wallets:
-        # Sign the action with each wallet
-        signature = sign_multi_sig_l1_action_payload(
-            wallet,
-            action,
-            exchange.base_url == constants.MAINNET_API_URL,
-            None,
-            timestamp,
-            multi_sig_user,
-            address,
-            exchange.expires_after,
-        )
-        signatures.append(signature)
+    # The action is hashed once and signed per wallet, the signatures are in the order of the wallets. Pass
+    # executor=ProcessPoolExecutor() to sign with many wallets in parallel.
+    signatures = sign_multi_sig_l1_action_payloads(
+        multi_sig_wallets,
+        action,
+        exchange.base_url == constants.MAINNET_API_URL,
+        None,
+        timestamp,
+        exchange.expires_after,
+        multi_sig_user,
+        address,
+    )
 
     # Execute the multi-sig action with all collected signatures
     # This will only succeed if enough valid signatures are provided
@@ -24,27 +24,18 @@ def main():
     meta = info.meta()
     print(json.dumps(meta, indent=2))
 
-    # create a szDecimals map
-    sz_decimals = {}
-    for asset_info in meta["universe"]:
-        sz_decimals[asset_info["name"]] = asset_info["szDecimals"]
-
     # For demonstration purposes we'll start with a price and size that have too many digits
     sz = 12.345678
     px = 1.2345678
     coin = "OP"
-    max_decimals = 6  # change to 8 for spot
 
     # If you use these directly, the exchange will return an error, so we round them.
-    # First we check if price is greater than 100k in which case we just need to round to an integer
-    if px > 100_000:
-        px = round(px)
-    # If not we round px to 5 significant figures and max_decimals - szDecimals decimals
-    else:
-        px = round(float(f"{px:.5g}"), max_decimals - sz_decimals[coin])
-
-    # Next we round sz based on the sz_decimals map we created
-    sz = round(sz, sz_decimals[coin])
+    # exchange.quantizer applies the rules above using the szDecimals that Info loaded from the meta request.
+    # Prices above 100k are rounded to an integer, others to 5 significant figures and max_decimals - szDecimals
+    # decimals, sizes are rounded to szDecimals decimals.
+    asset = info.name_to_asset(coin)
+    px = exchange.quantizer.round_px(asset, px)
+    sz = exchange.quantizer.round_sz(asset, sz)
 
     print(f"placing order with px {px} and sz {sz}")
     order_result = exchange.order(coin, True, sz, px, {"limit": {"tif": "Gtc"}})
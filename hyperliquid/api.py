@@ -6,12 +6,39 @@ import requests
 
 from hyperliquid.utils.constants import MAINNET_API_URL
 from hyperliquid.utils.error import ClientError, ServerError
-from hyperliquid.utils.types import Any
+from hyperliquid.utils.json_codec import JsonCodec, get_json_codec
+from hyperliquid.utils.rate_limiter import RateLimiter, request_priority, request_weight, response_weight
+from hyperliquid.utils.types import Any, Optional, Union
+
+
+def _raise_for_status(status_code, text, headers):
+    if status_code < 400:
+        return
+    if 400 <= status_code < 500:
+        try:
+            err = json.loads(text)
+        except JSONDecodeError:
+            raise ClientError(status_code, None, text, None, headers)
+        if err is None:
+            raise ClientError(status_code, None, text, None, headers)
+        error_data = err.get("data")
+        raise ClientError(status_code, err["code"], err["msg"], headers, error_data)
+    raise ServerError(status_code, text)
 
 
 class API:
-    def __init__(self, base_url=None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.base_url = base_url or MAINNET_API_URL
+        # None uses the fastest installed JSON library, see get_json_codec
+        self.json_codec = get_json_codec(json_codec)
+        # When set, requests wait for their weight in this bucket, which should be shared by every client using the
+        # same IP, and are sent in priority order: cancels, then other exchange actions, then info requests
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
         self._logger = logging.getLogger(__name__)
@@ -19,24 +46,21 @@ class API:
     def post(self, url_path: str, payload: Any = None) -> Any:
         payload = payload or {}
         url = self.base_url + url_path
-        response = self.session.post(url, json=payload)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request_weight(url_path, payload), request_priority(url_path, payload))
+        response = self.session.post(url, data=self.json_codec.dumps(payload))
+        if response.status_code == 429 and self.rate_limiter is not None:
+            self.rate_limiter.throttle()
         self._handle_exception(response)
         try:
-            return response.json()
+            result = self.json_codec.loads(response.content)
         except ValueError:
             return {"error": f"Could not parse JSON: {response.text}"}
+        if self.rate_limiter is not None:
+            extra_weight = response_weight(url_path, payload, result)
+            if extra_weight:
+                self.rate_limiter.charge(extra_weight)
+        return result
 
     def _handle_exception(self, response):
-        status_code = response.status_code
-        if status_code < 400:
-            return
-        if 400 <= status_code < 500:
-            try:
-                err = json.loads(response.text)
-            except JSONDecodeError:
-                raise ClientError(status_code, None, response.text, None, response.headers)
-            if err is None:
-                raise ClientError(status_code, None, response.text, None, response.headers)
-            error_data = err.get("data")
-            raise ClientError(status_code, err["code"], err["msg"], response.headers, error_data)
-        raise ServerError(status_code, response.text)
+        _raise_for_status(response.status_code, response.text, response.headers)
@@ -0,0 +1,69 @@
+import logging
+
+from hyperliquid.api import _raise_for_status
+from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.json_codec import JsonCodec, get_json_codec
+from hyperliquid.utils.types import Any, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    aiohttp = None  # type: ignore[assignment]
+
+
+class AsyncAPI:
+    """asyncio counterpart of API.
+
+    Requests share one aiohttp session whose connector keeps up to `max_connections` HTTP/1.1 keep-alive
+    connections open, so a single event loop can have many /info and /exchange calls in flight at once.
+    The session is created lazily on the first request so that it is bound to the running event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async client, install it with `pip install aiohttp`")
+        self.base_url = base_url or MAINNET_API_URL
+        self.json_codec = get_json_codec(json_codec)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.session: Optional[Any] = None
+        self._logger = logging.getLogger(__name__)
+
+    def _get_session(self) -> Any:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def post(self, url_path: str, payload: Any = None) -> Any:
+        payload = payload or {}
+        url = self.base_url + url_path
+        async with self._get_session().post(url, data=self.json_codec.dumps(payload)) as response:
+            body = await response.read()
+            if response.status >= 400:
+                _raise_for_status(response.status, body.decode(errors="replace"), response.headers)
+        try:
+            return self.json_codec.loads(body)
+        except ValueError:
+            return {"error": f"Could not parse JSON: {body.decode(errors='replace')}"}
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
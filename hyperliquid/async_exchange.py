@@ -0,0 +1,166 @@
+import secrets
+
+import eth_account
+from eth_account.signers.local import LocalAccount
+
+from hyperliquid.async_api import AsyncAPI
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.exchange import Exchange
+from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.json_codec import JsonCodec
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.quantizer import Quantizer
+from hyperliquid.utils.signing import DEFAULT_NONCE_ALLOCATOR, NonceAllocator, OrderRequest, sign_agent
+from hyperliquid.utils.types import Any, BuilderInfo, Cloid, List, Meta, Optional, SpotMeta, Tuple, Union
+
+
+class AsyncExchange(AsyncAPI, Exchange):  # type: ignore[misc]
+    """asyncio counterpart of Exchange.
+
+    Exposes the same action methods as Exchange, each returning an awaitable. Signing still happens
+    synchronously when the method is called, only the HTTP round trip is awaited. Build instances with
+    `await AsyncExchange.create(...)` so that the asset metadata is loaded without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        wallet: LocalAccount,
+        info: AsyncInfo,
+        base_url: Optional[str] = None,
+        vault_address: Optional[str] = None,
+        account_address: Optional[str] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ):  # pylint: disable=super-init-not-called
+        AsyncAPI.__init__(self, base_url, max_connections, timeout, json_codec)
+        if info.base_url != self.base_url:
+            raise ValueError(f"info is connected to {info.base_url}, not {self.base_url}")
+        self.wallet = wallet
+        self.vault_address = vault_address
+        self.account_address = account_address
+        self.info: AsyncInfo = info
+        self.expires_after: Optional[int] = None
+        self._quantizer: Optional[Quantizer] = None
+        self.nonce_allocator: NonceAllocator = DEFAULT_NONCE_ALLOCATOR
+        self.order_store: Optional[OrderStore] = None
+
+    @classmethod
+    async def create(
+        cls,
+        wallet: LocalAccount,
+        base_url: Optional[str] = None,
+        meta: Optional[Meta] = None,
+        vault_address: Optional[str] = None,
+        account_address: Optional[str] = None,
+        spot_meta: Optional[SpotMeta] = None,
+        perp_dexs: Optional[List[str]] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> "AsyncExchange":
+        info = await AsyncInfo.create(
+            base_url, True, meta, spot_meta, perp_dexs, max_connections, timeout, json_codec=json_codec
+        )
+        return cls(wallet, info, base_url, vault_address, account_address, max_connections, timeout, json_codec)
+
+    async def _track_order_response(
+        self, order_store: OrderStore, order_requests: List[OrderRequest], response: Any
+    ) -> Any:
+        result = await response
+        order_store.on_order_response(order_requests, result)
+        return result
+
+    async def close(self) -> None:
+        await self.info.close()
+        await super().close()
+
+    async def _slippage_price(  # type: ignore[override]
+        self,
+        name: str,
+        is_buy: bool,
+        slippage: float,
+        px: Optional[float] = None,
+    ) -> float:
+        if not px:
+            # Get midprice
+            px = float((await self.info.all_mids())[self.info.name_to_coin[name]])
+        return Exchange._slippage_price(self, name, is_buy, slippage, px)
+
+    async def market_open(
+        self,
+        name: str,
+        is_buy: bool,
+        sz: float,
+        px: Optional[float] = None,
+        slippage: float = Exchange.DEFAULT_SLIPPAGE,
+        cloid: Optional[Cloid] = None,
+        builder: Optional[BuilderInfo] = None,
+    ) -> Any:
+        # Get aggressive Market Price
+        px = await self._slippage_price(name, is_buy, slippage, px)
+        # Market Order is an aggressive Limit Order IoC
+        return await self.order(
+            name, is_buy, sz, px, order_type={"limit": {"tif": "Ioc"}}, reduce_only=False, cloid=cloid, builder=builder
+        )
+
+    async def market_close(
+        self,
+        coin: str,
+        sz: Optional[float] = None,
+        px: Optional[float] = None,
+        slippage: float = Exchange.DEFAULT_SLIPPAGE,
+        cloid: Optional[Cloid] = None,
+        builder: Optional[BuilderInfo] = None,
+    ) -> Any:
+        address: str = self.wallet.address
+        if self.account_address:
+            address = self.account_address
+        if self.vault_address:
+            address = self.vault_address
+        positions = (await self.info.user_state(address))["assetPositions"]
+        for position in positions:
+            item = position["position"]
+            if coin != item["coin"]:
+                continue
+            szi = float(item["szi"])
+            if not sz:
+                sz = abs(szi)
+            is_buy = True if szi < 0 else False
+            # Get aggressive Market Price
+            px = await self._slippage_price(coin, is_buy, slippage, px)
+            # Market Order is an aggressive Limit Order IoC
+            return await self.order(
+                coin,
+                is_buy,
+                sz,
+                px,
+                order_type={"limit": {"tif": "Ioc"}},
+                reduce_only=True,
+                cloid=cloid,
+                builder=builder,
+            )
+
+    async def approve_agent(self, name: Optional[str] = None) -> Tuple[Any, str]:  # type: ignore[override]
+        agent_key = "0x" + secrets.token_hex(32)
+        account = eth_account.Account.from_key(agent_key)
+        timestamp = self.nonce_allocator.next()
+        is_mainnet = self.base_url == MAINNET_API_URL
+        action = {
+            "type": "approveAgent",
+            "agentAddress": account.address,
+            "agentName": name or "",
+            "nonce": timestamp,
+        }
+        signature = sign_agent(self.wallet, action, is_mainnet)
+        if name is None:
+            del action["agentName"]
+
+        return (
+            await self._post_action(
+                action,
+                signature,
+                timestamp,
+            ),
+            agent_key,
+        )
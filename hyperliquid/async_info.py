@@ -0,0 +1,154 @@
+import asyncio
+import logging
+
+from hyperliquid.async_api import AsyncAPI
+from hyperliquid.info import Info
+from hyperliquid.utils.dispatcher import Dispatcher
+from hyperliquid.utils.json_codec import JsonCodec
+from hyperliquid.utils.local_book import LocalBook
+from hyperliquid.utils.meta_cache import MetaCache
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.signing import get_timestamp_ms
+from hyperliquid.utils.types import Any, Dict, List, Meta, Optional, SpotMeta, Union
+from hyperliquid.websocket_manager import WebsocketManager
+
+
+class AsyncInfo(AsyncAPI, Info):  # type: ignore[misc]
+    """asyncio counterpart of Info.
+
+    Exposes the same request methods as Info, each returning an awaitable. Asset metadata is not fetched in
+    the constructor, build instances with `await AsyncInfo.create(...)` or call `await info.load_meta(...)`
+    before using methods that resolve coin names.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        skip_ws: Optional[bool] = False,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        meta_cache: Optional[MetaCache] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        typed_messages: bool = False,
+        dispatcher: Optional[Dispatcher] = None,
+    ):  # pylint: disable=super-init-not-called
+        AsyncAPI.__init__(self, base_url, max_connections, timeout, json_codec)
+        self.ws_manager: Optional[WebsocketManager] = None
+        self.local_books: Dict[str, LocalBook] = {}
+        self.order_stores: Dict[str, OrderStore] = {}
+        self._order_store_tasks: List["asyncio.Task[None]"] = []
+        if not skip_ws:
+            self.ws_manager = WebsocketManager(
+                self.base_url, json_codec=self.json_codec, typed_messages=typed_messages, dispatcher=dispatcher
+            )
+            self.ws_manager.start()
+        self.coin_to_asset = {}
+        self.name_to_coin = {}
+        self.asset_to_sz_decimals = {}
+        self.meta_cache = meta_cache
+        self._perp_dexs: Optional[List[str]] = None
+
+    @classmethod
+    async def create(
+        cls,
+        base_url: Optional[str] = None,
+        skip_ws: Optional[bool] = False,
+        meta: Optional[Meta] = None,
+        spot_meta: Optional[SpotMeta] = None,
+        perp_dexs: Optional[List[str]] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        meta_cache: Optional[MetaCache] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        typed_messages: bool = False,
+        dispatcher: Optional[Dispatcher] = None,
+    ) -> "AsyncInfo":
+        info = cls(base_url, skip_ws, max_connections, timeout, meta_cache, json_codec, typed_messages, dispatcher)
+        await info.load_meta(meta, spot_meta, perp_dexs)
+        return info
+
+    async def load_meta(
+        self,
+        meta: Optional[Meta] = None,
+        spot_meta: Optional[SpotMeta] = None,
+        perp_dexs: Optional[List[str]] = None,
+    ) -> None:
+        self._perp_dexs = perp_dexs
+        if meta is None and spot_meta is None and self._load_cached_meta():
+            return
+        await self._fetch_meta(meta, spot_meta, perp_dexs)
+        self._store_cached_meta()
+
+    async def refresh_meta(self) -> None:  # type: ignore[override]
+        self.coin_to_asset = {}
+        self.name_to_coin = {}
+        self.asset_to_sz_decimals = {}
+        await self._fetch_meta(None, None, self._perp_dexs)
+        self._store_cached_meta()
+
+    async def _fetch_meta(
+        self, meta: Optional[Meta], spot_meta: Optional[SpotMeta], perp_dexs: Optional[List[str]]
+    ) -> None:
+        if spot_meta is None:
+            spot_meta = await self.spot_meta()  # type: ignore[misc]
+        self.set_spot_meta(spot_meta)
+
+        perp_dex_to_offset = {"": 0}
+        if perp_dexs is None:
+            perp_dexs = [""]
+        else:
+            perp_dex_to_offset = self._perp_dex_to_offset(await self.perp_dexs())
+
+        to_fetch = [perp_dex for perp_dex in perp_dexs if not (perp_dex == "" and meta is not None)]
+        fresh_metas = await asyncio.gather(*(self.meta(dex=perp_dex) for perp_dex in to_fetch))  # type: ignore[call-overload]
+        if meta is not None and "" in perp_dexs:
+            self.set_perp_meta(meta, 0)
+        for perp_dex, fresh_meta in zip(to_fetch, fresh_metas):
+            self.set_perp_meta(fresh_meta, perp_dex_to_offset[perp_dex])
+
+    async def local_book(self, name: str) -> LocalBook:  # type: ignore[override]
+        coin = self.name_to_coin[name]
+        book = self.local_books.get(coin)
+        if book is None:
+            book = LocalBook(coin)
+            self.subscribe({"type": "l2Book", "coin": coin}, book.on_message)
+            book.apply_snapshot(await self.l2_snapshot(coin))
+            self.local_books[coin] = book
+        return book
+
+    async def order_store(self, address: str, reconcile_interval: float = 60.0) -> OrderStore:  # type: ignore[override]
+        """Info.order_store, reconciling from a task on the running event loop instead of a thread."""
+        store = self.order_stores.get(address)
+        if store is None:
+            store = OrderStore()
+            self.subscribe({"type": "orderUpdates", "user": address}, store.on_order_updates)
+            self.subscribe({"type": "userFills", "user": address}, store.on_user_fills)
+            dexs = self._perp_dexs if self._perp_dexs is not None else [""]
+            loop = asyncio.get_running_loop()
+
+            async def reconcile() -> None:
+                as_of = get_timestamp_ms()
+                try:
+                    open_orders: List[Any] = []
+                    for dex in dexs:
+                        open_orders.extend(await self.frontend_open_orders(address, dex))
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("Fetching open orders to reconcile the order store failed")
+                    return
+                store.reconcile(open_orders, as_of, dexs)
+
+            async def reconcile_periodically() -> None:
+                while not store.stopped:
+                    await asyncio.sleep(reconcile_interval)
+                    await reconcile()
+
+            def on_reconnect() -> None:
+                # reconnect callbacks run on the websocket thread
+                asyncio.run_coroutine_threadsafe(reconcile(), loop)
+
+            await reconcile()
+            self.add_reconnect_callback(on_reconnect)
+            if reconcile_interval:
+                self._order_store_tasks.append(loop.create_task(reconcile_periodically()))
+            self.order_stores[address] = store
+        return store
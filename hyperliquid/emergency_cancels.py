@@ -0,0 +1,134 @@
+import logging
+import threading
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.signing import get_timestamp_ms, sign_l1_action
+from hyperliquid.utils.types import Any, Callable, Dict, List, NamedTuple, Optional
+
+# The exchange rejects scheduleCancel times less than 5 seconds away
+MIN_SCHEDULE_CANCEL_DELAY_MS = 5000
+
+
+class PresignedAction(NamedTuple):
+    payload: Dict[str, Any]
+    # the action is sent as is until this time (UTC millis), signed again afterwards
+    valid_until: int
+
+
+class EmergencyCancels:
+    """Keeps signed actions that cancel all open orders ready to be sent with no signing on the critical path.
+
+    refresh() reads the open orders (Info.open_orders of the exchange's account unless `open_orders` is given) and
+    signs a cancel of all of them plus a scheduleCancel `schedule_delay_ms` ahead, which also catches orders placed
+    after the refresh. Their nonces are reserved `nonce_lead_ms` ahead of now from exchange.nonce_allocator, so the
+    exchange's other actions neither reuse them nor push them out of the window of recent nonces, and they carry an
+    expiresAfter `ttl_ms` ahead so that they cannot be replayed later. start() refreshes them every `interval`
+    seconds on a background thread.
+
+    fire() posts them right away, cancels first. An action that is no longer valid, e.g. because refreshing
+    stopped, is signed again before sending.
+    """
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        open_orders: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+        interval: float = 1.0,
+        nonce_lead_ms: int = 5000,
+        ttl_ms: int = 10000,
+        schedule_delay_ms: int = 10000,
+    ):
+        if schedule_delay_ms <= MIN_SCHEDULE_CANCEL_DELAY_MS:
+            raise ValueError(f"schedule_delay_ms must be more than {MIN_SCHEDULE_CANCEL_DELAY_MS}")
+        self.exchange = exchange
+        self.open_orders = open_orders or self._account_open_orders
+        self.interval = interval
+        self.nonce_lead_ms = nonce_lead_ms
+        self.ttl_ms = ttl_ms
+        self.schedule_delay_ms = schedule_delay_ms
+        self.cancel_all: Optional[PresignedAction] = None
+        self.schedule_cancel: Optional[PresignedAction] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(__name__)
+
+    def _account_open_orders(self) -> List[Dict[str, Any]]:
+        exchange = self.exchange
+        address = exchange.vault_address or exchange.account_address or exchange.wallet.address
+        return exchange.info.open_orders(address)  # type: ignore[no-any-return]
+
+    def _presign(self, action: Dict[str, Any]) -> PresignedAction:
+        exchange = self.exchange
+        nonce = exchange.nonce_allocator.reserve(self.nonce_lead_ms)
+        expires_after = get_timestamp_ms() + self.ttl_ms
+        signature = sign_l1_action(
+            exchange.wallet,
+            action,
+            exchange.vault_address,
+            nonce,
+            expires_after,
+            exchange.base_url == MAINNET_API_URL,
+        )
+        payload = {
+            "action": action,
+            "nonce": nonce,
+            "signature": signature,
+            "vaultAddress": exchange.vault_address,
+            "expiresAfter": expires_after,
+        }
+        return PresignedAction(payload, expires_after)
+
+    def _sign_cancel_all(self, open_orders: List[Dict[str, Any]]) -> Optional[PresignedAction]:
+        if not open_orders:
+            return None
+        cancels = [{"a": self.exchange.info.name_to_asset(order["coin"]), "o": order["oid"]} for order in open_orders]
+        return self._presign({"type": "cancel", "cancels": cancels})
+
+    def _sign_schedule_cancel(self) -> PresignedAction:
+        cancel_time = get_timestamp_ms() + self.schedule_delay_ms
+        presigned = self._presign({"type": "scheduleCancel", "time": cancel_time})
+        valid_until = min(presigned.valid_until, cancel_time - MIN_SCHEDULE_CANCEL_DELAY_MS)
+        return presigned._replace(valid_until=valid_until)
+
+    def refresh(self) -> None:
+        """Sign the emergency actions again for the current open orders."""
+        cancel_all = self._sign_cancel_all(self.open_orders())
+        schedule_cancel = self._sign_schedule_cancel()
+        self.cancel_all, self.schedule_cancel = cancel_all, schedule_cancel
+
+    def fire(self) -> List[Any]:
+        """Send the cancel of all open orders (if there were any) and the scheduleCancel, returns the responses."""
+        now = get_timestamp_ms()
+        cancel_all, schedule_cancel = self.cancel_all, self.schedule_cancel
+        # never refreshed, or refreshing stopped long enough ago for the signed cancel to expire
+        if schedule_cancel is None or (cancel_all is not None and cancel_all.valid_until <= now):
+            cancel_all = self._sign_cancel_all(self.open_orders())
+        if schedule_cancel is None or schedule_cancel.valid_until <= now:
+            schedule_cancel = self._sign_schedule_cancel()
+        responses = []
+        for presigned in (cancel_all, schedule_cancel):
+            if presigned is not None:
+                responses.append(self.exchange.post("/exchange", presigned.payload))
+        return responses
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("Refreshing the emergency cancels failed, keeping the previous ones")
+
+    def start(self) -> "EmergencyCancels":
+        """Sign the actions now and keep refreshing them in the background until stop()."""
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="emergency-cancels", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
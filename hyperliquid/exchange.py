@@ -8,17 +8,23 @@ from eth_account.signers.local import LocalAccount
 from hyperliquid.api import API
 from hyperliquid.info import Info
 from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.json_codec import JsonCodec
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.quantizer import Quantizer
+from hyperliquid.utils.rate_limiter import RateLimiter
 from hyperliquid.utils.signing import (
+    DEFAULT_NONCE_ALLOCATOR,
     CancelByCloidRequest,
     CancelRequest,
     ModifyRequest,
+    NonceAllocator,
     OidOrCloid,
     OrderRequest,
     OrderType,
     OrderWire,
     ScheduleCancelAction,
     float_to_usd_int,
-    get_timestamp_ms,
+    ladder_to_order_wires,
     order_request_to_order_wire,
     order_wires_to_order_action,
     sign_agent,
@@ -44,6 +50,7 @@ from hyperliquid.utils.types import (
     PerpDexSchemaInput,
     SpotMeta,
     Tuple,
+    Union,
 )
 
 
@@ -60,15 +67,34 @@ class Exchange(API):
         account_address: Optional[str] = None,
         spot_meta: Optional[SpotMeta] = None,
         perp_dexs: Optional[List[str]] = None,
+        # An already constructed Info of the same base_url to share instead of fetching the metadata again, meta,
+        # spot_meta and perp_dexs cannot be passed along with it.
+        info: Optional[Info] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        # Token bucket the requests wait on, also used by the Info created here, see API
+        rate_limiter: Optional[RateLimiter] = None,
     ):
-        super().__init__(base_url)
+        super().__init__(base_url, json_codec, rate_limiter)
         self.wallet = wallet
         self.vault_address = vault_address
         self.account_address = account_address
-        self.info = Info(base_url, True, meta, spot_meta, perp_dexs)
+        if info is not None and (meta is not None or spot_meta is not None or perp_dexs is not None):
+            raise ValueError("meta, spot_meta and perp_dexs cannot be passed together with info")
+        if info is None:
+            info = Info(
+                base_url, True, meta, spot_meta, perp_dexs, json_codec=self.json_codec, rate_limiter=rate_limiter
+            )
+        elif info.base_url != self.base_url:
+            raise ValueError(f"info is connected to {info.base_url}, not {self.base_url}")
+        self.info = info
         self.expires_after: Optional[int] = None
+        self._quantizer: Optional[Quantizer] = None
+        # Nonces are unique and increasing across threads and across the clients sharing this allocator
+        self.nonce_allocator: NonceAllocator = DEFAULT_NONCE_ALLOCATOR
+        # Fed with the responses of bulk_orders when set, e.g. to info.order_store(address)
+        self.order_store: Optional[OrderStore] = None
 
-    def _post_action(self, action, signature, nonce):
+    def _action_payload(self, action, signature, nonce):
         payload = {
             "action": action,
             "nonce": nonce,
@@ -77,7 +103,10 @@ class Exchange(API):
             "expiresAfter": self.expires_after,
         }
         logging.debug(payload)
-        return self.post("/exchange", payload)
+        return payload
+
+    def _post_action(self, action, signature, nonce):
+        return self.post("/exchange", self._action_payload(action, signature, nonce))
 
     def _slippage_price(
         self,
@@ -92,13 +121,17 @@ class Exchange(API):
             px = float(self.info.all_mids()[coin])
 
         asset = self.info.coin_to_asset[coin]
-        # spot assets start at 10000
-        is_spot = asset >= 10_000
-
         # Calculate Slippage
         px *= (1 + slippage) if is_buy else (1 - slippage)
-        # We round px to 5 significant figures and 6 decimals for perps, 8 decimals for spot
-        return round(float(f"{px:.5g}"), (6 if not is_spot else 8) - self.info.asset_to_sz_decimals[asset])
+        return self.quantizer.round_px(asset, px)
+
+    @property
+    def quantizer(self) -> Quantizer:
+        """Price and size rounding rules of the assets in self.info, see Quantizer."""
+        # rebuilt when Info.refresh_meta replaces the asset tables
+        if self._quantizer is None or self._quantizer.asset_to_sz_decimals is not self.info.asset_to_sz_decimals:
+            self._quantizer = Quantizer(self.info.asset_to_sz_decimals)
+        return self._quantizer
 
     # expires_after will cause actions to be rejected after that timestamp in milliseconds
     # expires_after is not supported on user_signed actions (e.g. usd_transfer) and must be None in order for those
@@ -133,7 +166,42 @@ class Exchange(API):
         order_wires: List[OrderWire] = [
             order_request_to_order_wire(order, self.info.name_to_asset(order["coin"])) for order in order_requests
         ]
-        timestamp = get_timestamp_ms()
+        response = self._post_order_wires(order_wires, builder)
+        if self.order_store is not None:
+            response = self._track_order_response(self.order_store, order_requests, response)
+        return response
+
+    def _track_order_response(self, order_store: OrderStore, order_requests: List[OrderRequest], response: Any) -> Any:
+        order_store.on_order_response(order_requests, response)
+        return response
+
+    def ladder_orders(
+        self,
+        name: str,
+        is_buy: Any,
+        sz: Any,
+        limit_px: Any,
+        order_type: OrderType,
+        reduce_only: bool = False,
+        cloids: Optional[List[Optional[Cloid]]] = None,
+        builder: Optional[BuilderInfo] = None,
+        quantize: bool = False,
+    ) -> Any:
+        """Place many orders on one coin in a single action, e.g. a ladder of quotes.
+
+        sz and limit_px are NumPy arrays (or sequences) of the same length and is_buy is a bool or an array of
+        bools. With quantize=True prices and sizes are first rounded to the coin's tick and lot sizes with
+        self.quantizer, which requires numpy.
+        """
+        asset = self.info.name_to_asset(name)
+        if quantize:
+            sz = self.quantizer.round_sz_array(asset, sz)
+            limit_px = self.quantizer.round_px_array(asset, limit_px)
+        order_wires = ladder_to_order_wires(asset, is_buy, sz, limit_px, order_type, reduce_only, cloids)
+        return self._post_order_wires(order_wires, builder)
+
+    def _post_order_wires(self, order_wires: List[OrderWire], builder: Optional[BuilderInfo]) -> Any:
+        timestamp = self.nonce_allocator.next()
 
         if builder:
             builder["b"] = builder["b"].lower()
@@ -180,7 +248,7 @@ class Exchange(API):
         return self.bulk_modify_orders_new([modify])
 
     def bulk_modify_orders_new(self, modify_requests: List[ModifyRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         modify_wires = [
             {
                 "oid": modify["oid"].to_raw() if isinstance(modify["oid"], Cloid) else modify["oid"],
@@ -270,7 +338,7 @@ class Exchange(API):
         return self.bulk_cancel_by_cloid([{"coin": name, "cloid": cloid}])
 
     def bulk_cancel(self, cancel_requests: List[CancelRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         cancel_action = {
             "type": "cancel",
             "cancels": [
@@ -297,7 +365,7 @@ class Exchange(API):
         )
 
     def bulk_cancel_by_cloid(self, cancel_requests: List[CancelByCloidRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
 
         cancel_action = {
             "type": "cancelByCloid",
@@ -332,7 +400,7 @@ class Exchange(API):
         Args:
             time (int): if time is not None, then set the cancel time in the future. If None, then unsets any cancel time in the future.
         """
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         schedule_cancel_action: ScheduleCancelAction = {
             "type": "scheduleCancel",
         }
@@ -353,7 +421,7 @@ class Exchange(API):
         )
 
     def update_leverage(self, leverage: int, name: str, is_cross: bool = True) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         update_leverage_action = {
             "type": "updateLeverage",
             "asset": self.info.name_to_asset(name),
@@ -375,7 +443,7 @@ class Exchange(API):
         )
 
     def update_isolated_margin(self, amount: float, name: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         amount = float_to_usd_int(amount)
         update_isolated_margin_action = {
             "type": "updateIsolatedMargin",
@@ -398,7 +466,7 @@ class Exchange(API):
         )
 
     def set_referrer(self, code: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         set_referrer_action = {
             "type": "setReferrer",
             "code": code,
@@ -418,7 +486,7 @@ class Exchange(API):
         )
 
     def create_sub_account(self, name: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         create_sub_account_action = {
             "type": "createSubAccount",
             "name": name,
@@ -438,7 +506,7 @@ class Exchange(API):
         )
 
     def usd_class_transfer(self, amount: float, to_perp: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         str_amount = str(amount)
         if self.vault_address:
             str_amount += f" subaccount:{self.vault_address}"
@@ -457,7 +525,7 @@ class Exchange(API):
         )
 
     def perp_dex_class_transfer(self, dex: str, token: str, amount: float, to_perp: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         str_amount = str(amount)
         if self.vault_address:
             str_amount += f" subaccount:{self.vault_address}"
@@ -478,7 +546,7 @@ class Exchange(API):
         )
 
     def sub_account_transfer(self, sub_account_user: str, is_deposit: bool, usd: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         sub_account_transfer_action = {
             "type": "subAccountTransfer",
             "subAccountUser": sub_account_user,
@@ -500,7 +568,7 @@ class Exchange(API):
         )
 
     def sub_account_spot_transfer(self, sub_account_user: str, is_deposit: bool, token: str, amount: float) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         sub_account_transfer_action = {
             "type": "subAccountSpotTransfer",
             "subAccountUser": sub_account_user,
@@ -523,7 +591,7 @@ class Exchange(API):
         )
 
     def vault_usd_transfer(self, vault_address: str, is_deposit: bool, usd: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         vault_transfer_action = {
             "type": "vaultTransfer",
             "vaultAddress": vault_address,
@@ -539,7 +607,7 @@ class Exchange(API):
         )
 
     def usd_transfer(self, amount: float, destination: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "usdSend"}
         is_mainnet = self.base_url == MAINNET_API_URL
         signature = sign_usd_transfer_action(self.wallet, action, is_mainnet)
@@ -550,7 +618,7 @@ class Exchange(API):
         )
 
     def spot_transfer(self, amount: float, destination: str, token: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "destination": destination,
             "amount": str(amount),
@@ -567,7 +635,7 @@ class Exchange(API):
         )
 
     def token_delegate(self, validator: str, wei: int, is_undelegate: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "validator": validator,
             "wei": wei,
@@ -584,7 +652,7 @@ class Exchange(API):
         )
 
     def withdraw_from_bridge(self, amount: float, destination: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "withdraw3"}
         is_mainnet = self.base_url == MAINNET_API_URL
         signature = sign_withdraw_from_bridge_action(self.wallet, action, is_mainnet)
@@ -597,7 +665,7 @@ class Exchange(API):
     def approve_agent(self, name: Optional[str] = None) -> Tuple[Any, str]:
         agent_key = "0x" + secrets.token_hex(32)
         account = eth_account.Account.from_key(agent_key)
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         is_mainnet = self.base_url == MAINNET_API_URL
         action = {
             "type": "approveAgent",
@@ -619,14 +687,14 @@ class Exchange(API):
         )
 
     def approve_builder_fee(self, builder: str, max_fee_rate: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
 
         action = {"maxFeeRate": max_fee_rate, "builder": builder, "nonce": timestamp, "type": "approveBuilderFee"}
         signature = sign_approve_builder_fee(self.wallet, action, self.base_url == MAINNET_API_URL)
         return self._post_action(action, signature, timestamp)
 
     def convert_to_multi_sig_user(self, authorized_users: List[str], threshold: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         authorized_users = sorted(authorized_users)
         signers = {
             "authorizedUsers": authorized_users,
@@ -647,7 +715,7 @@ class Exchange(API):
     def spot_deploy_register_token(
         self, token_name: str, sz_decimals: int, wei_decimals: int, max_gas: int, full_name: str
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "registerToken2": {
@@ -673,7 +741,7 @@ class Exchange(API):
     def spot_deploy_user_genesis(
         self, token: int, user_and_wei: List[Tuple[str, str]], existing_token_and_wei: List[Tuple[int, str]]
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "userGenesis": {
@@ -697,7 +765,7 @@ class Exchange(API):
         )
 
     def spot_deploy_enable_freeze_privilege(self, token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "enableFreezePrivilege": {
@@ -719,7 +787,7 @@ class Exchange(API):
         )
 
     def spot_deploy_freeze_user(self, token: int, user: str, freeze: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "freezeUser": {
@@ -743,7 +811,7 @@ class Exchange(API):
         )
 
     def spot_deploy_revoke_freeze_privilege(self, token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "revokeFreezePrivilege": {
@@ -765,7 +833,7 @@ class Exchange(API):
         )
 
     def spot_deploy_genesis(self, token: int, max_supply: str, no_hyperliquidity: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         genesis = {
             "token": token,
             "maxSupply": max_supply,
@@ -791,7 +859,7 @@ class Exchange(API):
         )
 
     def spot_deploy_register_spot(self, base_token: int, quote_token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "registerSpot": {
@@ -815,7 +883,7 @@ class Exchange(API):
     def spot_deploy_register_hyperliquidity(
         self, spot: int, start_px: float, order_sz: float, n_orders: int, n_seeded_levels: Optional[int]
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         register_hyperliquidity = {
             "spot": spot,
             "startPx": str(start_px),
@@ -843,7 +911,7 @@ class Exchange(API):
         )
 
     def spot_deploy_set_deployer_trading_fee_share(self, token: int, share: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "spotDeploy",
             "setDeployerTradingFeeShare": {
@@ -876,7 +944,7 @@ class Exchange(API):
         only_isolated: bool,
         schema: Optional[PerpDexSchemaInput],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         schema_wire = None
         if schema is not None:
             schema_wire = {
@@ -919,7 +987,7 @@ class Exchange(API):
         oracle_pxs: Dict[str, str],
         mark_pxs: Optional[Dict[str, str]],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         oracle_pxs_wire = sorted(list(oracle_pxs.items()))
         mark_pxs_wire = None
         if mark_pxs is not None:
@@ -953,7 +1021,7 @@ class Exchange(API):
         return self.c_signer_inner("jailSelf")
 
     def c_signer_inner(self, variant: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "CSignerAction",
             variant: None,
@@ -983,7 +1051,7 @@ class Exchange(API):
         unjailed: bool,
         initial_wei: int,
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "CValidatorAction",
             "register": {
@@ -1023,7 +1091,7 @@ class Exchange(API):
         commission_bps: Optional[int],
         signer: Optional[str],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "CValidatorAction",
             "changeProfile": {
@@ -1051,7 +1119,7 @@ class Exchange(API):
         )
 
     def c_validator_unregister(self) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "CValidatorAction",
             "unregister": None,
@@ -1098,7 +1166,7 @@ class Exchange(API):
         )
 
     def use_big_blocks(self, enable: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self.nonce_allocator.next()
         action = {
             "type": "evmUserModify",
             "usingBigBlocks": enable,
@@ -1,18 +1,29 @@
 from hyperliquid.api import API
+from hyperliquid.utils.dispatcher import Dispatcher
+from hyperliquid.utils.json_codec import JsonCodec
+from hyperliquid.utils.local_book import LocalBook
+from hyperliquid.utils.meta_cache import MetaCache
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.rate_limiter import RateLimiter
 from hyperliquid.utils.types import (
     Any,
     Callable,
     Cloid,
+    Dict,
     List,
     Meta,
     Optional,
     SpotMeta,
     SpotMetaAndAssetCtxs,
     Subscription,
+    Union,
     cast,
 )
 from hyperliquid.websocket_manager import WebsocketManager
 
+# Channels whose every message is a full snapshot, so that dropping all but the latest loses nothing
+CONFLATABLE_SUBSCRIPTIONS = {"allMids", "l2Book", "bbo", "activeAssetCtx", "webData2"}
+
 
 class Info(API):
     def __init__(
@@ -24,40 +35,81 @@ class Info(API):
         # Note that when perp_dexs is None, then "" is used as the perp dex. "" represents
         # the original dex.
         perp_dexs: Optional[List[str]] = None,
+        # When set, the asset tables are loaded from this cache instead of the network unless meta or spot_meta
+        # are passed explicitly, and freshly fetched tables are written back to it.
+        meta_cache: Optional[MetaCache] = None,
+        # Name or instance of the JSON codec used for REST and websocket messages, see get_json_codec
+        json_codec: Union[str, JsonCodec, None] = None,
+        # When set, allMids, l2Book, bbo, trades and userFills messages are passed to subscription callbacks as the
+        # msgspec Structs of hyperliquid.utils.typed_messages, with prices and sizes already converted to numbers.
+        typed_messages: bool = False,
+        # Runs subscription callbacks on a worker pool instead of the websocket thread, see Dispatcher
+        dispatcher: Optional[Dispatcher] = None,
+        # Token bucket the REST requests wait on, see API
+        rate_limiter: Optional[RateLimiter] = None,
     ):  # pylint: disable=too-many-locals
-        super().__init__(base_url)
+        super().__init__(base_url, json_codec, rate_limiter)
         self.ws_manager: Optional[WebsocketManager] = None
+        self.local_books: Dict[str, LocalBook] = {}
+        self.order_stores: Dict[str, OrderStore] = {}
         if not skip_ws:
-            self.ws_manager = WebsocketManager(self.base_url)
+            self.ws_manager = WebsocketManager(
+                self.base_url, json_codec=self.json_codec, typed_messages=typed_messages, dispatcher=dispatcher
+            )
             self.ws_manager.start()
 
-        if spot_meta is None:
-            spot_meta = self.spot_meta()
+        self.coin_to_asset: Dict[str, int] = {}
+        self.name_to_coin: Dict[str, str] = {}
+        self.asset_to_sz_decimals: Dict[int, int] = {}
+        self.meta_cache = meta_cache
+        self._perp_dexs = perp_dexs
 
+        if meta is None and spot_meta is None and self._load_cached_meta():
+            return
+        self._load_meta(meta, spot_meta, perp_dexs)
+        self._store_cached_meta()
+
+    def refresh_meta(self) -> None:
+        """Re-fetch the asset tables from the API, bypassing and then updating the metadata cache."""
         self.coin_to_asset = {}
         self.name_to_coin = {}
         self.asset_to_sz_decimals = {}
+        self._load_meta(None, None, self._perp_dexs)
+        self._store_cached_meta()
+
+    def _load_cached_meta(self) -> bool:
+        if self.meta_cache is None:
+            return False
+        tables = self.meta_cache.load(self.base_url, self._perp_dexs)
+        if tables is None:
+            return False
+        self.coin_to_asset = tables["coin_to_asset"]
+        self.name_to_coin = tables["name_to_coin"]
+        self.asset_to_sz_decimals = tables["asset_to_sz_decimals"]
+        return True
+
+    def _store_cached_meta(self) -> None:
+        if self.meta_cache is not None:
+            self.meta_cache.store(
+                self.base_url,
+                self._perp_dexs,
+                {
+                    "coin_to_asset": self.coin_to_asset,
+                    "name_to_coin": self.name_to_coin,
+                    "asset_to_sz_decimals": self.asset_to_sz_decimals,
+                },
+            )
 
-        # spot assets start at 10000
-        for spot_info in spot_meta["universe"]:
-            asset = spot_info["index"] + 10000
-            self.coin_to_asset[spot_info["name"]] = asset
-            self.name_to_coin[spot_info["name"]] = spot_info["name"]
-            base, quote = spot_info["tokens"]
-            base_info = spot_meta["tokens"][base]
-            quote_info = spot_meta["tokens"][quote]
-            self.asset_to_sz_decimals[asset] = base_info["szDecimals"]
-            name = f'{base_info["name"]}/{quote_info["name"]}'
-            if name not in self.name_to_coin:
-                self.name_to_coin[name] = spot_info["name"]
+    def _load_meta(self, meta: Optional[Meta], spot_meta: Optional[SpotMeta], perp_dexs: Optional[List[str]]) -> None:
+        if spot_meta is None:
+            spot_meta = self.spot_meta()
+        self.set_spot_meta(spot_meta)
 
         perp_dex_to_offset = {"": 0}
         if perp_dexs is None:
             perp_dexs = [""]
         else:
-            for i, perp_dex in enumerate(self.perp_dexs()[1:]):
-                # builder-deployed perp dexs start at 110000
-                perp_dex_to_offset[perp_dex["name"]] = 110000 + i * 10000
+            perp_dex_to_offset = self._perp_dex_to_offset(self.perp_dexs())
 
         for perp_dex in perp_dexs:
             offset = perp_dex_to_offset[perp_dex]
@@ -67,6 +119,28 @@ class Info(API):
                 fresh_meta = self.meta(dex=perp_dex)
                 self.set_perp_meta(fresh_meta, offset)
 
+    @staticmethod
+    def _perp_dex_to_offset(perp_dexs: Any) -> Dict[str, int]:
+        perp_dex_to_offset = {"": 0}
+        for i, perp_dex in enumerate(perp_dexs[1:]):
+            # builder-deployed perp dexs start at 110000
+            perp_dex_to_offset[perp_dex["name"]] = 110000 + i * 10000
+        return perp_dex_to_offset
+
+    def set_spot_meta(self, spot_meta: SpotMeta) -> None:
+        # spot assets start at 10000
+        for spot_info in spot_meta["universe"]:
+            asset = spot_info["index"] + 10000
+            self.coin_to_asset[spot_info["name"]] = asset
+            self.name_to_coin[spot_info["name"]] = spot_info["name"]
+            base, quote = spot_info["tokens"]
+            base_info = spot_meta["tokens"][base]
+            quote_info = spot_meta["tokens"][quote]
+            self.asset_to_sz_decimals[asset] = base_info["szDecimals"]
+            name = f'{base_info["name"]}/{quote_info["name"]}'
+            if name not in self.name_to_coin:
+                self.name_to_coin[name] = spot_info["name"]
+
     def set_perp_meta(self, meta: Meta, offset: int) -> Any:
         for asset, asset_info in enumerate(meta["universe"]):
             asset += offset
@@ -608,12 +682,21 @@ class Info(API):
         ):
             subscription["coin"] = self.name_to_coin[subscription["coin"]]
 
-    def subscribe(self, subscription: Subscription, callback: Callable[[Any], None]) -> int:
+    def subscribe(self, subscription: Subscription, callback: Callable[[Any], None], conflate: bool = False) -> int:
+        """Subscribe callback to a websocket channel and return the subscription id to unsubscribe with.
+
+        With conflate, only the most recent message is kept while the callback is busy, and the callback receives it
+        once it returns, so a slow consumer skips stale updates instead of falling behind. This is only allowed for
+        channels whose messages each carry the full state, see CONFLATABLE_SUBSCRIPTIONS. Conflated callbacks run on
+        the dispatcher if one was given, otherwise on a worker thread of the websocket manager.
+        """
         self._remap_coin_subscription(subscription)
+        if conflate and subscription["type"] not in CONFLATABLE_SUBSCRIPTIONS:
+            raise ValueError(f"Cannot conflate {subscription['type']} messages, they are not full state updates")
         if self.ws_manager is None:
             raise RuntimeError("Cannot call subscribe since skip_ws was used")
         else:
-            return self.ws_manager.subscribe(subscription, callback)
+            return self.ws_manager.subscribe(subscription, callback, policy="conflate" if conflate else None)
 
     def unsubscribe(self, subscription: Subscription, subscription_id: int) -> bool:
         self._remap_coin_subscription(subscription)
@@ -622,5 +705,55 @@ class Info(API):
         else:
             return self.ws_manager.unsubscribe(subscription, subscription_id)
 
+    def add_reconnect_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked after the websocket reconnected and replayed all subscriptions.
+
+        Messages published while the connection was down are lost, so consumers keeping local state should resync.
+        """
+        if self.ws_manager is None:
+            raise RuntimeError("Cannot call add_reconnect_callback since skip_ws was used")
+        else:
+            self.ws_manager.add_reconnect_callback(callback)
+
+    def local_book(self, name: str) -> LocalBook:
+        """Return a LocalBook for the coin that is kept up to date from the l2Book websocket channel.
+
+        The first call subscribes to l2Book and seeds the book with l2_snapshot, later calls return the same book.
+        """
+        coin = self.name_to_coin[name]
+        book = self.local_books.get(coin)
+        if book is None:
+            book = LocalBook(coin)
+            self.subscribe({"type": "l2Book", "coin": coin}, book.on_message)
+            book.apply_snapshot(self.l2_snapshot(coin))
+            self.local_books[coin] = book
+        return book
+
+    def order_store(self, address: str, reconcile_interval: float = 60.0) -> OrderStore:
+        """Return an OrderStore of the user's orders, kept up to date from the orderUpdates and userFills channels.
+
+        The first call subscribes to both channels, seeds the store with frontend_open_orders and reconciles it with
+        frontend_open_orders again from a background thread after every websocket reconnect and every
+        reconcile_interval seconds (0 disables this), later calls return the same store. The open orders of every perp dex this Info was created with are
+        fetched, orders on other dexs are only tracked through the websocket.
+        """
+        store = self.order_stores.get(address)
+        if store is None:
+            store = OrderStore()
+            self.subscribe({"type": "orderUpdates", "user": address}, store.on_order_updates)
+            self.subscribe({"type": "userFills", "user": address}, store.on_user_fills)
+            dexs = self._perp_dexs if self._perp_dexs is not None else [""]
+
+            def fetch_open_orders() -> List[Any]:
+                return [order for dex in dexs for order in self.frontend_open_orders(address, dex)]
+
+            store.reconcile_with(fetch_open_orders, dexs)
+            # reconciling after a reconnect is left to the store's thread, reconnect callbacks run on the websocket
+            # thread and would hold up every subscription while the open orders are fetched
+            store.start_reconciliation(fetch_open_orders, reconcile_interval, dexs)
+            self.add_reconnect_callback(store.request_reconciliation)
+            self.order_stores[address] = store
+        return store
+
     def name_to_asset(self, name: str) -> int:
         return self.coin_to_asset[self.name_to_coin[name]]
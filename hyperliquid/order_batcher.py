@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.utils.signing import (
+    CancelByCloidRequest,
+    CancelRequest,
+    ModifyRequest,
+    OidOrCloid,
+    OrderRequest,
+    OrderType,
+)
+from hyperliquid.utils.types import Any, BuilderInfo, Cloid, Dict, List, NamedTuple, Optional, Tuple, TypedDict
+
+# Pending batches are sent in this order when several are due at once, cancels first
+BATCH_KINDS = ("cancel", "cancelByCloid", "modify", "order")
+
+OrderBatcherStats = TypedDict("OrderBatcherStats", {"pending": int, "requests": int, "actions": int})
+
+
+class PendingBatch(NamedTuple):
+    deadline: float
+    builder: Optional[BuilderInfo]
+    requests: List[Any]
+    futures: List["Future[Any]"]
+
+
+def _builder_key(builder: Optional[BuilderInfo]) -> Optional[Tuple[str, int]]:
+    return None if builder is None else (builder["b"].lower(), builder["f"])
+
+
+def _statuses(response: Any, count: int) -> List[Any]:
+    """One status per request of a bulk action, the action's error for each of them if it failed as a whole."""
+    if isinstance(response, dict) and response.get("status") == "ok":
+        statuses = response["response"]["data"]["statuses"]
+        if len(statuses) == count:
+            return statuses  # type: ignore[no-any-return]
+    error = response.get("response", response) if isinstance(response, dict) else response
+    return [{"error": error}] * count
+
+
+class OrderBatcher:
+    """Coalesces single order, modify and cancel calls on an Exchange into bulk actions.
+
+    Each call returns a Future right away. Calls of the same kind (and for orders, the same builder) are collected
+    until `window` seconds after the first of them or until `max_batch_size` are pending, then sent as one
+    bulk_orders, bulk_modify_orders_new, bulk_cancel or bulk_cancel_by_cloid action from a background thread. Each
+    future resolves to its own entry of the response's statuses, e.g. {"resting": {"oid": ...}}, "success" or
+    {"error": ...}, or to {"error": ...} for every call of an action that was rejected as a whole. If sending fails,
+    e.g. with a ClientError, the exception is set on every future of the batch.
+
+    Use it as a context manager or call close(), which sends whatever is still pending. Only for the synchronous
+    Exchange, whose bulk methods block until the response arrives.
+    """
+
+    def __init__(self, exchange: Exchange, window: float = 0.001, max_batch_size: int = 40):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.exchange = exchange
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.pending: Dict[Tuple[str, Optional[Tuple[str, int]]], PendingBatch] = {}
+        self.condition = threading.Condition()
+        self.closed = False
+        self.requests = 0
+        self.actions = 0
+        self._logger = logging.getLogger(__name__)
+        self.thread = threading.Thread(target=self._run, name="order-batcher", daemon=True)
+        self.thread.start()
+
+    def order(
+        self,
+        name: str,
+        is_buy: bool,
+        sz: float,
+        limit_px: float,
+        order_type: OrderType,
+        reduce_only: bool = False,
+        cloid: Optional[Cloid] = None,
+        builder: Optional[BuilderInfo] = None,
+    ) -> "Future[Any]":
+        order: OrderRequest = {
+            "coin": name,
+            "is_buy": is_buy,
+            "sz": sz,
+            "limit_px": limit_px,
+            "order_type": order_type,
+            "reduce_only": reduce_only,
+        }
+        if cloid:
+            order["cloid"] = cloid
+        return self._submit("order", name, order, builder)
+
+    def modify_order(
+        self,
+        oid: OidOrCloid,
+        name: str,
+        is_buy: bool,
+        sz: float,
+        limit_px: float,
+        order_type: OrderType,
+        reduce_only: bool = False,
+        cloid: Optional[Cloid] = None,
+    ) -> "Future[Any]":
+        modify: ModifyRequest = {
+            "oid": oid,
+            "order": {
+                "coin": name,
+                "is_buy": is_buy,
+                "sz": sz,
+                "limit_px": limit_px,
+                "order_type": order_type,
+                "reduce_only": reduce_only,
+                "cloid": cloid,
+            },
+        }
+        return self._submit("modify", name, modify)
+
+    def cancel(self, name: str, oid: int) -> "Future[Any]":
+        cancel: CancelRequest = {"coin": name, "oid": oid}
+        return self._submit("cancel", name, cancel)
+
+    def cancel_by_cloid(self, name: str, cloid: Cloid) -> "Future[Any]":
+        cancel: CancelByCloidRequest = {"coin": name, "cloid": cloid}
+        return self._submit("cancelByCloid", name, cancel)
+
+    def _submit(self, kind: str, name: str, request: Any, builder: Optional[BuilderInfo] = None) -> "Future[Any]":
+        # unknown coins fail here rather than failing the whole batch later
+        self.exchange.info.name_to_asset(name)
+        future: "Future[Any]" = Future()
+        key = (kind, _builder_key(builder))
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("OrderBatcher is closed")
+            batch = self.pending.get(key)
+            if batch is None:
+                batch = self.pending[key] = PendingBatch(time.monotonic() + self.window, builder, [], [])
+                self.condition.notify()
+            batch.requests.append(request)
+            batch.futures.append(future)
+            self.requests += 1
+            if len(batch.requests) >= self.max_batch_size:
+                self.condition.notify()
+        return future
+
+    def _due(self) -> List[Tuple[str, PendingBatch]]:
+        now = time.monotonic()
+        keys = [
+            key
+            for key, batch in self.pending.items()
+            if self.closed or batch.deadline <= now or len(batch.requests) >= self.max_batch_size
+        ]
+        keys.sort(key=lambda key: BATCH_KINDS.index(key[0]))
+        return [(key[0], self.pending.pop(key)) for key in keys]
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                due = self._due()
+                while not due:
+                    if self.closed:
+                        return
+                    if self.pending:
+                        deadline = min(batch.deadline for batch in self.pending.values())
+                        self.condition.wait(deadline - time.monotonic())
+                    else:
+                        self.condition.wait()
+                    due = self._due()
+            for kind, batch in due:
+                for start in range(0, len(batch.requests), self.max_batch_size):
+                    end = start + self.max_batch_size
+                    self._send(kind, batch.builder, batch.requests[start:end], batch.futures[start:end])
+
+    def _send(
+        self, kind: str, builder: Optional[BuilderInfo], requests: List[Any], futures: List["Future[Any]"]
+    ) -> None:
+        try:
+            if kind == "order":
+                response = self.exchange.bulk_orders(requests, builder)
+            elif kind == "modify":
+                response = self.exchange.bulk_modify_orders_new(requests)
+            elif kind == "cancel":
+                response = self.exchange.bulk_cancel(requests)
+            else:
+                response = self.exchange.bulk_cancel_by_cloid(requests)
+        except Exception as e:  # pylint: disable=broad-except
+            self._logger.debug("Sending a batch of %d %s requests failed", len(requests), kind, exc_info=True)
+            for future in futures:
+                future.set_exception(e)
+            return
+        with self.condition:
+            self.actions += 1
+        for future, status in zip(futures, _statuses(response, len(requests))):
+            future.set_result(status)
+
+    def stats(self) -> OrderBatcherStats:
+        with self.condition:
+            pending = sum(len(batch.requests) for batch in self.pending.values())
+            return {"pending": pending, "requests": self.requests, "actions": self.actions}
+
+    def close(self) -> None:
+        """Send the pending calls and stop the background thread."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
+
+    def __enter__(self) -> "OrderBatcher":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
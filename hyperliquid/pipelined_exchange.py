@@ -0,0 +1,46 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.utils.order_store import OrderStore
+from hyperliquid.utils.signing import OrderRequest
+from hyperliquid.utils.types import Any, List
+
+
+class PipelinedExchange(Exchange):
+    """Exchange whose action methods return a Future of the response instead of waiting for it.
+
+    Takes the same arguments as Exchange plus `max_in_flight`. Each action is still built, given its nonce and signed
+    in the calling thread, only the POST runs on a pool of max_in_flight threads, so the next action is signed while
+    earlier ones are in flight. Nonces increase in the order the methods are called, the server accepts them in any
+    arrival order as long as they stay within its window of recent nonces. Methods that need a response to continue,
+    e.g. market_close reading the positions, still block on those info requests. Close the pool with close() or by
+    using the instance as a context manager.
+    """
+
+    def __init__(self, *args: Any, max_in_flight: int = 4, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix="exchange-pipeline")
+
+    def _post_action(self, action: Any, signature: Any, nonce: int) -> "Future[Any]":
+        # the payload is built here so that later set_expires_after calls do not affect actions already signed
+        return self.executor.submit(self.post, "/exchange", self._action_payload(action, signature, nonce))
+
+    def _track_order_response(
+        self, order_store: OrderStore, order_requests: List[OrderRequest], response: "Future[Any]"
+    ) -> "Future[Any]":
+        def on_done(future: "Future[Any]") -> None:
+            if future.exception() is None:
+                order_store.on_order_response(order_requests, future.result())
+
+        response.add_done_callback(on_done)
+        return response
+
+    def close(self) -> None:
+        """Wait for the actions in flight and stop the pool."""
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "PipelinedExchange":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
@@ -0,0 +1,180 @@
+import logging
+import queue
+import threading
+from collections import deque
+
+from hyperliquid.utils.types import Any, Callable, Deque, List, Literal, Optional, TypedDict
+
+# What a full subscription queue does with a new message:
+#   block        the websocket thread waits for the callback to catch up, which eventually backpressures the server
+#   drop_oldest  the oldest queued message is discarded
+#   conflate     only the newest message is kept, regardless of the queue size, for channels carrying full state
+OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+OVERFLOW_POLICIES = ("block", "drop_oldest", "conflate")
+
+DispatcherStats = TypedDict(
+    "DispatcherStats",
+    {"queues": int, "depth": int, "max_depth": int, "received": int, "delivered": int, "dropped": int},
+)
+
+
+class SubscriptionQueue:
+    """Bounded queue of the messages of one subscription, delivered to its callback by a Dispatcher worker.
+
+    Instances are callable and stand in for the callback in the websocket manager. Messages of one queue are
+    delivered in order and never concurrently, different queues are drained in parallel by the worker pool.
+    """
+
+    def __init__(
+        self, dispatcher: "Dispatcher", callback: Callable[[Any], None], max_size: int, policy: OverflowPolicy
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {policy!r}, expected one of {', '.join(OVERFLOW_POLICIES)}")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.dispatcher = dispatcher
+        self.callback = callback
+        self.max_size = max_size
+        self.policy = policy
+        self.messages: Deque[Any] = deque()
+        self.condition = threading.Condition()
+        # set while the queue is in the dispatcher's ready queue or being drained by a worker
+        self.scheduled = False
+        self.closed = False
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self.messages)
+
+    def __call__(self, msg: Any) -> None:
+        with self.condition:
+            if self.policy == "block":
+                self.condition.wait_for(lambda: self.closed or len(self.messages) < self.max_size)
+            if self.closed:
+                return
+            self.received += 1
+            if self.policy == "conflate":
+                if self.messages:
+                    self.messages.pop()
+                    self.dropped += 1
+            elif len(self.messages) >= self.max_size:
+                self.messages.popleft()
+                self.dropped += 1
+            self.messages.append(msg)
+            self.max_depth = max(self.max_depth, len(self.messages))
+            if not self.scheduled:
+                self.scheduled = True
+                self.dispatcher.ready.put(self)
+
+    def drain(self, batch_size: int) -> None:
+        """Deliver up to batch_size messages, then hand the queue back so that other subscriptions get a turn."""
+        for _ in range(batch_size):
+            with self.condition:
+                if not self.messages or self.closed:
+                    self.scheduled = False
+                    return
+                msg = self.messages.popleft()
+                self.condition.notify()
+            try:
+                self.callback(msg)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Websocket subscription callback failed")
+            self.delivered += 1
+        with self.condition:
+            if self.messages and not self.closed:
+                self.dispatcher.ready.put(self)
+            else:
+                self.scheduled = False
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.dropped += len(self.messages)
+            self.messages.clear()
+            self.condition.notify_all()
+
+
+class Dispatcher:
+    """Worker pool running websocket subscription callbacks off the websocket thread.
+
+    Pass an instance to Info or WebsocketManager and every subscription gets its own bounded SubscriptionQueue, so a
+    slow callback only delays its own messages. `max_queue_size` and `policy` are the defaults for new subscriptions
+    and can be overridden per subscription. The dispatcher can be shared by several websocket managers and must be
+    stopped by its owner.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        policy: OverflowPolicy = "drop_oldest",
+        batch_size: int = 64,
+    ):
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.batch_size = batch_size
+        self.ready: "queue.SimpleQueue[Optional[SubscriptionQueue]]" = queue.SimpleQueue()
+        self.queues: List[SubscriptionQueue] = []
+        self.lock = threading.Lock()
+        self.threads = [
+            threading.Thread(target=self._work, name=f"hyperliquid-dispatcher-{i}", daemon=True) for i in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def add_queue(
+        self,
+        callback: Callable[[Any], None],
+        max_queue_size: Optional[int] = None,
+        policy: Optional[OverflowPolicy] = None,
+    ) -> SubscriptionQueue:
+        subscription_queue = SubscriptionQueue(
+            self,
+            callback,
+            max_queue_size if max_queue_size is not None else self.max_queue_size,
+            policy if policy is not None else self.policy,
+        )
+        with self.lock:
+            self.queues.append(subscription_queue)
+        return subscription_queue
+
+    def remove_queue(self, subscription_queue: SubscriptionQueue) -> None:
+        subscription_queue.close()
+        with self.lock:
+            if subscription_queue in self.queues:
+                self.queues.remove(subscription_queue)
+
+    def stats(self) -> DispatcherStats:
+        """Totals of the per-queue counters over all live queues."""
+        with self.lock:
+            queues = list(self.queues)
+        return {
+            "queues": len(queues),
+            "depth": sum(q.depth for q in queues),
+            "max_depth": max((q.max_depth for q in queues), default=0),
+            "received": sum(q.received for q in queues),
+            "delivered": sum(q.delivered for q in queues),
+            "dropped": sum(q.dropped for q in queues),
+        }
+
+    def stop(self) -> None:
+        with self.lock:
+            queues, self.queues = self.queues, []
+        for subscription_queue in queues:
+            subscription_queue.close()
+        for _ in self.threads:
+            self.ready.put(None)
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def _work(self) -> None:
+        while True:
+            subscription_queue = self.ready.get()
+            if subscription_queue is None:
+                return
+            subscription_queue.drain(self.batch_size)
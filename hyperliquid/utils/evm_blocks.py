@@ -0,0 +1,237 @@
+"""Columnar indexing of the HyperEVM block files published to s3://hl-[testnet|mainnet]-evm-blocks.
+
+Each <height>.rmp.lz4 file is an lz4 compressed msgpack document holding one block (or a list of blocks). Byte
+fields arrive either as msgpack bin values or as {"type": "Buffer", "data": [...]} objects and integers as big
+endian byte strings. read_evm_block_file turns Buffer objects into bytes while unpacking, so the rest of the code
+only ever sees contiguous bytes, which convert with bytes.hex() and int.from_bytes() in a single call each.
+EvmBlockWriter decodes every field once, keeps byte fields as raw bytes and streams blocks and transactions into two
+Parquet files in row groups of a fixed size, so memory stays flat whatever the block count.
+"""
+
+import time
+
+import msgpack
+
+from hyperliquid.utils.types import Any, Dict, Iterable, Iterator, List, Optional, TypedDict
+
+try:
+    import lz4.frame
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    lz4 = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    pa = None
+    pq = None
+
+IndexStats = TypedDict(
+    "IndexStats",
+    {"blocks": int, "transactions": int, "seconds": float, "blocks_per_second": float, "txs_per_second": float},
+)
+
+BLOCK_BYTES_FIELDS = ["parentHash", "sha3Uncles", "miner", "stateRoot", "transactionsRoot", "receiptsRoot", "extraData"]
+BLOCK_INT_FIELDS = ["number", "gasLimit", "gasUsed", "timestamp", "baseFeePerGas"]
+TX_INT_FIELDS = ["chainId", "nonce", "gas", "gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"]
+
+
+def decode_buffer_object(obj: Dict[Any, Any]) -> Any:
+    """msgpack object_hook turning {"type": "Buffer", "data": [...]} maps into bytes, other maps are kept."""
+    if obj.get("type") == "Buffer" and "data" in obj:
+        return bytes(obj["data"])
+    return obj
+
+
+def buffer_to_bytes(value: Any) -> Optional[bytes]:
+    """The raw bytes of a msgpack bin value or a {"type": "Buffer", "data": [...]} object, None if absent."""
+    if type(value) is bytes or value is None:
+        return value
+    if isinstance(value, dict) and value.get("type") == "Buffer":
+        return bytes(value["data"])
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    raise ValueError("expected a byte buffer", value)
+
+
+def buffer_to_int(value: Any) -> int:
+    """A big endian unsigned integer stored as a byte buffer, 0 if absent."""
+    if type(value) is bytes:
+        return int.from_bytes(value, "big")
+    raw = buffer_to_bytes(value)
+    return int.from_bytes(raw, "big") if raw else 0
+
+
+def buffer_to_hex(value: Any) -> Optional[str]:
+    """The 0x prefixed hex string of a byte buffer, None if absent."""
+    raw = buffer_to_bytes(value)
+    return None if raw is None else "0x" + raw.hex()
+
+
+def buffers_to_hex(data: Any) -> Any:
+    """A copy of decoded block data with every byte buffer replaced by its hex string, e.g. to dump it as JSON."""
+    if isinstance(data, dict):
+        if data.get("type") == "Buffer":
+            return buffer_to_hex(data)
+        return {k: buffers_to_hex(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [buffers_to_hex(item) for item in data]
+    if isinstance(data, (bytes, bytearray)):
+        return "0x" + data.hex()
+    return data
+
+
+def read_evm_block_file(path: str, decode_buffers: bool = True) -> Iterator[Any]:
+    """Yield the blocks of one .rmp or .rmp.lz4 file, decompressing while reading.
+
+    With decode_buffers, Buffer objects are already bytes in the yielded blocks.
+    """
+    if path.endswith(".lz4"):
+        if lz4 is None:
+            raise ImportError("reading .lz4 block files requires lz4, install it with `pip install lz4`")
+        f = lz4.frame.open(path, "rb")
+    else:
+        f = open(path, "rb")
+    with f:
+        object_hook = decode_buffer_object if decode_buffers else None
+        for data in msgpack.Unpacker(f, raw=False, strict_map_key=False, object_hook=object_hook):
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
+
+
+def _block_schema() -> Any:
+    binary_fields = ["hash"] + BLOCK_BYTES_FIELDS
+    return pa.schema(
+        [(field, pa.binary()) for field in binary_fields]
+        + [(field, pa.uint64()) for field in BLOCK_INT_FIELDS]
+        + [("transactionCount", pa.uint32())]
+    )
+
+
+def _transaction_schema() -> Any:
+    return pa.schema(
+        [
+            ("blockNumber", pa.uint64()),
+            ("index", pa.uint32()),
+            ("type", pa.string()),
+            ("to", pa.binary()),
+            # wei amounts do not fit in 64 bits, they are kept as big endian bytes
+            ("value", pa.binary()),
+            ("input", pa.binary()),
+            ("signature", pa.list_(pa.binary())),
+            # msgpack of the access list entries of Eip1559 transactions
+            ("accessList", pa.binary()),
+        ]
+        + [(field, pa.uint64()) for field in TX_INT_FIELDS]
+    )
+
+
+class EvmBlockWriter:
+    """Streams decoded EVM blocks into <prefix>blocks.parquet and <prefix>transactions.parquet.
+
+    Rows are buffered per column and written as a row group every `row_group_size` rows. Use as a context manager
+    or call close() to flush the last row groups and finish the files.
+    """
+
+    def __init__(self, prefix: str, row_group_size: int = 10_000):
+        if pa is None:
+            raise ImportError("writing columnar block files requires pyarrow, install it with `pip install pyarrow`")
+        self.row_group_size = row_group_size
+        self.block_schema = _block_schema()
+        self.transaction_schema = _transaction_schema()
+        self.block_writer = pq.ParquetWriter(f"{prefix}blocks.parquet", self.block_schema)
+        self.transaction_writer = pq.ParquetWriter(f"{prefix}transactions.parquet", self.transaction_schema)
+        self.block_columns: Dict[str, List[Any]] = {name: [] for name in self.block_schema.names}
+        self.transaction_columns: Dict[str, List[Any]] = {name: [] for name in self.transaction_schema.names}
+        self.blocks = 0
+        self.transactions = 0
+        self.started = time.perf_counter()
+
+    def __enter__(self) -> "EvmBlockWriter":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def add_block(self, block_data: Any) -> None:
+        if not isinstance(block_data, dict) or "block" not in block_data:
+            raise ValueError("invalid block format")
+        reth_block = block_data["block"]["Reth115"]
+        header = reth_block.get("header", {}).get("header", {})
+        transactions = reth_block.get("body", {}).get("transactions", [])
+        number = buffer_to_int(header.get("number"))
+
+        columns = self.block_columns
+        columns["hash"].append(buffer_to_bytes(reth_block["header"].get("hash")))
+        for field in BLOCK_BYTES_FIELDS:
+            columns[field].append(buffer_to_bytes(header.get(field)))
+        for field in BLOCK_INT_FIELDS:
+            columns[field].append(buffer_to_int(header.get(field)))
+        columns["transactionCount"].append(len(transactions))
+        for index, tx in enumerate(transactions):
+            self._add_transaction(number, index, tx)
+
+        self.blocks += 1
+        if len(columns["hash"]) >= self.row_group_size:
+            self._flush_blocks()
+
+    def _add_transaction(self, block_number: int, index: int, tx: Dict[str, Any]) -> None:
+        tx_data = tx.get("transaction")
+        if not tx_data:
+            return
+        tx_type = next(iter(tx_data))  # Either 'Legacy' or 'Eip1559'
+        tx_content = tx_data[tx_type]
+        columns = self.transaction_columns
+        columns["blockNumber"].append(block_number)
+        columns["index"].append(index)
+        columns["type"].append(tx_type)
+        columns["to"].append(buffer_to_bytes(tx_content.get("to")))
+        columns["value"].append(buffer_to_bytes(tx_content.get("value")))
+        columns["input"].append(buffer_to_bytes(tx_content.get("input")))
+        columns["signature"].append([buffer_to_bytes(part) for part in tx.get("signature", [])])
+        access_list = tx_content.get("accessList")
+        columns["accessList"].append(msgpack.packb(access_list) if access_list else None)
+        for field in TX_INT_FIELDS:
+            columns[field].append(buffer_to_int(tx_content[field]) if field in tx_content else None)
+
+        self.transactions += 1
+        if len(columns["blockNumber"]) >= self.row_group_size:
+            self._flush_transactions()
+
+    def _flush_blocks(self) -> None:
+        if self.block_columns["hash"]:
+            self.block_writer.write_batch(pa.record_batch(list(self.block_columns.values()), schema=self.block_schema))
+            self.block_columns = {name: [] for name in self.block_schema.names}
+
+    def _flush_transactions(self) -> None:
+        if self.transaction_columns["blockNumber"]:
+            batch = pa.record_batch(list(self.transaction_columns.values()), schema=self.transaction_schema)
+            self.transaction_writer.write_batch(batch)
+            self.transaction_columns = {name: [] for name in self.transaction_schema.names}
+
+    def stats(self) -> IndexStats:
+        seconds = time.perf_counter() - self.started
+        return {
+            "blocks": self.blocks,
+            "transactions": self.transactions,
+            "seconds": seconds,
+            "blocks_per_second": self.blocks / seconds if seconds else 0.0,
+            "txs_per_second": self.transactions / seconds if seconds else 0.0,
+        }
+
+    def close(self) -> None:
+        self._flush_blocks()
+        self._flush_transactions()
+        self.block_writer.close()
+        self.transaction_writer.close()
+
+
+def index_evm_block_files(paths: Iterable[str], prefix: str, row_group_size: int = 10_000) -> IndexStats:
+    """Index the blocks of the given files, in order, into <prefix>blocks.parquet and <prefix>transactions.parquet."""
+    with EvmBlockWriter(prefix, row_group_size) as writer:
+        for path in paths:
+            for block_data in read_evm_block_file(path):
+                writer.add_block(block_data)
+    return writer.stats()
@@ -0,0 +1,16 @@
+from concurrent.futures import Executor
+
+from hyperliquid.utils.types import Any, Callable, Iterable, Iterator, Optional
+
+
+def map_on(
+    executor: Optional[Executor], fn: Callable[..., Any], *iterables: Iterable[Any], chunksize: int = 1
+) -> Iterator[Any]:
+    """map(fn, *iterables) on `executor`, or lazily in this process if it is None.
+
+    The helpers that accept an executor only fan work out when the caller passes one, e.g. a ProcessPoolExecutor
+    reused across calls. Starting a pool per call costs more than the work it would spread in the common cases.
+    """
+    if executor is None:
+        return map(fn, *iterables)
+    return executor.map(fn, *iterables, chunksize=chunksize)
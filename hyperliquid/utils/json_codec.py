@@ -0,0 +1,81 @@
+import json
+
+from hyperliquid.utils.types import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    msgspec = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """JSON encoder/decoder used by the REST and websocket clients, backed by the standard library.
+
+    `loads` accepts str or bytes and raises ValueError on malformed input, `dumps` returns compact UTF-8 bytes.
+    Subclasses swap in a faster backend without changing either contract.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("the orjson codec requires orjson, install it with `pip install orjson`")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("the msgspec codec requires msgspec, install it with `pip install msgspec`")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+JSON_CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+DEFAULT_JSON_CODEC = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+
+def get_json_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """Resolve a codec name ("json", "orjson" or "msgspec") or instance to a JsonCodec.
+
+    None picks the fastest installed backend: orjson, then msgspec, then the standard library.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        codec = DEFAULT_JSON_CODEC
+    if codec not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}, expected one of {', '.join(JSON_CODECS)}")
+    return JSON_CODECS[codec]()
@@ -0,0 +1,133 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from hyperliquid.utils.types import Any, L2BookData, List, Optional, Side, Tuple, Union
+
+
+class BookSide:
+    """One side of a LocalBook, stored best-first in compact float arrays.
+
+    `keys` is the ascending search key used for bisection: the price for asks and the negated price for bids.
+    Cumulative size and notional are built lazily on the first depth query and reused until the next update.
+    """
+
+    __slots__ = ("px", "sz", "n", "keys", "_cum_sz", "_cum_ntl")
+
+    def __init__(self, levels: List[Any], is_bid: bool):
+        # levels are L2Level dicts, or L2Level Structs from TypedMessageDecoder which are already numeric
+        px: List[float]
+        sz: List[float]
+        n: List[int]
+        if levels and not isinstance(levels[0], dict):
+            px = [level.px for level in levels]
+            sz = [level.sz for level in levels]
+            n = [level.n for level in levels]
+        else:
+            px = [float(level["px"]) for level in levels]
+            sz = [float(level["sz"]) for level in levels]
+            n = [level["n"] for level in levels]
+        self.px = array("d", px)
+        self.sz = array("d", sz)
+        self.n = array("l", n)
+        self.keys = array("d", [-px for px in self.px]) if is_bid else self.px
+        self._cum_sz: Optional["array[float]"] = None
+        self._cum_ntl: Optional["array[float]"] = None
+
+    def __len__(self) -> int:
+        return len(self.px)
+
+    def cumulative(self) -> Tuple["array[float]", "array[float]"]:
+        if self._cum_sz is None or self._cum_ntl is None:
+            self._cum_sz = array("d", accumulate(self.sz))
+            self._cum_ntl = array("d", accumulate(px * sz for px, sz in zip(self.px, self.sz)))
+        return self._cum_sz, self._cum_ntl
+
+
+class LocalBook:
+    """Numeric L2 book for a single coin, maintained from l2_snapshot responses and l2Book websocket messages.
+
+    Every l2Book message carries the full top of book, so an update replaces both sides at once. Updates older than
+    the book's current time are ignored, which makes it safe to seed the book from Info.l2_snapshot after the
+    websocket subscription was made. Both sides are swapped in a single assignment, so readers on other threads
+    always see a consistent book without locking.
+    """
+
+    def __init__(self, coin: str):
+        self.coin = coin
+        self.time = -1
+        self._sides = (BookSide([], True), BookSide([], False))
+
+    def apply_snapshot(self, data: Union[L2BookData, Any]) -> bool:
+        """Replace the book with an l2_snapshot response, or the data of an l2Book message (dict or Struct)."""
+        if isinstance(data, dict):
+            time, (bids, asks) = data["time"], data["levels"]
+        else:
+            time, (bids, asks) = data.time, data.levels
+        if time < self.time:
+            return False
+        self._sides = (BookSide(bids, True), BookSide(asks, False))
+        self.time = time
+        return True
+
+    def on_message(self, ws_msg: Any) -> None:
+        self.apply_snapshot(ws_msg["data"] if isinstance(ws_msg, dict) else ws_msg.data)
+
+    def side(self, side: Side) -> BookSide:
+        return self._sides[0] if side == "B" else self._sides[1]
+
+    def best_bid(self) -> Optional[float]:
+        bids = self._sides[0]
+        return bids.px[0] if len(bids) else None
+
+    def best_ask(self) -> Optional[float]:
+        asks = self._sides[1]
+        return asks.px[0] if len(asks) else None
+
+    def mid(self) -> Optional[float]:
+        bids, asks = self._sides
+        if not len(bids) or not len(asks):
+            return None
+        return (bids.px[0] + asks.px[0]) / 2
+
+    def depth_at_price(self, side: Side, px: float) -> float:
+        """Size resting at exactly px on the given side, 0 if there is no such level."""
+        book_side = self.side(side)
+        key = -px if side == "B" else px
+        i = bisect_left(book_side.keys, key)
+        if i < len(book_side) and book_side.px[i] == px:
+            return book_side.sz[i]
+        return 0.0
+
+    def depth_through_price(self, side: Side, px: float) -> float:
+        """Total size on the given side at px or better."""
+        book_side = self.side(side)
+        i = bisect_right(book_side.keys, -px if side == "B" else px)
+        if i == 0:
+            return 0.0
+        cum_sz, _ = book_side.cumulative()
+        return cum_sz[i - 1]
+
+    def cumulative_depth(self, side: Side, notional: float) -> float:
+        """Size that can be taken from the given side, best level first, without exceeding notional."""
+        book_side = self.side(side)
+        cum_sz, cum_ntl = book_side.cumulative()
+        i = bisect_right(cum_ntl, notional)
+        sz = cum_sz[i - 1] if i > 0 else 0.0
+        if i < len(book_side):
+            filled_ntl = cum_ntl[i - 1] if i > 0 else 0.0
+            sz += (notional - filled_ntl) / book_side.px[i]
+        return sz
+
+    def vwap(self, side: Side, sz: float) -> Optional[float]:
+        """Average price of taking sz from the given side, None if the visible book is not deep enough."""
+        if sz <= 0:
+            return None
+        book_side = self.side(side)
+        cum_sz, cum_ntl = book_side.cumulative()
+        i = bisect_left(cum_sz, sz)
+        if i == len(book_side):
+            return None
+        filled_sz = cum_sz[i - 1] if i > 0 else 0.0
+        filled_ntl = cum_ntl[i - 1] if i > 0 else 0.0
+        return (filled_ntl + (sz - filled_sz) * book_side.px[i]) / sz
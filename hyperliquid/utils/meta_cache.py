@@ -0,0 +1,84 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from hyperliquid.utils.types import Dict, List, Optional, TypedDict
+
+AssetTables = TypedDict(
+    "AssetTables",
+    {"coin_to_asset": Dict[str, int], "name_to_coin": Dict[str, str], "asset_to_sz_decimals": Dict[int, int]},
+)
+
+
+class MetaCache:
+    """On-disk cache of the asset tables Info builds from spot_meta, perp_dexs and meta.
+
+    `directory` holds one file per entry, keyed by API url and the list of perp dexs. Entries are stamped with the
+    cache format version and the time they were written, and ignored once older than `ttl` seconds (pass ttl=None to
+    never expire). Each entry is written to a temporary file that is atomically renamed, and no write reads another
+    entry, so many processes can share one directory without corrupting or dropping each other's entries.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: str, ttl: Optional[float] = 24 * 60 * 60):
+        self.directory = directory
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(base_url: str, perp_dexs: Optional[List[str]]) -> str:
+        return base_url + "|" + ",".join(perp_dexs if perp_dexs is not None else [""])
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+    def load(self, base_url: str, perp_dexs: Optional[List[str]]) -> Optional[AssetTables]:
+        key = self._key(base_url, perp_dexs)
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != self.VERSION or entry.get("key") != key:
+            return None
+        if self.ttl is not None and time.time() - entry["time"] > self.ttl:
+            return None
+        return {
+            "coin_to_asset": entry["coin_to_asset"],
+            "name_to_coin": entry["name_to_coin"],
+            # json object keys are always strings
+            "asset_to_sz_decimals": {
+                int(asset): sz_decimals for asset, sz_decimals in entry["asset_to_sz_decimals"].items()
+            },
+        }
+
+    def store(self, base_url: str, perp_dexs: Optional[List[str]], tables: AssetTables) -> None:
+        key = self._key(base_url, perp_dexs)
+        entry = {"version": self.VERSION, "key": key, "time": time.time(), **tables}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".meta_cache")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            logging.warning(f"Could not write metadata cache entry to {self.directory}", exc_info=True)
+
+    def invalidate(self, base_url: Optional[str] = None, perp_dexs: Optional[List[str]] = None) -> None:
+        """Drop the entry for base_url and perp_dexs, or every entry if base_url is None."""
+        if base_url is not None:
+            paths = [self._path(self._key(base_url, perp_dexs))]
+        else:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            paths = [os.path.join(self.directory, name) for name in names if name.endswith(".json")]
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,313 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from hyperliquid.utils.signing import get_timestamp_ms
+from hyperliquid.utils.types import Any, Callable, Cloid, Dict, Iterable, List, Optional, Set, Union
+
+# Order statuses after which an order no longer rests on the book. orderUpdates reports "filled", "canceled",
+# "rejected" and reasons such as "marginCanceled", every status other than these is terminal.
+LIVE_STATUSES = ("open", "triggered")
+# Status of a live order that a reconciliation did not find among the open orders and no update explained
+MISSING = "missing"
+
+
+def coin_dex(coin: str) -> str:
+    """The perp dex a coin trades on, "" for the default dex and spot."""
+    return coin.split(":", 1)[0] if ":" in coin else ""
+
+
+class TrackedOrder:
+    """Latest known state of one order. sz is the remaining size, orig_sz the size the order was placed with.
+
+    The remaining size is the smaller of the size last reported by an orderUpdates message, exchange response or
+    reconciliation and orig_sz less the fills seen since, so a fill that a report already reflects is not counted
+    twice. Fills are counted once per tid.
+    """
+
+    __slots__ = (
+        "oid",
+        "cloid",
+        "coin",
+        "side",
+        "limit_px",
+        "reported_sz",
+        "orig_sz",
+        "fill_sz",
+        "fill_tids",
+        "status",
+        "updated",
+    )
+
+    def __init__(
+        self,
+        oid: int,
+        cloid: Optional[str],
+        coin: str,
+        side: str,
+        limit_px: float,
+        sz: float,
+        orig_sz: float,
+        status: str,
+    ):
+        self.oid = oid
+        self.cloid = cloid
+        self.coin = coin
+        self.side = side
+        self.limit_px = limit_px
+        self.reported_sz = sz
+        self.orig_sz = orig_sz
+        self.fill_sz = 0.0
+        self.fill_tids: Set[int] = set()
+        self.status = status
+        # local time in milliseconds of the last change, used to tell stale snapshots apart
+        self.updated = get_timestamp_ms()
+
+    @property
+    def is_live(self) -> bool:
+        return self.status in LIVE_STATUSES
+
+    @property
+    def sz(self) -> float:
+        return max(min(self.reported_sz, self.orig_sz - self.fill_sz), 0.0)
+
+    @property
+    def filled_sz(self) -> float:
+        return self.orig_sz - self.sz
+
+    def __repr__(self) -> str:
+        return (
+            f"TrackedOrder(oid={self.oid}, cloid={self.cloid}, coin={self.coin}, side={self.side}, "
+            f"limit_px={self.limit_px}, sz={self.sz}, orig_sz={self.orig_sz}, status={self.status})"
+        )
+
+
+def _cloid_key(cloid: Union[Cloid, str, None]) -> Optional[str]:
+    return cloid.to_raw() if isinstance(cloid, Cloid) else cloid
+
+
+class OrderStore:
+    """Open orders of one user, indexed by oid, cloid and coin, kept up to date from websocket messages.
+
+    Feed it orderUpdates messages (on_order_updates), userFills messages (on_user_fills, dicts or the Structs of
+    typed_messages) and the responses of Exchange.bulk_orders (on_order_response), and periodically the result of
+    Info.frontend_open_orders (reconcile), which catches updates lost while the websocket was down. Info.order_store
+    wires up the websocket channels and the reconciliation, setting Exchange.order_store to the store feeds it the
+    responses. Lookups are dict reads and never block on the websocket thread.
+
+    An order that reached a terminal status never becomes live again, whatever the order in which the exchange
+    response, the websocket and a reconciliation report it. The most recent `max_terminal_orders` terminal orders are
+    kept for lookups, older ones are evicted, so memory is bounded by the number of live orders.
+    """
+
+    def __init__(self, max_terminal_orders: int = 1000):
+        self.max_terminal_orders = max_terminal_orders
+        self.orders: Dict[int, TrackedOrder] = {}
+        self.cloids: Dict[str, TrackedOrder] = {}
+        self.live_by_coin: Dict[str, Dict[int, TrackedOrder]] = {}
+        self.terminal: "OrderedDict[int, TrackedOrder]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._logger = logging.getLogger(__name__)
+
+    def get(self, oid: int) -> Optional[TrackedOrder]:
+        return self.orders.get(oid)
+
+    def get_by_cloid(self, cloid: Union[Cloid, str]) -> Optional[TrackedOrder]:
+        return self.cloids.get(cloid.to_raw() if isinstance(cloid, Cloid) else cloid)
+
+    def live_orders(self, coin: Optional[str] = None) -> List[TrackedOrder]:
+        """The live orders of a coin, or of every coin."""
+        if coin is not None:
+            return list(self.live_by_coin.get(coin, {}).values())
+        return [order for orders in list(self.live_by_coin.values()) for order in list(orders.values())]
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def _upsert(
+        self,
+        oid: int,
+        cloid: Optional[str],
+        coin: str,
+        side: str,
+        limit_px: float,
+        sz: float,
+        orig_sz: float,
+        status: str,
+    ) -> TrackedOrder:
+        order = self.orders.get(oid)
+        if order is None:
+            order = TrackedOrder(oid, cloid, coin, side, limit_px, sz, orig_sz, status)
+            self.orders[oid] = order
+            if cloid is not None:
+                self.cloids[cloid] = order
+        elif order.is_live:
+            if cloid is not None and order.cloid is None:
+                order.cloid = cloid
+                self.cloids[cloid] = order
+            if orig_sz != order.orig_sz:
+                # the order was modified, its earlier fills are part of the new reported size
+                order.orig_sz = orig_sz
+                order.fill_sz = 0.0
+                order.fill_tids.clear()
+            order.limit_px = limit_px
+            order.reported_sz = sz
+            order.status = status
+            order.updated = get_timestamp_ms()
+        else:
+            return order
+        self._index(order)
+        return order
+
+    def _index(self, order: TrackedOrder) -> None:
+        if order.is_live:
+            self.live_by_coin.setdefault(order.coin, {})[order.oid] = order
+            return
+        live = self.live_by_coin.get(order.coin)
+        if live is not None:
+            live.pop(order.oid, None)
+            if not live:
+                del self.live_by_coin[order.coin]
+        self.terminal[order.oid] = order
+        while len(self.terminal) > self.max_terminal_orders:
+            _, evicted = self.terminal.popitem(last=False)
+            del self.orders[evicted.oid]
+            if evicted.cloid is not None and self.cloids.get(evicted.cloid) is evicted:
+                del self.cloids[evicted.cloid]
+
+    def _set_status(self, order: TrackedOrder, status: str) -> None:
+        if order.is_live and status != order.status:
+            order.status = status
+            order.updated = get_timestamp_ms()
+            self._index(order)
+
+    def on_order_updates(self, ws_msg: Any) -> None:
+        """Apply an orderUpdates message, whose data is a list of {"order": ..., "status": ...} updates."""
+        with self._lock:
+            for update in ws_msg["data"]:
+                order = update["order"]
+                self._upsert(
+                    order["oid"],
+                    order.get("cloid"),
+                    order["coin"],
+                    order["side"],
+                    float(order["limitPx"]),
+                    float(order["sz"]),
+                    float(order["origSz"]),
+                    update["status"],
+                )
+
+    def on_user_fills(self, ws_msg: Any) -> None:
+        """Reduce the remaining size of the filled orders. The snapshot sent on subscribing is ignored, it only
+        repeats fills that the open orders already reflect."""
+        data = ws_msg["data"] if isinstance(ws_msg, dict) else ws_msg.data
+        if data.get("isSnapshot", False) if isinstance(data, dict) else data.is_snapshot:
+            return
+        with self._lock:
+            for fill in data["fills"] if isinstance(data, dict) else data.fills:
+                if isinstance(fill, dict):
+                    oid, tid, sz = fill["oid"], fill["tid"], float(fill["sz"])
+                else:
+                    oid, tid, sz = fill.oid, fill.tid, fill.sz
+                order = self.orders.get(oid)
+                if order is None or not order.is_live or tid in order.fill_tids:
+                    continue
+                order.fill_tids.add(tid)
+                order.fill_sz += sz
+                order.updated = get_timestamp_ms()
+                if order.sz == 0:
+                    self._set_status(order, "filled")
+
+    def on_order_response(self, order_requests: Iterable[Any], response: Any) -> None:
+        """Record the orders of an Exchange.order / bulk_orders call from its response.
+
+        order_requests are the OrderRequest dicts that were sent, in the same order as the response's statuses.
+        """
+        if not isinstance(response, dict) or response.get("status") != "ok":
+            return
+        statuses = response["response"]["data"]["statuses"]
+        with self._lock:
+            for request, status in zip(order_requests, statuses):
+                if not isinstance(status, dict):
+                    continue
+                cloid = _cloid_key(request.get("cloid"))
+                side = "B" if request["is_buy"] else "A"
+                limit_px, sz = float(request["limit_px"]), float(request["sz"])
+                if "resting" in status:
+                    self._upsert(status["resting"]["oid"], cloid, request["coin"], side, limit_px, sz, sz, "open")
+                elif "filled" in status:
+                    self._upsert(status["filled"]["oid"], cloid, request["coin"], side, limit_px, 0.0, sz, "filled")
+
+    def reconcile(self, open_orders: List[Any], as_of: int, dexs: Optional[Iterable[str]] = None) -> None:
+        """Bring the store in line with an Info.open_orders / frontend_open_orders result fetched at `as_of`.
+
+        Orders that have not changed since as_of are updated from the result, or get the status "missing" if they
+        are live but not in it. Orders the store does not know yet are added, unless already terminal. `dexs` are the
+        perp dexs whose open orders the result covers ("" also covers spot), by default only the default dex, and
+        orders of other dexs are never marked missing.
+        """
+        covered = set(dexs) if dexs is not None else {""}
+        with self._lock:
+            seen = set()
+            for order in open_orders:
+                seen.add(order["oid"])
+                known = self.orders.get(order["oid"])
+                if known is not None and known.updated >= as_of:
+                    continue
+                sz = float(order["sz"])
+                self._upsert(
+                    order["oid"],
+                    order.get("cloid"),
+                    order["coin"],
+                    order["side"],
+                    float(order["limitPx"]),
+                    sz,
+                    float(order.get("origSz", sz)),
+                    "open",
+                )
+            for order in self.live_orders():
+                if order.oid not in seen and order.updated < as_of and coin_dex(order.coin) in covered:
+                    self._set_status(order, MISSING)
+
+    def start_reconciliation(
+        self, fetch_open_orders: Callable[[], List[Any]], interval: float, dexs: Optional[Iterable[str]] = None
+    ) -> None:
+        """Reconcile with fetch_open_orders() on a background thread until stop().
+
+        The thread reconciles every `interval` seconds (never if it is 0) and whenever request_reconciliation() is
+        called, so callers such as websocket reconnect callbacks never wait for the request.
+        """
+
+        def run() -> None:
+            while True:
+                self._wake.wait(interval or None)
+                if self._stop.is_set():
+                    return
+                self._wake.clear()
+                self.reconcile_with(fetch_open_orders, dexs)
+
+        self._stop.clear()
+        threading.Thread(target=run, name="order-store-reconcile", daemon=True).start()
+
+    def request_reconciliation(self) -> None:
+        """Have the thread started by start_reconciliation reconcile now."""
+        self._wake.set()
+
+    def reconcile_with(self, fetch_open_orders: Callable[[], List[Any]], dexs: Optional[Iterable[str]] = None) -> None:
+        as_of = get_timestamp_ms()
+        try:
+            open_orders = fetch_open_orders()
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("Fetching open orders to reconcile the order store failed")
+            return
+        self.reconcile(open_orders, as_of, dexs)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
@@ -0,0 +1,121 @@
+import math
+from bisect import bisect_right
+
+from hyperliquid.utils.types import Any, Dict, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    np = None  # type: ignore[assignment]
+
+# Prices have at most 5 significant figures and at most MAX_DECIMALS - szDecimals decimals, integer prices are
+# always valid. Sizes have at most szDecimals decimals.
+PX_SIG_FIGS = 5
+PERP_MAX_DECIMALS = 6
+SPOT_MAX_DECIMALS = 8
+
+# 10.0**e for e in [-POWERS_OFFSET, POWERS_OFFSET], searched to find the decimal exponent of a price
+POWERS_OFFSET = 12
+POWERS = [10.0**e for e in range(-POWERS_OFFSET, POWERS_OFFSET + 1)]
+
+
+def px_decimals(px: float, max_decimals: int) -> int:
+    """Number of decimals a price of this magnitude may have on the wire."""
+    ax = px if px >= 0 else -px
+    if ax == 0:
+        return 0
+    if POWERS[0] <= ax < POWERS[-1]:
+        exponent = bisect_right(POWERS, ax) - 1 - POWERS_OFFSET
+    else:
+        exponent = math.floor(math.log10(ax))
+        # log10 can be off by one next to powers of ten
+        if 10.0**exponent > ax:
+            exponent -= 1
+        elif 10.0 ** (exponent + 1) <= ax:
+            exponent += 1
+    # plain comparisons, min() and max() are noticeably slower on this hot path
+    decimals = PX_SIG_FIGS - 1 - exponent
+    if decimals > max_decimals:
+        return max_decimals
+    return decimals if decimals > 0 else 0
+
+
+def ticks_to_wire(ticks: int, decimals: int) -> str:
+    """Wire string of ticks * 10**-decimals, the same string float_to_wire produces for that value."""
+    if decimals == 0 or ticks == 0:
+        return str(ticks)
+    sign = "-" if ticks < 0 else ""
+    digits = str(abs(ticks)).rjust(decimals + 1, "0")
+    whole, frac = digits[:-decimals], digits[-decimals:].rstrip("0")
+    return f"{sign}{whole}.{frac}" if frac else sign + whole
+
+
+class Quantizer:
+    """Rounds order prices and sizes to the tick and lot sizes the exchange accepts for each asset.
+
+    Built from Info.asset_to_sz_decimals (the dict is referenced, not copied). Values are rounded half to even as
+    integer numbers of ticks, so the results always survive float_to_wire, and px_to_wire / sz_to_wire format the
+    ticks directly. The *_array methods apply the same rounding to whole NumPy arrays, e.g. a ladder of orders.
+    """
+
+    def __init__(self, asset_to_sz_decimals: Dict[int, int]):
+        self.asset_to_sz_decimals = asset_to_sz_decimals
+
+    def max_px_decimals(self, asset: int) -> int:
+        # spot assets start at 10000, builder-deployed perp dexs at 110000
+        max_decimals = SPOT_MAX_DECIMALS if 10_000 <= asset < 100_000 else PERP_MAX_DECIMALS
+        return max_decimals - self.asset_to_sz_decimals[asset]
+
+    def px_ticks(self, asset: int, px: float) -> Tuple[int, int]:
+        """The price as (ticks, decimals), i.e. px ~= ticks * 10**-decimals."""
+        if not math.isfinite(px):
+            raise ValueError("cannot quantize a non-finite number", px)
+        decimals = px_decimals(px, self.max_px_decimals(asset))
+        return round(px * POWERS[POWERS_OFFSET + decimals]), decimals
+
+    def sz_ticks(self, asset: int, sz: float) -> Tuple[int, int]:
+        """The size as (lots, decimals), i.e. sz ~= lots * 10**-decimals."""
+        if not math.isfinite(sz):
+            raise ValueError("cannot quantize a non-finite number", sz)
+        decimals = self.asset_to_sz_decimals[asset]
+        return round(sz * POWERS[POWERS_OFFSET + decimals]), decimals
+
+    def round_px(self, asset: int, px: float) -> float:
+        ticks, decimals = self.px_ticks(asset, px)
+        return ticks / POWERS[POWERS_OFFSET + decimals]
+
+    def round_sz(self, asset: int, sz: float) -> float:
+        lots, decimals = self.sz_ticks(asset, sz)
+        return lots / POWERS[POWERS_OFFSET + decimals]
+
+    def px_to_wire(self, asset: int, px: float) -> str:
+        return ticks_to_wire(*self.px_ticks(asset, px))
+
+    def sz_to_wire(self, asset: int, sz: float) -> str:
+        return ticks_to_wire(*self.sz_ticks(asset, sz))
+
+    def round_px_array(self, asset: int, px: Any) -> Any:
+        """round_px over an array of prices, returns a float64 array."""
+        px = _as_finite_array(px)
+        ax = np.abs(px)
+        exponent = np.floor(np.log10(np.where(ax == 0, 1.0, ax)))
+        exponent -= 10.0**exponent > ax
+        exponent += 10.0 ** (exponent + 1) <= ax
+        decimals = np.clip(PX_SIG_FIGS - 1 - exponent, 0, self.max_px_decimals(asset))
+        decimals[ax == 0] = 0
+        scale = 10.0**decimals
+        return np.round(px * scale) / scale
+
+    def round_sz_array(self, asset: int, sz: Any) -> Any:
+        """round_sz over an array of sizes, returns a float64 array."""
+        scale = 10.0 ** self.asset_to_sz_decimals[asset]
+        return np.round(_as_finite_array(sz) * scale) / scale
+
+
+def _as_finite_array(values: Any) -> Any:
+    if np is None:
+        raise ImportError("the vectorized quantizer requires numpy, install it with `pip install numpy`")
+    array = np.array(values, dtype=np.float64, ndmin=1)
+    if not np.isfinite(array).all():
+        raise ValueError("cannot quantize non-finite numbers")
+    return array
@@ -0,0 +1,174 @@
+import heapq
+import itertools
+import threading
+import time
+
+from hyperliquid.utils.types import Any, List, Tuple, TypedDict
+
+# Hyperliquid allows each IP an aggregated weight of 1200 per minute over /info and /exchange
+DEFAULT_WEIGHT_PER_MINUTE = 1200
+
+# /info request weights by request type, every other type weighs DEFAULT_INFO_WEIGHT
+INFO_WEIGHTS = {
+    "l2Book": 2,
+    "allMids": 2,
+    "clearinghouseState": 2,
+    "orderStatus": 2,
+    "spotClearinghouseState": 2,
+    "exchangeStatus": 2,
+    "userRole": 60,
+}
+DEFAULT_INFO_WEIGHT = 20
+
+# Request types that additionally weigh 1 per this many items of the response
+RESPONSE_ITEMS_PER_WEIGHT = {
+    "recentTrades": 20,
+    "historicalOrders": 20,
+    "userFills": 20,
+    "userFillsByTime": 20,
+    "fundingHistory": 20,
+    "userFunding": 20,
+    "nonUserFundingUpdates": 20,
+    "twapHistory": 20,
+    "userTwapSliceFills": 20,
+    "userTwapSliceFillsByTime": 20,
+    "delegatorHistory": 20,
+    "delegatorRewards": 20,
+    "validatorStats": 20,
+    "candleSnapshot": 60,
+}
+
+# An /exchange action weighs 1 plus 1 per this many orders or cancels in its batch
+EXCHANGE_BATCH_PER_WEIGHT = 40
+
+# Waiting requests are sent lowest priority first: cancels, then other exchange actions, then info requests
+PRIORITY_CANCEL = 0
+PRIORITY_EXCHANGE = 1
+PRIORITY_INFO = 2
+CANCEL_ACTIONS = ("cancel", "cancelByCloid", "scheduleCancel")
+
+RateLimiterStats = TypedDict(
+    "RateLimiterStats", {"depth": int, "max_depth": int, "acquired": int, "weight": int, "waited": float}
+)
+
+
+def _batch_length(action: Any) -> int:
+    for key in ("orders", "cancels", "modifies"):
+        if key in action:
+            return len(action[key])
+    return 1
+
+
+def request_weight(url_path: str, payload: Any) -> int:
+    """The weight Hyperliquid charges for a request before looking at its response."""
+    if url_path == "/exchange":
+        return 1 + _batch_length(payload["action"]) // EXCHANGE_BATCH_PER_WEIGHT
+    return INFO_WEIGHTS.get(payload.get("type"), DEFAULT_INFO_WEIGHT)
+
+
+def response_weight(url_path: str, payload: Any, response: Any) -> int:
+    """The weight charged on top of request_weight for the number of items in the response."""
+    if url_path == "/exchange" or not isinstance(response, list):
+        return 0
+    items_per_weight = RESPONSE_ITEMS_PER_WEIGHT.get(payload.get("type"))
+    return len(response) // items_per_weight if items_per_weight else 0
+
+
+def request_priority(url_path: str, payload: Any) -> int:
+    if url_path != "/exchange":
+        return PRIORITY_INFO
+    return PRIORITY_CANCEL if payload["action"]["type"] in CANCEL_ACTIONS else PRIORITY_EXCHANGE
+
+
+class RateLimiter:
+    """Token bucket holding request weight, shared by every client that sends requests from the same IP.
+
+    The bucket holds up to `burst` weight (by default a minute's worth) and refills at weight_per_minute / 60 per
+    second. acquire() blocks until the request's weight is available. Waiting requests are served strictly in
+    (priority, arrival) order, so a queued cancel is sent before any queued order or info request, even when a
+    lighter request behind it would already fit. Configure it somewhat below the server's limits: the server counts
+    each request a network delay later than the limiter does.
+    """
+
+    def __init__(self, weight_per_minute: float = DEFAULT_WEIGHT_PER_MINUTE, burst: float = 0):
+        if weight_per_minute <= 0:
+            raise ValueError("weight_per_minute must be positive")
+        self.rate = weight_per_minute / 60
+        self.capacity = burst or weight_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.condition = threading.Condition()
+        self.waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self.max_depth = 0
+        self.acquired = 0
+        self.weight = 0
+        self.waited = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting for weight."""
+        return len(self.waiters)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, weight: float, priority: int = PRIORITY_INFO) -> float:
+        """Take `weight` from the bucket, waiting for it if needed, and return the seconds waited."""
+        # a request heavier than the bucket could never be sent otherwise
+        weight = min(weight, self.capacity)
+        start = time.monotonic()
+        with self.condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self.waiters, ticket)
+            self.max_depth = max(self.max_depth, len(self.waiters))
+            try:
+                while True:
+                    self._refill()
+                    if self.waiters[0] != ticket:
+                        self.condition.wait()
+                    elif self.tokens < weight:
+                        self.condition.wait((weight - self.tokens) / self.rate)
+                    else:
+                        break
+                heapq.heappop(self.waiters)
+            except BaseException:
+                self.waiters.remove(ticket)
+                heapq.heapify(self.waiters)
+                raise
+            finally:
+                self.condition.notify_all()
+            self.tokens -= weight
+            waited = time.monotonic() - start
+            self.acquired += 1
+            self.weight += int(weight)
+            self.waited += waited
+            return waited
+
+    def charge(self, weight: float) -> None:
+        """Take weight that only became known after the request, e.g. from the size of its response.
+
+        The bucket may go negative, which delays the following requests until it has been paid back.
+        """
+        with self.condition:
+            self._refill()
+            self.tokens -= weight
+            self.weight += int(weight)
+
+    def throttle(self) -> None:
+        """Empty the bucket, e.g. after the server answered 429, so that waiting requests back off."""
+        with self.condition:
+            self._refill()
+            self.tokens = min(self.tokens, 0)
+
+    def stats(self) -> RateLimiterStats:
+        with self.condition:
+            return {
+                "depth": len(self.waiters),
+                "max_depth": self.max_depth,
+                "acquired": self.acquired,
+                "weight": self.weight,
+                "waited": self.waited,
+            }
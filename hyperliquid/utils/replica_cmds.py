@@ -0,0 +1,128 @@
+"""Streaming readers for the replica cmds files published by the Hyperliquid nodes.
+
+Each file holds one JSON record per line, with the block under "abci_block" and its transactions in
+abci_block.signed_action_bundles as [bundle hash, {"signed_actions": [...]}] pairs. Files compressed with lz4 are
+decompressed frame by frame while reading, so neither a decompressed copy on disk nor the whole file in memory is
+needed. scan_replica_signed_actions can spread the files of a height range over a process pool.
+"""
+
+import os
+from concurrent.futures import Executor
+from functools import partial, reduce
+
+from hyperliquid.utils.executors import map_on
+from hyperliquid.utils.json_codec import JsonCodec, get_json_codec
+from hyperliquid.utils.types import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+try:
+    import lz4.frame
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    lz4 = None
+
+# Each replica cmds file holds this many blocks and is named after the first height it covers
+REPLICA_CMDS_BATCH_SIZE = 10000
+
+T = TypeVar("T")
+
+
+def replica_cmds_paths(data_dir: str, start_height: int, end_height: int, suffix: str = ".lz4") -> List[str]:
+    """Paths of the replica cmds files covering start_height up to (excluding) end_height, in height order."""
+    paths = []
+    for height in range(start_height, end_height, REPLICA_CMDS_BATCH_SIZE):
+        path = os.path.join(data_dir, f"{height}{suffix}")
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"replica cmds file at {height} not found - download missing block files(s) using 'aws s3 cp "
+                "s3://hl-[testnet | mainnet]-replica-cmds/<block_object_path> --request-payer requester'"
+            )
+        paths.append(path)
+    return paths
+
+
+def open_replica_cmds(path: str) -> IO[bytes]:
+    """Open a replica cmds file for reading in binary mode, decompressing it on the fly if it ends in .lz4."""
+    if path.endswith(".lz4"):
+        if lz4 is None:
+            raise ImportError("reading .lz4 replica cmds requires lz4, install it with `pip install lz4`")
+        return lz4.frame.open(path, "rb")  # type: ignore[no-any-return]
+    return open(path, "rb")
+
+
+def read_replica_blocks(
+    path: str,
+    action_types: Optional[Iterable[str]] = None,
+    json_codec: Union[str, JsonCodec, None] = None,
+) -> Iterator[Any]:
+    """Yield the parsed records of a replica cmds file one line at a time.
+
+    With action_types, lines that do not mention any of the types are skipped before JSON parsing, which is where
+    most of the time goes. This is a substring test, so yielded blocks may still contain no such action.
+    """
+    codec = get_json_codec(json_codec)
+    needles = [action_type.encode() for action_type in action_types] if action_types is not None else None
+    with open_replica_cmds(path) as f:
+        for line in f:
+            if needles is not None and not any(needle in line for needle in needles):
+                continue
+            if line.strip():
+                yield codec.loads(line)
+
+
+def read_replica_signed_actions(
+    path: str,
+    action_types: Optional[Iterable[str]] = None,
+    json_codec: Union[str, JsonCodec, None] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the signed actions ({"action": ..., "signature": ..., ...}) of a replica cmds file in block order.
+
+    With action_types, only signed actions whose action type is one of them are yielded.
+    """
+    types = set(action_types) if action_types is not None else None
+    for block in read_replica_blocks(path, types, json_codec):
+        for _, bundle in block["abci_block"]["signed_action_bundles"]:
+            for signed_action in bundle["signed_actions"]:
+                if types is None or signed_action["action"]["type"] in types:
+                    yield signed_action
+
+
+def scan_replica_signed_actions(
+    paths: Sequence[str],
+    fold: Callable[[T, Dict[str, Any]], T],
+    initial: Callable[[], T],
+    merge: Callable[[T, T], T],
+    action_types: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+    json_codec: Optional[str] = None,
+) -> T:
+    """Fold the signed actions of many replica cmds files in parallel, one file per task.
+
+    Each file is streamed with read_replica_signed_actions and folded into a fresh initial() with
+    fold(partial, signed_action). The per-file partial results are then combined with merge(earlier, later) in the
+    order of `paths`, whatever order the files finish in, so the result does not depend on scheduling. The files are
+    scanned one after another unless an `executor` is given. With a ProcessPoolExecutor, fold, initial, merge and
+    their results must be picklable, e.g. module level functions and plain dicts.
+    """
+    scan_file = partial(_scan_file, fold=fold, initial=initial, action_types=action_types, json_codec=json_codec)
+    return reduce(merge, map_on(executor, scan_file, paths), initial())
+
+
+def _scan_file(
+    path: str,
+    fold: Callable[[T, Dict[str, Any]], T],
+    initial: Callable[[], T],
+    action_types: Optional[Iterable[str]],
+    json_codec: Optional[str],
+) -> T:
+    return reduce(fold, read_replica_signed_actions(path, action_types, json_codec), initial())
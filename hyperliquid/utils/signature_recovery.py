@@ -0,0 +1,143 @@
+"""Batch recovery of the signers of L1 and user-signed actions, e.g. to audit the actions in replica cmds.
+
+The typed data of each action is hashed in the calling process with the domain separators and type hashes cached,
+which is equivalent to recover_agent_or_user_from_l1_action / recover_user_from_user_signed_action but skips
+encode_typed_data. Only the ECDSA public key recovery, which dominates the cost, is handed to the executor the
+caller passes, e.g. a process pool. Results are yielded in input order while later inputs are still being read and
+recovered.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import lru_cache
+from itertools import islice
+
+from eth_account import Account
+from eth_account.messages import SignableMessage
+from eth_hash.auto import keccak as keccak_256
+
+from hyperliquid.utils.signing import action_hash, address_to_bytes, eip712_domain_separator, l1_signable_message
+from hyperliquid.utils.types import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# (signable message, (v, r, s)) as passed to Account.recover_message
+RecoveryInput = Tuple[SignableMessage, Tuple[int, Any, Any]]
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+@lru_cache(maxsize=None)
+def user_signed_domain_separator(chain_id: int) -> bytes:
+    return eip712_domain_separator("HyperliquidSignTransaction", "1", chain_id, ZERO_ADDRESS)
+
+
+@lru_cache(maxsize=None)
+def user_signed_type_hash(primary_type: str, fields: Tuple[Tuple[str, str], ...]) -> bytes:
+    return keccak_256(f"{primary_type}({','.join(f'{type_} {name}' for name, type_ in fields)})".encode())
+
+
+def _encode_value(type_: str, value: Any) -> bytes:
+    if type_ == "string":
+        return keccak_256(value.encode())
+    if type_ == "address":
+        return address_to_bytes(value).rjust(32, b"\x00")
+    if type_ == "bool":
+        return (1 if value else 0).to_bytes(32, "big")
+    if type_.startswith("uint"):
+        return int(value).to_bytes(32, "big")
+    if type_ == "bytes32":
+        return value if isinstance(value, bytes) else bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    raise ValueError(f"Unsupported EIP-712 field type {type_}")
+
+
+def user_signed_signable_message(
+    action: Dict[str, Any], payload_types: List[Dict[str, str]], primary_type: str, is_mainnet: bool
+) -> SignableMessage:
+    """encode_typed_data(full_message=user_signed_payload(...)) for the payload types used by user-signed actions.
+
+    Like recover_user_from_user_signed_action, hyperliquidChain is taken from is_mainnet, but the action is left
+    unmodified.
+    """
+    fields = tuple((field["name"], field["type"]) for field in payload_types)
+    struct = [user_signed_type_hash(primary_type, fields)]
+    for name, type_ in fields:
+        value = ("Mainnet" if is_mainnet else "Testnet") if name == "hyperliquidChain" else action[name]
+        struct.append(_encode_value(type_, value))
+    domain = user_signed_domain_separator(int(action["signatureChainId"], 16))
+    return SignableMessage(b"\x01", domain, keccak_256(b"".join(struct)))
+
+
+def recover_signers(
+    inputs: Iterable[RecoveryInput],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    max_pending_chunks: Optional[int] = None,
+) -> Iterator[str]:
+    """Recover the signer address of each (signable message, vrs) pair, yielding them in input order.
+
+    Without an executor the signers are recovered one by one in this process. With one, chunks of chunk_size
+    inputs are submitted to it and at most max_pending_chunks chunks (by default twice the number of CPUs) are in
+    flight, so arbitrarily long inputs are streamed in bounded memory.
+    """
+    if executor is None:
+        yield from map(_recover, inputs)
+        return
+    if max_pending_chunks is None:
+        max_pending_chunks = 2 * (os.cpu_count() or 1)
+
+    iterator = iter(inputs)
+    pending: Deque["Future[List[str]]"] = deque()
+    while True:
+        while len(pending) < max_pending_chunks:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(_recover_chunk, chunk))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
+def _recover(recovery_input: RecoveryInput) -> str:
+    structured_data, vrs = recovery_input
+    return Account.recover_message(structured_data, vrs=vrs)  # type: ignore[no-any-return]
+
+
+def _recover_chunk(chunk: List[RecoveryInput]) -> List[str]:
+    return [_recover(recovery_input) for recovery_input in chunk]
+
+
+def _vrs(signature: Dict[str, Any]) -> Tuple[int, Any, Any]:
+    return signature["v"], signature["r"], signature["s"]
+
+
+def recover_l1_action_signers(
+    signed_actions: Iterable[Tuple[Any, Dict[str, Any], Optional[str], int, Optional[int]]],
+    is_mainnet: bool,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    max_pending_chunks: Optional[int] = None,
+) -> Iterator[str]:
+    """recover_agent_or_user_from_l1_action for each (action, signature, active_pool, nonce, expires_after)."""
+    inputs = (
+        (l1_signable_message(action_hash(action, active_pool, nonce, expires_after), is_mainnet), _vrs(signature))
+        for action, signature, active_pool, nonce, expires_after in signed_actions
+    )
+    return recover_signers(inputs, executor, chunk_size, max_pending_chunks)
+
+
+def recover_user_signed_action_signers(
+    signed_actions: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+    payload_types: List[Dict[str, str]],
+    primary_type: str,
+    is_mainnet: bool,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    max_pending_chunks: Optional[int] = None,
+) -> Iterator[str]:
+    """recover_user_from_user_signed_action for each (action, signature) of one user-signed action type."""
+    inputs = (
+        (user_signed_signable_message(action, payload_types, primary_type, is_mainnet), _vrs(signature))
+        for action, signature in signed_actions
+    )
+    return recover_signers(inputs, executor, chunk_size, max_pending_chunks)
@@ -1,12 +1,33 @@
+import heapq
+import math
+import os
+import threading
 import time
-from decimal import Decimal
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import repeat
 
 import msgpack
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
+from eth_account.signers.local import LocalAccount
+from eth_hash.auto import keccak as keccak_256
 from eth_utils import keccak, to_hex
 
-from hyperliquid.utils.types import Cloid, Literal, NotRequired, Optional, TypedDict, Union
+from hyperliquid.utils.executors import map_on
+from hyperliquid.utils.types import (
+    Any,
+    Cloid,
+    Dict,
+    List,
+    Literal,
+    NotRequired,
+    Optional,
+    Sequence,
+    Set,
+    TypedDict,
+    Union,
+)
 
 Tif = Union[Literal["Alo"], Literal["Ioc"], Literal["Gtc"]]
 Tpsl = Union[Literal["tp"], Literal["sl"]]
@@ -148,12 +169,50 @@ def order_type_to_wire(order_type: OrderType) -> OrderTypeWire:
     raise ValueError("Invalid order type", order_type)
 
 
-def address_to_bytes(address):
+def address_to_bytes(address: str) -> bytes:
     return bytes.fromhex(address[2:] if address.startswith("0x") else address)
 
 
+EIP712_DOMAIN_TYPE_HASH = keccak(
+    text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+AGENT_TYPE_HASH = keccak(text="Agent(string source,bytes32 connectionId)")
+
+
+def eip712_domain_separator(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    return keccak(
+        EIP712_DOMAIN_TYPE_HASH
+        + keccak(text=name)
+        + keccak(text=version)
+        + chain_id.to_bytes(32, "big")
+        + address_to_bytes(verifying_contract).rjust(32, b"\x00")
+    )
+
+
+# The domain and the phantom agent source are constant for L1 actions, so everything except the struct hash of
+# the connectionId is computed once at import time instead of re-encoding the typed data for every action.
+L1_DOMAIN_SEPARATOR = eip712_domain_separator("Exchange", "1", 1337, "0x0000000000000000000000000000000000000000")
+AGENT_SOURCE_HASHES = {True: keccak(text="a"), False: keccak(text="b")}
+
+
+# msgpack Packers are not thread safe, so each thread reuses its own instead of packb creating one per call
+_packers = threading.local()
+
+
+def _packer() -> msgpack.Packer:
+    packer = getattr(_packers, "packer", None)
+    if packer is None:
+        packer = _packers.packer = msgpack.Packer(autoreset=False)
+    return packer
+
+
 def action_hash(action, vault_address, nonce, expires_after):
-    data = msgpack.packb(action)
+    packer = _packer()
+    packer.reset()
+    packer.pack(action)
+    # one copy of the packed action, the suffix is appended in place
+    data = bytearray(packer.getbuffer())
+    packer.reset()
     data += nonce.to_bytes(8, "big")
     if vault_address is None:
         data += b"\x00"
@@ -163,13 +222,20 @@ def action_hash(action, vault_address, nonce, expires_after):
     if expires_after is not None:
         data += b"\x00"
         data += expires_after.to_bytes(8, "big")
-    return keccak(data)
+    # eth_utils.keccak is this function behind input type checks and a conversion to bytes
+    return keccak_256(data)
 
 
 def construct_phantom_agent(hash, is_mainnet):
     return {"source": "a" if is_mainnet else "b", "connectionId": hash}
 
 
+def l1_signable_message(hash: bytes, is_mainnet: bool) -> SignableMessage:
+    # Equivalent to encode_typed_data(full_message=l1_payload(construct_phantom_agent(hash, is_mainnet)))
+    struct_hash = keccak(AGENT_TYPE_HASH + AGENT_SOURCE_HASHES[bool(is_mainnet)] + hash)
+    return SignableMessage(b"\x01", L1_DOMAIN_SEPARATOR, struct_hash)
+
+
 def l1_payload(phantom_agent):
     return {
         "domain": {
@@ -220,9 +286,7 @@ def user_signed_payload(primary_type, payload_types, action):
 
 def sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
-    phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    return sign_inner(wallet, data)
+    return sign_signable_message(wallet, l1_signable_message(hash, is_mainnet))
 
 
 def sign_user_signed_action(wallet, action, payload_types, primary_type, is_mainnet):
@@ -293,6 +357,59 @@ def sign_multi_sig_l1_action_payload(
     )
 
 
+def sign_multi_sig_l1_action_payloads(
+    wallets: Sequence[LocalAccount],
+    action: Any,
+    is_mainnet: bool,
+    vault_address: Optional[str],
+    timestamp: int,
+    expires_after: Optional[int],
+    payload_multi_sig_user: str,
+    outer_signer: str,
+    executor: Optional[Executor] = None,
+) -> List[Dict[str, Any]]:
+    """sign_multi_sig_l1_action_payload for every wallet, in order, ready to pass to Exchange.multi_sig.
+
+    The envelope is hashed once and only the signatures are computed per wallet, see sign_with_wallets.
+    """
+    envelope = [payload_multi_sig_user.lower(), outer_signer.lower(), action]
+    hash = action_hash(envelope, vault_address, timestamp, expires_after)
+    return sign_with_wallets(wallets, l1_signable_message(hash, is_mainnet), executor)
+
+
+def sign_multi_sig_user_signed_action_payloads(
+    wallets: Sequence[LocalAccount],
+    action: Any,
+    is_mainnet: bool,
+    sign_types: List[Dict[str, str]],
+    tx_type: str,
+    payload_multi_sig_user: str,
+    outer_signer: str,
+    executor: Optional[Executor] = None,
+) -> List[Dict[str, Any]]:
+    """sign_multi_sig_user_signed_action_payload for every wallet, in order, ready to pass to Exchange.multi_sig.
+
+    The typed data is encoded once and only the signatures are computed per wallet, see sign_with_wallets.
+    """
+    envelope = add_multi_sig_fields(action, payload_multi_sig_user, outer_signer)
+    envelope["signatureChainId"] = "0x66eee"
+    envelope["hyperliquidChain"] = "Mainnet" if is_mainnet else "Testnet"
+    data = user_signed_payload(tx_type, add_multi_sig_types(sign_types), envelope)
+    return sign_with_wallets(wallets, encode_typed_data(full_message=data), executor)
+
+
+def sign_with_wallets(
+    wallets: Sequence[LocalAccount], structured_data: SignableMessage, executor: Optional[Executor] = None
+) -> List[Dict[str, Any]]:
+    """Sign one message with many wallets, returning the signatures in the order of the wallets.
+
+    Signs serially unless an `executor` is given, which only pays off for many wallets with a ProcessPoolExecutor
+    that is reused across calls.
+    """
+    chunksize = max(1, len(wallets) // ((os.cpu_count() or 1) * 2))
+    return list(map_on(executor, sign_signable_message, wallets, repeat(structured_data), chunksize=chunksize))
+
+
 def sign_multi_sig_action(wallet, action, is_mainnet, vault_address, nonce, expires_after):
     action_without_tag = action.copy()
     del action_without_tag["type"]
@@ -412,15 +529,17 @@ def sign_token_delegate_action(wallet, action, is_mainnet):
 
 def sign_inner(wallet, data):
     structured_data = encode_typed_data(full_message=data)
+    return sign_signable_message(wallet, structured_data)
+
+
+def sign_signable_message(wallet, structured_data):
     signed = wallet.sign_message(structured_data)
     return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
 
 def recover_agent_or_user_from_l1_action(action, signature, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
-    phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    structured_data = encode_typed_data(full_message=data)
+    structured_data = l1_signable_message(hash, is_mainnet)
     address = Account.recover_message(structured_data, vrs=[signature["v"], signature["r"], signature["s"]])
     return address
 
@@ -433,14 +552,19 @@ def recover_user_from_user_signed_action(action, signature, payload_types, prima
     return address
 
 
+# Order prices and sizes repeat a lot (ladders, requotes at the same levels), so the formatted strings are cached.
+# Results are identical to normalizing the 8 decimal rendering with Decimal, with -0 written as 0.
+@lru_cache(maxsize=4096)
 def float_to_wire(x: float) -> str:
+    if not math.isfinite(x):
+        raise ValueError("float_to_wire requires a finite number", x)
     rounded = f"{x:.8f}"
     if abs(float(rounded) - x) >= 1e-12:
         raise ValueError("float_to_wire causes rounding", x)
+    rounded = rounded.rstrip("0").rstrip(".")
     if rounded == "-0":
         rounded = "0"
-    normalized = Decimal(rounded).normalize()
-    return f"{normalized:f}"
+    return rounded
 
 
 def float_to_int_for_hashing(x: float) -> int:
@@ -463,6 +587,55 @@ def get_timestamp_ms() -> int:
     return int(time.time() * 1000)
 
 
+class NonceAllocator:
+    """Thread safe source of unique, strictly increasing action nonces.
+
+    Each nonce is the current time in milliseconds, or one more than the previous nonce when the clock has not moved
+    past it, so actions signed in the same millisecond (or after the clock stepped back) never share a nonce.
+    reserve() hands out nonces ahead of the clock for actions signed in advance, next() skips them.
+    """
+
+    def __init__(self) -> None:
+        self.last = 0
+        self.reserved: List[int] = []
+        self._reserved_set: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _release_reserved(self, up_to: int) -> None:
+        while self.reserved and self.reserved[0] <= up_to:
+            self._reserved_set.discard(heapq.heappop(self.reserved))
+
+    def next(self) -> int:
+        now = get_timestamp_ms()
+        with self._lock:
+            nonce = now if now > self.last else self.last + 1
+            while nonce in self._reserved_set:
+                nonce += 1
+            self._release_reserved(nonce)
+            self.last = nonce
+            return nonce
+
+    def reserve(self, ahead_ms: int) -> int:
+        """A nonce about ahead_ms milliseconds in the future that next() will never return."""
+        now = get_timestamp_ms()
+        with self._lock:
+            # next() never goes below the current time or the last nonce, so reservations up to there can be dropped,
+            # which keeps the heap bounded when only reserve() is called
+            self.last = max(self.last, now)
+            self._release_reserved(self.last)
+            nonce = max(now + ahead_ms, self.last + 1)
+            while nonce in self._reserved_set:
+                nonce += 1
+            heapq.heappush(self.reserved, nonce)
+            self._reserved_set.add(nonce)
+            return nonce
+
+
+# Shared by every Exchange of the process unless replaced, nonces are tracked per signer by the exchange and the same
+# wallet may be used by several clients
+DEFAULT_NONCE_ALLOCATOR = NonceAllocator()
+
+
 def order_request_to_order_wire(order: OrderRequest, asset: int) -> OrderWire:
     order_wire: OrderWire = {
         "a": asset,
@@ -477,6 +650,62 @@ def order_request_to_order_wire(order: OrderRequest, asset: int) -> OrderWire:
     return order_wire
 
 
+def _as_list(values: Any) -> List[Any]:
+    # ndarray.tolist() yields Python floats and bools, which float_to_wire caches and msgpack serializes
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _copy_order_type_wire(order_type_wire: OrderTypeWire) -> OrderTypeWire:
+    if "limit" in order_type_wire:
+        return {"limit": {"tif": order_type_wire["limit"]["tif"]}}
+    trigger = order_type_wire["trigger"]
+    return {"trigger": {"isMarket": trigger["isMarket"], "triggerPx": trigger["triggerPx"], "tpsl": trigger["tpsl"]}}
+
+
+def ladder_to_order_wires(
+    asset: int,
+    is_buy: Any,
+    sz: Any,
+    limit_px: Any,
+    order_type: OrderType,
+    reduce_only: bool = False,
+    cloids: Optional[Sequence[Optional[Cloid]]] = None,
+) -> List[OrderWire]:
+    """Order wires for many orders on one asset sharing an order type, e.g. a ladder of quotes.
+
+    sz and limit_px are NumPy arrays or sequences of the same length, is_buy is one bool (or NumPy bool) for every
+    order or an array of them. Produces the same wires as calling order_request_to_order_wire per order, but the
+    order type is converted only once.
+    """
+    sizes = _as_list(sz)
+    prices = _as_list(limit_px)
+    # np.bool_ is no bool, but like 0-d arrays it has ndim 0
+    single_side = isinstance(is_buy, bool) or getattr(is_buy, "ndim", None) == 0
+    sides = [bool(is_buy)] * len(prices) if single_side else _as_list(is_buy)
+    if not len(sizes) == len(prices) == len(sides):
+        raise ValueError("sz, limit_px and is_buy must have the same length", len(sizes), len(prices), len(sides))
+    if cloids is not None and len(cloids) != len(prices):
+        raise ValueError("cloids must have one entry per order", len(cloids), len(prices))
+    order_type_wire = order_type_to_wire(order_type)
+    order_wires: List[OrderWire] = [
+        {
+            "a": asset,
+            "b": bool(side),
+            "p": float_to_wire(px),
+            "s": float_to_wire(size),
+            "r": reduce_only,
+            # a copy per wire, so that changing one wire's order type leaves the others alone
+            "t": _copy_order_type_wire(order_type_wire),
+        }
+        for side, px, size in zip(sides, prices, sizes)
+    ]
+    if cloids is not None:
+        for order_wire, cloid in zip(order_wires, cloids):
+            if cloid is not None:
+                order_wire["c"] = cloid.to_raw()
+    return order_wires
+
+
 def order_wires_to_order_action(order_wires, builder=None):
     action = {
         "type": "order",
@@ -0,0 +1,148 @@
+"""msgspec Structs for the market data websocket messages, with prices and sizes decoded to numbers.
+
+These mirror AllMidsMsg, L2BookMsg, BboMsg, TradesMsg and UserFillsMsg from hyperliquid.utils.types but are slotted
+objects with snake_case attributes instead of dicts of strings. They are produced by TypedMessageDecoder, which
+WebsocketManager uses when constructed with typed_messages=True.
+"""
+
+from hyperliquid.utils.types import Any, Dict, List, Optional, Side, Tuple, Union
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only when the optional dependency is missing
+    msgspec = None  # type: ignore[assignment]
+
+if msgspec is not None:
+
+    class Struct(msgspec.Struct, rename="camel", gc=False):
+        pass
+
+    class _Envelope(msgspec.Struct):
+        channel: str
+        data: msgspec.Raw = msgspec.Raw()
+
+else:  # pragma: no cover
+
+    class Struct:  # type: ignore[no-redef,unreachable]
+        pass
+
+
+class L2Level(Struct):
+    px: float
+    sz: float
+    n: int
+
+
+class L2BookData(Struct):
+    coin: str
+    time: int
+    levels: Tuple[List[L2Level], List[L2Level]]
+
+
+class L2BookMsg(Struct):
+    channel: str
+    data: L2BookData
+
+
+class BboData(Struct):
+    coin: str
+    time: int
+    bbo: Tuple[Optional[L2Level], Optional[L2Level]]
+
+
+class BboMsg(Struct):
+    channel: str
+    data: BboData
+
+
+class Trade(Struct):
+    coin: str
+    side: Side
+    px: float
+    sz: float
+    time: int
+    hash: str
+    tid: int = 0
+    users: Optional[Tuple[str, str]] = None
+
+
+class TradesMsg(Struct):
+    channel: str
+    data: List[Trade]
+
+
+class Fill(Struct):
+    coin: str
+    px: float
+    sz: float
+    side: Side
+    time: int
+    start_position: float
+    dir: str
+    closed_pnl: float
+    hash: str
+    oid: int
+    crossed: bool
+    fee: float
+    tid: int
+    fee_token: Optional[str] = None
+
+
+class UserFillsData(Struct):
+    user: str
+    fills: List[Fill]
+    is_snapshot: bool = False
+
+
+class UserFillsMsg(Struct):
+    channel: str
+    data: UserFillsData
+
+
+class AllMidsData(Struct):
+    mids: Dict[str, float]
+
+
+class AllMidsMsg(Struct):
+    channel: str
+    data: AllMidsData
+
+
+TypedWsMsg = Union[AllMidsMsg, BboMsg, L2BookMsg, TradesMsg, UserFillsMsg]
+
+TYPED_CHANNELS = {
+    "allMids": (AllMidsMsg, AllMidsData),
+    "l2Book": (L2BookMsg, L2BookData),
+    "bbo": (BboMsg, BboData),
+    "trades": (TradesMsg, List[Trade]),
+    "userFills": (UserFillsMsg, UserFillsData),
+}
+
+
+class TypedMessageDecoder:
+    """Decodes websocket messages, returning Structs for the channels in TYPED_CHANNELS and dicts for all others.
+
+    Only the channel name is read from the message envelope, the data is kept as a raw slice and decoded in a single
+    pass straight into the Structs of its channel, converting the numeric strings on the way.
+    """
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("typed websocket messages require msgspec, install it with `pip install msgspec`")
+        self._envelope_decoder = msgspec.json.Decoder(_Envelope)
+        self._decoder = msgspec.json.Decoder()
+        self._data_decoders: Dict[str, Tuple[Any, Any]] = {
+            channel: (msg_type, msgspec.json.Decoder(data_type, strict=False))
+            for channel, (msg_type, data_type) in TYPED_CHANNELS.items()
+        }
+
+    def decode(self, message: Union[str, bytes]) -> Any:
+        try:
+            envelope = self._envelope_decoder.decode(message)
+            typed = self._data_decoders.get(envelope.channel)
+            if typed is None:
+                return self._decoder.decode(message)
+            msg_type, data_decoder = typed
+            return msg_type(envelope.channel, data_decoder.decode(envelope.data))
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
@@ -1,6 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Tuple, TypedDict, Union, cast
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+)
 from typing_extensions import NotRequired
 
 Any = Any
@@ -9,6 +28,13 @@ cast = cast
 Callable = Callable
 NamedTuple = NamedTuple
 NotRequired = NotRequired
+TypeVar = TypeVar
+IO = IO
+Iterator = Iterator
+Iterable = Iterable
+Sequence = Sequence
+Deque = Deque
+Set = Set
 
 AssetInfo = TypedDict("AssetInfo", {"name": str, "szDecimals": int})
 Meta = TypedDict("Meta", {"universe": List[AssetInfo]})
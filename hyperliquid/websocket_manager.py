@@ -1,112 +1,262 @@
 import json
 import logging
+import random
+import sys
 import threading
 from collections import defaultdict
+from operator import attrgetter, itemgetter
 
 import websocket
 
-from hyperliquid.utils.types import Any, Callable, Dict, List, NamedTuple, Optional, Subscription, Tuple, WsMsg
+from hyperliquid.utils.dispatcher import Dispatcher, OverflowPolicy, SubscriptionQueue
+from hyperliquid.utils.json_codec import JsonCodec, get_json_codec
+from hyperliquid.utils.typed_messages import TypedMessageDecoder
+from hyperliquid.utils.types import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Subscription,
+    Tuple,
+    Union,
+    WsMsg,
+    cast,
+)
 
 ActiveSubscription = NamedTuple("ActiveSubscription", [("callback", Callable[[Any], None]), ("subscription_id", int)])
 
 
+class IdentifierCache(Dict[Any, str]):
+    """Maps the raw routing key of a subscription or message (a coin, a user, ...) to its interned identifier.
+
+    Each distinct key is lowercased and formatted once, after that routing a message costs a single dict lookup
+    and the identifiers used as active_subscriptions keys are the same interned string objects.
+    """
+
+    def __init__(self, format_identifier: Callable[[Any], str]):
+        super().__init__()
+        self.format_identifier = format_identifier
+
+    def __missing__(self, key: Any) -> str:
+        identifier = sys.intern(self.format_identifier(key))
+        self[key] = identifier
+        return identifier
+
+
+L2_BOOK_IDENTIFIERS = IdentifierCache(lambda coin: f"l2Book:{coin.lower()}")
+TRADES_IDENTIFIERS = IdentifierCache(lambda coin: f"trades:{coin.lower()}")
+USER_FILLS_IDENTIFIERS = IdentifierCache(lambda user: f"userFills:{user.lower()}")
+CANDLE_IDENTIFIERS = IdentifierCache(lambda coin_interval: f"candle:{coin_interval[0].lower()},{coin_interval[1]}")
+USER_FUNDINGS_IDENTIFIERS = IdentifierCache(lambda user: f"userFundings:{user.lower()}")
+USER_NON_FUNDING_LEDGER_UPDATES_IDENTIFIERS = IdentifierCache(
+    lambda user: f"userNonFundingLedgerUpdates:{user.lower()}"
+)
+WEB_DATA2_IDENTIFIERS = IdentifierCache(lambda user: f"webData2:{user.lower()}")
+BBO_IDENTIFIERS = IdentifierCache(lambda coin: f"bbo:{coin.lower()}")
+ACTIVE_ASSET_CTX_IDENTIFIERS = IdentifierCache(lambda coin: f"activeAssetCtx:{coin.lower()}")
+
+# A route is either the constant identifier of the channel or the extractor of the routing key with its identifiers
+Route = Union[str, Tuple[Callable[[Any], Any], IdentifierCache]]
+
+SUBSCRIPTION_ROUTES: Dict[str, Route] = {
+    "allMids": "allMids",
+    "l2Book": (itemgetter("coin"), L2_BOOK_IDENTIFIERS),
+    "trades": (itemgetter("coin"), TRADES_IDENTIFIERS),
+    "userEvents": "userEvents",
+    "userFills": (itemgetter("user"), USER_FILLS_IDENTIFIERS),
+    "candle": (itemgetter("coin", "interval"), CANDLE_IDENTIFIERS),
+    "orderUpdates": "orderUpdates",
+    "userFundings": (itemgetter("user"), USER_FUNDINGS_IDENTIFIERS),
+    "userNonFundingLedgerUpdates": (itemgetter("user"), USER_NON_FUNDING_LEDGER_UPDATES_IDENTIFIERS),
+    "webData2": (itemgetter("user"), WEB_DATA2_IDENTIFIERS),
+    "bbo": (itemgetter("coin"), BBO_IDENTIFIERS),
+    "activeAssetCtx": (itemgetter("coin"), ACTIVE_ASSET_CTX_IDENTIFIERS),
+}
+
+# Channels that carry no routing key map straight to their identifier
+WS_CHANNEL_IDENTIFIERS: Dict[str, str] = {
+    "pong": "pong",
+    "allMids": "allMids",
+    "user": "userEvents",
+    "orderUpdates": "orderUpdates",
+}
+
+# For the other channels the key extractor is applied to the message data
+WS_CHANNEL_ROUTES: Dict[str, Tuple[Callable[[Any], Any], IdentifierCache]] = {
+    "l2Book": (itemgetter("coin"), L2_BOOK_IDENTIFIERS),
+    "trades": (lambda trades: trades[0]["coin"], TRADES_IDENTIFIERS),
+    "userFills": (itemgetter("user"), USER_FILLS_IDENTIFIERS),
+    "candle": (itemgetter("s", "i"), CANDLE_IDENTIFIERS),
+    "userFundings": (itemgetter("user"), USER_FUNDINGS_IDENTIFIERS),
+    "userNonFundingLedgerUpdates": (itemgetter("user"), USER_NON_FUNDING_LEDGER_UPDATES_IDENTIFIERS),
+    "webData2": (itemgetter("user"), WEB_DATA2_IDENTIFIERS),
+    "bbo": (itemgetter("coin"), BBO_IDENTIFIERS),
+    "activeAssetCtx": (itemgetter("coin"), ACTIVE_ASSET_CTX_IDENTIFIERS),
+    "activeSpotAssetCtx": (itemgetter("coin"), ACTIVE_ASSET_CTX_IDENTIFIERS),
+}
+
+
 def subscription_to_identifier(subscription: Subscription) -> str:
-    if subscription["type"] == "allMids":
-        return "allMids"
-    elif subscription["type"] == "l2Book":
-        return f'l2Book:{subscription["coin"].lower()}'
-    elif subscription["type"] == "trades":
-        return f'trades:{subscription["coin"].lower()}'
-    elif subscription["type"] == "userEvents":
-        return "userEvents"
-    elif subscription["type"] == "userFills":
-        return f'userFills:{subscription["user"].lower()}'
-    elif subscription["type"] == "candle":
-        return f'candle:{subscription["coin"].lower()},{subscription["interval"]}'
-    elif subscription["type"] == "orderUpdates":
-        return "orderUpdates"
-    elif subscription["type"] == "userFundings":
-        return f'userFundings:{subscription["user"].lower()}'
-    elif subscription["type"] == "userNonFundingLedgerUpdates":
-        return f'userNonFundingLedgerUpdates:{subscription["user"].lower()}'
-    elif subscription["type"] == "webData2":
-        return f'webData2:{subscription["user"].lower()}'
-    elif subscription["type"] == "bbo":
-        return f'bbo:{subscription["coin"].lower()}'
-    elif subscription["type"] == "activeAssetCtx":
-        return f'activeAssetCtx:{subscription["coin"].lower()}'
+    route = SUBSCRIPTION_ROUTES[subscription["type"]]
+    if isinstance(route, str):
+        return route
+    get_key, identifiers = route
+    return identifiers[get_key(subscription)]
 
 
 def ws_msg_to_identifier(ws_msg: WsMsg) -> Optional[str]:
-    if ws_msg["channel"] == "pong":
-        return "pong"
-    elif ws_msg["channel"] == "allMids":
-        return "allMids"
-    elif ws_msg["channel"] == "l2Book":
-        return f'l2Book:{ws_msg["data"]["coin"].lower()}'
-    elif ws_msg["channel"] == "trades":
-        trades = ws_msg["data"]
-        if len(trades) == 0:
-            return None
-        else:
-            return f'trades:{trades[0]["coin"].lower()}'
-    elif ws_msg["channel"] == "user":
-        return "userEvents"
-    elif ws_msg["channel"] == "userFills":
-        return f'userFills:{ws_msg["data"]["user"].lower()}'
-    elif ws_msg["channel"] == "candle":
-        return f'candle:{ws_msg["data"]["s"].lower()},{ws_msg["data"]["i"]}'
-    elif ws_msg["channel"] == "orderUpdates":
-        return "orderUpdates"
-    elif ws_msg["channel"] == "userFundings":
-        return f'userFundings:{ws_msg["data"]["user"].lower()}'
-    elif ws_msg["channel"] == "userNonFundingLedgerUpdates":
-        return f'userNonFundingLedgerUpdates:{ws_msg["data"]["user"].lower()}'
-    elif ws_msg["channel"] == "webData2":
-        return f'webData2:{ws_msg["data"]["user"].lower()}'
-    elif ws_msg["channel"] == "bbo":
-        return f'bbo:{ws_msg["data"]["coin"].lower()}'
-    elif ws_msg["channel"] == "activeAssetCtx" or ws_msg["channel"] == "activeSpotAssetCtx":
-        return f'activeAssetCtx:{ws_msg["data"]["coin"].lower()}'
+    channel = ws_msg["channel"]
+    route = WS_CHANNEL_ROUTES.get(channel)
+    if route is None:
+        return WS_CHANNEL_IDENTIFIERS.get(channel)
+    data = ws_msg["data"]  # type: ignore[typeddict-item]
+    if not data:
+        # an empty trades message
+        return None
+    get_key, identifiers = route
+    return identifiers[get_key(data)]
+
+
+# Routes for the Structs produced by TypedMessageDecoder
+TYPED_WS_CHANNEL_ROUTES: Dict[str, Tuple[Callable[[Any], Any], IdentifierCache]] = {
+    "l2Book": (attrgetter("coin"), L2_BOOK_IDENTIFIERS),
+    "trades": (lambda trades: trades[0].coin, TRADES_IDENTIFIERS),
+    "userFills": (attrgetter("user"), USER_FILLS_IDENTIFIERS),
+    "bbo": (attrgetter("coin"), BBO_IDENTIFIERS),
+}
+
+
+def typed_ws_msg_to_identifier(ws_msg: Any) -> Optional[str]:
+    """ws_msg_to_identifier for the output of TypedMessageDecoder, which is a Struct or, for other channels, a dict."""
+    if isinstance(ws_msg, dict):
+        return ws_msg_to_identifier(cast(WsMsg, ws_msg))
+    channel = ws_msg.channel
+    route = TYPED_WS_CHANNEL_ROUTES.get(channel)
+    if route is None:
+        return WS_CHANNEL_IDENTIFIERS.get(channel)
+    data = ws_msg.data
+    if not data:
+        return None
+    get_key, identifiers = route
+    return identifiers[get_key(data)]
 
 
 class WebsocketManager(threading.Thread):
-    def __init__(self, base_url):
+    """Runs the websocket connection on its own thread and routes messages to subscription callbacks.
+
+    If the connection drops it is re-established with jittered exponential backoff and every active subscription is
+    sent again. Since messages published while disconnected are lost, reconnect callbacks registered with
+    add_reconnect_callback are invoked after the subscriptions have been replayed so that consumers can resync
+    local state, e.g. from the snapshot the server sends for a fresh subscription.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        reconnect: bool = True,
+        reconnect_backoff_min: float = 0.5,
+        reconnect_backoff_max: float = 30.0,
+        json_codec: Union[str, JsonCodec, None] = None,
+        typed_messages: bool = False,
+        # When set, callbacks run on the dispatcher's worker pool, each subscription behind its own bounded queue,
+        # instead of on the websocket thread. The caller owns the dispatcher and stops it.
+        dispatcher: Optional[Dispatcher] = None,
+    ):
         super().__init__()
+        self.json_codec = get_json_codec(json_codec)
+        self.dispatcher = dispatcher
+        # created on the first subscription that asks for an overflow policy without a dispatcher, stopped with us
+        self.owned_dispatcher: Optional[Dispatcher] = None
+        # with typed_messages, callbacks of the channels in TYPED_CHANNELS receive msgspec Structs instead of dicts
+        self.typed_messages = typed_messages
+        if typed_messages:
+            self.decode_message: Callable[[Union[str, bytes]], Any] = TypedMessageDecoder().decode
+            self.msg_to_identifier: Callable[[Any], Optional[str]] = typed_ws_msg_to_identifier
+        else:
+            self.decode_message = self.json_codec.loads
+            self.msg_to_identifier = ws_msg_to_identifier
         self.subscription_id_counter = 0
         self.ws_ready = False
         self.queued_subscriptions: List[Tuple[Subscription, ActiveSubscription]] = []
         self.active_subscriptions: Dict[str, List[ActiveSubscription]] = defaultdict(list)
-        ws_url = "ws" + base_url[len("http") :] + "/ws"
-        self.ws = websocket.WebSocketApp(ws_url, on_message=self.on_message, on_open=self.on_open)
+        # the subscription message for each identifier in active_subscriptions, replayed on reconnect
+        self.identifier_to_subscription: Dict[str, Subscription] = {}
+        self.reconnect_callbacks: List[Callable[[], None]] = []
+        self.reconnect = reconnect
+        self.reconnect_backoff_min = reconnect_backoff_min
+        self.reconnect_backoff_max = reconnect_backoff_max
+        self.connection_count = 0
+        self.subscription_lock = threading.RLock()
+        self.ws_url = "ws" + base_url[len("http") :] + "/ws"
+        self.ws = self._create_ws()
         self.ping_sender = threading.Thread(target=self.send_ping)
         self.stop_event = threading.Event()
 
+    def _create_ws(self) -> websocket.WebSocketApp:
+        return websocket.WebSocketApp(
+            self.ws_url, on_message=self.on_message, on_open=self.on_open, on_close=self.on_close
+        )
+
     def run(self):
         self.ping_sender.start()
-        self.ws.run_forever()
+        backoff = self.reconnect_backoff_min
+        while not self.stop_event.is_set():
+            connection_count = self.connection_count
+            self.ws.run_forever()
+            self.ws_ready = False
+            if self.stop_event.is_set() or not self.reconnect:
+                break
+            if self.connection_count != connection_count:
+                # the connection was established before it dropped, start backing off from scratch
+                backoff = self.reconnect_backoff_min
+            delay = random.uniform(backoff / 2, backoff)  # nosec B311 - jitter, not security sensitive
+            logging.warning(f"Websocket disconnected, reconnecting in {delay:.2f}s")
+            if self.stop_event.wait(delay):
+                break
+            backoff = min(backoff * 2, self.reconnect_backoff_max)
+            self.ws = self._create_ws()
 
     def send_ping(self):
         while not self.stop_event.wait(50):
-            if not self.ws.keep_running:
-                break
+            if not self.ws_ready:
+                if not self.reconnect and not self.ws.keep_running:
+                    break
+                continue
             logging.debug("Websocket sending ping")
-            self.ws.send(json.dumps({"method": "ping"}))
+            try:
+                self.ws.send(json.dumps({"method": "ping"}))
+            except websocket.WebSocketConnectionClosedException:
+                logging.debug("Websocket closed before ping could be sent")
         logging.debug("Websocket ping sender stopped")
 
     def stop(self):
         self.stop_event.set()
-        self.ws.close()
+        sock = self.ws.sock
+        if sock is not None and sock.connected:
+            # Only shut the connection down and let run_forever close it. Closing the descriptor from this thread
+            # can leave run_forever polling it until its select times out.
+            self.ws.keep_running = False
+            sock.abort()
+        else:
+            # not connected yet, on_open closes the connection if run_forever still establishes it
+            self.ws.close()
         if self.ping_sender.is_alive():
             self.ping_sender.join()
+        if self.owned_dispatcher is not None:
+            self.owned_dispatcher.stop()
+
+    def add_reconnect_callback(self, callback: Callable[[], None]) -> None:
+        self.reconnect_callbacks.append(callback)
 
     def on_message(self, _ws, message):
         if message == "Websocket connection established.":
             logging.debug(message)
             return
-        logging.debug(f"on_message {message}")
-        ws_msg: WsMsg = json.loads(message)
-        identifier = ws_msg_to_identifier(ws_msg)
+        logging.debug("on_message %s", message)
+        ws_msg = self.decode_message(message)
+        identifier = self.msg_to_identifier(ws_msg)
         if identifier == "pong":
             logging.debug("Websocket received pong")
             return
@@ -120,39 +270,104 @@ class WebsocketManager(threading.Thread):
             for active_subscription in active_subscriptions:
                 active_subscription.callback(ws_msg)
 
-    def on_open(self, _ws):
+    def on_open(self, ws):
         logging.debug("on_open")
-        self.ws_ready = True
-        for subscription, active_subscription in self.queued_subscriptions:
-            self.subscribe(subscription, active_subscription.callback, active_subscription.subscription_id)
+        if self.stop_event.is_set():
+            # stop() ran before run_forever started on this socket, so its close() did not take effect
+            ws.close()
+            return
+        with self.subscription_lock:
+            self.ws_ready = True
+            self.connection_count += 1
+            is_reconnect = self.connection_count > 1
+            if is_reconnect:
+                for subscription in self.identifier_to_subscription.values():
+                    self.ws.send(json.dumps({"method": "subscribe", "subscription": subscription}))
+            queued_subscriptions, self.queued_subscriptions = self.queued_subscriptions, []
+            for subscription, active_subscription in queued_subscriptions:
+                self._activate_subscription(subscription, active_subscription)
+        if is_reconnect:
+            for callback in self.reconnect_callbacks:
+                callback()
+
+    def on_close(self, _ws, close_status_code, close_msg):
+        logging.debug(f"on_close {close_status_code} {close_msg}")
+        self.ws_ready = False
 
     def subscribe(
-        self, subscription: Subscription, callback: Callable[[Any], None], subscription_id: Optional[int] = None
+        self,
+        subscription: Subscription,
+        callback: Callable[[Any], None],
+        subscription_id: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        policy: Optional[OverflowPolicy] = None,
     ) -> int:
-        if subscription_id is None:
-            self.subscription_id_counter += 1
-            subscription_id = self.subscription_id_counter
-        if not self.ws_ready:
-            logging.debug("enqueueing subscription")
-            self.queued_subscriptions.append((subscription, ActiveSubscription(callback, subscription_id)))
-        else:
-            logging.debug("subscribing")
-            identifier = subscription_to_identifier(subscription)
-            if identifier == "userEvents" or identifier == "orderUpdates":
-                # TODO: ideally the userEvent and orderUpdates messages would include the user so that we can multiplex
-                if len(self.active_subscriptions[identifier]) != 0:
-                    raise NotImplementedError(f"Cannot subscribe to {identifier} multiple times")
-            self.active_subscriptions[identifier].append(ActiveSubscription(callback, subscription_id))
-            self.ws.send(json.dumps({"method": "subscribe", "subscription": subscription}))
-        return subscription_id
+        """Subscribe callback to the messages of subscription and return the subscription id.
 
-    def unsubscribe(self, subscription: Subscription, subscription_id: int) -> bool:
-        if not self.ws_ready:
-            raise NotImplementedError("Can't unsubscribe before websocket connected")
+        max_queue_size and policy override the dispatcher's defaults for this subscription. Without a dispatcher, a
+        subscription given a policy is queued on a single worker thread owned by the manager, while the other
+        callbacks keep running on the websocket thread.
+        """
+        with self.subscription_lock:
+            if subscription_id is None:
+                self.subscription_id_counter += 1
+                subscription_id = self.subscription_id_counter
+            if self.dispatcher is not None:
+                callback = self.dispatcher.add_queue(callback, max_queue_size, policy)
+            elif policy is not None:
+                if self.owned_dispatcher is None:
+                    self.owned_dispatcher = Dispatcher(workers=1)
+                callback = self.owned_dispatcher.add_queue(callback, max_queue_size, policy)
+            active_subscription = ActiveSubscription(callback, subscription_id)
+            if not self.ws_ready:
+                logging.debug("enqueueing subscription")
+                self.queued_subscriptions.append((subscription, active_subscription))
+            else:
+                self._activate_subscription(subscription, active_subscription)
+            return subscription_id
+
+    def _activate_subscription(self, subscription: Subscription, active_subscription: ActiveSubscription) -> None:
+        logging.debug("subscribing")
         identifier = subscription_to_identifier(subscription)
-        active_subscriptions = self.active_subscriptions[identifier]
-        new_active_subscriptions = [x for x in active_subscriptions if x.subscription_id != subscription_id]
-        if len(new_active_subscriptions) == 0:
-            self.ws.send(json.dumps({"method": "unsubscribe", "subscription": subscription}))
-        self.active_subscriptions[identifier] = new_active_subscriptions
-        return len(active_subscriptions) != len(new_active_subscriptions)
+        if identifier == "userEvents" or identifier == "orderUpdates":
+            # TODO: ideally the userEvent and orderUpdates messages would include the user so that we can multiplex
+            if len(self.active_subscriptions[identifier]) != 0:
+                self._release_callback(active_subscription.callback)
+                raise NotImplementedError(f"Cannot subscribe to {identifier} multiple times")
+        self.active_subscriptions[identifier].append(active_subscription)
+        self.identifier_to_subscription[identifier] = subscription
+        self.ws.send(json.dumps({"method": "subscribe", "subscription": subscription}))
+
+    def _release_callback(self, callback: Callable[[Any], None]) -> None:
+        if isinstance(callback, SubscriptionQueue):
+            callback.dispatcher.remove_queue(callback)
+
+    def unsubscribe(self, subscription: Subscription, subscription_id: int) -> bool:
+        with self.subscription_lock:
+            if self.connection_count == 0:
+                raise NotImplementedError("Can't unsubscribe before websocket connected")
+            identifier = subscription_to_identifier(subscription)
+            active_subscriptions = self.active_subscriptions[identifier]
+            new_active_subscriptions = [x for x in active_subscriptions if x.subscription_id != subscription_id]
+            for active_subscription in active_subscriptions:
+                if active_subscription.subscription_id == subscription_id:
+                    self._release_callback(active_subscription.callback)
+            # subscriptions made while reconnecting are only activated by the next on_open
+            queued_subscriptions = []
+            for queued_subscription, active_subscription in self.queued_subscriptions:
+                if (
+                    active_subscription.subscription_id == subscription_id
+                    and subscription_to_identifier(queued_subscription) == identifier
+                ):
+                    self._release_callback(active_subscription.callback)
+                else:
+                    queued_subscriptions.append((queued_subscription, active_subscription))
+            dequeued = len(self.queued_subscriptions) - len(queued_subscriptions)
+            self.queued_subscriptions = queued_subscriptions
+            if len(new_active_subscriptions) == 0:
+                self.identifier_to_subscription.pop(identifier, None)
+                # while reconnecting there is nothing to send, the subscription is simply not replayed
+                if self.ws_ready:
+                    self.ws.send(json.dumps({"method": "unsubscribe", "subscription": subscription}))
+            self.active_subscriptions[identifier] = new_active_subscriptions
+            return dequeued > 0 or len(active_subscriptions) != len(new_active_subscriptions)
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import eth_account
+import pytest
+
+from hyperliquid.utils.error import ClientError, ServerError
+from hyperliquid.utils.types import Meta, SpotMeta
+
+pytest.importorskip("aiohttp")
+
+from hyperliquid.async_exchange import AsyncExchange  # noqa: E402
+from hyperliquid.async_info import AsyncInfo  # noqa: E402
+
+TEST_META: Meta = {"universe": [{"name": "ETH", "szDecimals": 4}]}
+TEST_SPOT_META: SpotMeta = {"universe": [], "tokens": []}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))  # type: ignore[attr-defined]
+        status, response = 200, {"status": "ok", "echo": body}
+        if body.get("type") == "clientError":
+            status, response = 429, {"code": 429, "msg": "rate limited"}
+        elif body.get("type") == "serverError":
+            status, response = 500, {}
+        data = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_info_concurrent_requests(stub_server):
+    base_url = f"http://127.0.0.1:{stub_server.server_port}"
+
+    async def run():
+        async with await AsyncInfo.create(base_url, skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META) as info:
+            assert info.name_to_asset("ETH") == 0
+            return await asyncio.gather(*(info.user_state(f"0x{i:040x}") for i in range(20)))
+
+    responses = asyncio.run(run())
+    assert [response["echo"]["user"] for response in responses] == [f"0x{i:040x}" for i in range(20)]
+    assert len(stub_server.requests) == 20
+
+
+def test_async_info_raises_like_sync_client(stub_server):
+    base_url = f"http://127.0.0.1:{stub_server.server_port}"
+
+    async def run(payload):
+        async with AsyncInfo(base_url, skip_ws=True) as info:
+            await info.post("/info", payload)
+
+    with pytest.raises(ClientError) as exc_info:
+        asyncio.run(run({"type": "clientError"}))
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.error_message == "rate limited"
+    with pytest.raises(ServerError):
+        asyncio.run(run({"type": "serverError"}))
+
+
+def test_async_exchange_signs_and_posts_order(stub_server):
+    base_url = f"http://127.0.0.1:{stub_server.server_port}"
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+
+    async def run():
+        exchange = await AsyncExchange.create(wallet, base_url, meta=TEST_META, spot_meta=TEST_SPOT_META)
+        try:
+            return await exchange.order("ETH", True, 0.1, 1000, {"limit": {"tif": "Gtc"}})
+        finally:
+            await exchange.close()
+
+    response = asyncio.run(run())
+    payload = response["echo"]
+    assert payload["action"]["type"] == "order"
+    assert payload["action"]["orders"][0] == {
+        "a": 0,
+        "b": True,
+        "p": "1000",
+        "s": "0.1",
+        "r": False,
+        "t": {"limit": {"tif": "Gtc"}},
+    }
+    assert set(payload["signature"]) == {"r", "s", "v"}
@@ -0,0 +1,44 @@
+import eth_account
+import pytest
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.utils.signing import NonceAllocator
+from hyperliquid.utils.types import Meta
+
+META: Meta = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+
+
+@pytest.fixture
+def wallet():
+    return eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+
+
+@pytest.fixture
+def info():
+    return Info(skip_ws=True, meta=META, spot_meta={"universe": [], "tokens": []})
+
+
+@pytest.fixture
+def posted():
+    """The payloads the exchange fixture posted to /exchange, in order."""
+    return []
+
+
+@pytest.fixture
+def respond():
+    """Builds the exchange fixture's response to a posted payload, override it to return statuses."""
+    return lambda payload: {"status": "ok"}
+
+
+@pytest.fixture
+def exchange(monkeypatch, wallet, info, posted, respond):
+    def post(url_path, payload):
+        posted.append(payload)
+        return respond(payload)
+
+    exchange = Exchange(wallet, info=info)
+    # nonces reserved by one test must not be skipped by the next
+    exchange.nonce_allocator = NonceAllocator()
+    monkeypatch.setattr(exchange, "post", post)
+    return exchange
@@ -0,0 +1,147 @@
+import json
+import threading
+import time
+
+import pytest
+import websocket
+
+from hyperliquid.info import Info
+from hyperliquid.utils.dispatcher import Dispatcher
+from hyperliquid.utils.types import AllMidsSubscription, Any, List
+from hyperliquid.websocket_manager import WebsocketManager
+
+
+class NullWebsocket(websocket.WebSocketApp):
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        pass
+
+    def close(self, **kwargs):
+        pass
+
+
+class GatedCallback:
+    """Records messages, the first call blocks until the gate is opened."""
+
+    def __init__(self):
+        self.messages = []
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def __call__(self, msg):
+        self.started.set()
+        self.gate.wait(5)
+        self.messages.append(msg)
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = Dispatcher(workers=2, max_queue_size=3)
+    yield dispatcher
+    dispatcher.stop()
+
+
+def test_slow_callback_does_not_delay_other_subscriptions(dispatcher):
+    slow = GatedCallback()
+    fast: List[Any] = []
+    slow_queue = dispatcher.add_queue(slow)
+    fast_queue = dispatcher.add_queue(fast.append, max_queue_size=100)
+    slow_queue(0)
+    assert slow.started.wait(5)
+    for i in range(10):
+        fast_queue(i)
+    assert wait_until(lambda: len(fast) == 10)
+    assert fast == list(range(10))
+    slow.gate.set()
+    assert wait_until(lambda: slow.messages == [0])
+
+
+@pytest.mark.parametrize(
+    "policy, expected, dropped",
+    [("drop_oldest", [0, 3, 4, 5], 2), ("conflate", [0, 5], 4)],
+)
+def test_overflow_policies(dispatcher, policy, expected, dropped):
+    callback = GatedCallback()
+    subscription_queue = dispatcher.add_queue(callback, policy=policy)
+    subscription_queue(0)
+    assert callback.started.wait(5)
+    for i in range(1, 6):
+        subscription_queue(i)
+    assert subscription_queue.dropped == dropped
+    callback.gate.set()
+    assert wait_until(lambda: len(callback.messages) == len(expected))
+    assert callback.messages == expected
+    stats = dispatcher.stats()
+    assert stats["received"] == 6 and stats["delivered"] == len(expected) and stats["dropped"] == dropped
+
+
+def test_block_policy_waits_for_the_callback(dispatcher):
+    callback = GatedCallback()
+    subscription_queue = dispatcher.add_queue(callback, max_queue_size=2, policy="block")
+    subscription_queue(0)
+    assert callback.started.wait(5)
+    producer = threading.Thread(target=lambda: [subscription_queue(i) for i in range(1, 5)])
+    producer.start()
+    assert wait_until(lambda: subscription_queue.depth == 2)
+    time.sleep(0.05)
+    assert producer.is_alive()
+    callback.gate.set()
+    producer.join(5)
+    assert wait_until(lambda: callback.messages == [0, 1, 2, 3, 4])
+    assert subscription_queue.dropped == 0 and subscription_queue.max_depth == 2
+
+
+def test_websocket_manager_dispatches_to_queues(dispatcher):
+    manager = WebsocketManager("http://localhost", dispatcher=dispatcher)
+    manager.ws = NullWebsocket(manager.ws_url)
+    manager.on_open(manager.ws)
+    received: List[Any] = []
+    subscription: AllMidsSubscription = {"type": "allMids"}
+    subscription_id = manager.subscribe(subscription, received.append)
+    manager.subscribe({"type": "bbo", "coin": "ETH"}, lambda _: None, policy="conflate")
+    assert dispatcher.stats()["queues"] == 2
+
+    msg = {"channel": "allMids", "data": {"mids": {"ETH": "1900.5"}}}
+    manager.on_message(None, json.dumps(msg))
+    assert wait_until(lambda: received == [msg])
+
+    assert manager.unsubscribe(subscription, subscription_id)
+    assert dispatcher.stats()["queues"] == 1
+    manager.on_message(None, json.dumps(msg))
+    time.sleep(0.05)
+    assert received == [msg]
+
+
+def test_info_subscribe_conflate():
+    info = Info(
+        skip_ws=True, meta={"universe": [{"name": "ETH", "szDecimals": 4}]}, spot_meta={"universe": [], "tokens": []}
+    )
+    info.ws_manager = WebsocketManager("http://localhost")
+    info.ws_manager.ws = NullWebsocket(info.ws_manager.ws_url)
+    info.ws_manager.on_open(info.ws_manager.ws)
+    try:
+        callback = GatedCallback()
+        info.subscribe({"type": "l2Book", "coin": "ETH"}, callback, conflate=True)
+        with pytest.raises(ValueError):
+            info.subscribe({"type": "trades", "coin": "ETH"}, callback, conflate=True)
+
+        msgs = [{"channel": "l2Book", "data": {"coin": "ETH", "time": t, "levels": [[], []]}} for t in range(5)]
+        info.ws_manager.on_message(None, json.dumps(msgs[0]))
+        assert callback.started.wait(5)
+        for msg in msgs[1:]:
+            info.ws_manager.on_message(None, json.dumps(msg))
+        callback.gate.set()
+        assert wait_until(lambda: len(callback.messages) == 2)
+        assert callback.messages == [msgs[0], msgs[-1]]
+        assert info.ws_manager.owned_dispatcher is not None
+        assert info.ws_manager.owned_dispatcher.stats()["dropped"] == 3
+    finally:
+        info.ws_manager.stop()
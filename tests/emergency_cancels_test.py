@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+import hyperliquid.emergency_cancels
+from hyperliquid.emergency_cancels import EmergencyCancels
+from hyperliquid.utils.signing import get_timestamp_ms, recover_agent_or_user_from_l1_action
+from hyperliquid.utils.types import Any, Dict
+
+OPEN_ORDERS = [{"coin": "ETH", "oid": 11}, {"coin": "BTC", "oid": 12}]
+
+
+def cancel_all_payload(emergency: EmergencyCancels) -> Dict[str, Any]:
+    assert emergency.cancel_all is not None
+    return emergency.cancel_all.payload
+
+
+def test_fire_sends_presigned_actions_without_signing(exchange, posted, wallet, monkeypatch):
+    emergency = EmergencyCancels(exchange, open_orders=lambda: OPEN_ORDERS)
+    emergency.refresh()
+    now = get_timestamp_ms()
+    monkeypatch.setattr(hyperliquid.emergency_cancels, "sign_l1_action", None)
+    assert emergency.fire() == [{"status": "ok"}] * 2
+
+    cancel, schedule = posted
+    assert cancel["action"] == {"type": "cancel", "cancels": [{"a": 1, "o": 11}, {"a": 0, "o": 12}]}
+    assert schedule["action"]["type"] == "scheduleCancel" and schedule["action"]["time"] >= now + 9000
+    for payload in posted:
+        assert payload["nonce"] >= now + 4000 and now < payload["expiresAfter"] <= now + 10000
+        signer = recover_agent_or_user_from_l1_action(
+            payload["action"], payload["signature"], None, payload["nonce"], payload["expiresAfter"], True
+        )
+        assert signer == wallet.address
+    # nonces of regular actions stay below the reserved ones
+    assert exchange.nonce_allocator.next() < min(payload["nonce"] for payload in posted)
+
+
+def test_expired_actions_are_signed_again(exchange, posted):
+    emergency = EmergencyCancels(exchange, open_orders=lambda: OPEN_ORDERS, ttl_ms=0)
+    emergency.refresh()
+    stale_nonce = cancel_all_payload(emergency)["nonce"]
+    time.sleep(0.002)
+    emergency.fire()
+    assert [payload["action"]["type"] for payload in posted] == ["cancel", "scheduleCancel"]
+    assert posted[0]["nonce"] != stale_nonce
+
+    # without open orders at the last refresh only the scheduleCancel is sent
+    posted.clear()
+    no_orders = EmergencyCancels(exchange, open_orders=lambda: [])
+    no_orders.refresh()
+    no_orders.fire()
+    assert [payload["action"]["type"] for payload in posted] == ["scheduleCancel"]
+    with pytest.raises(ValueError):
+        EmergencyCancels(exchange, schedule_delay_ms=5000)
+
+
+def test_actions_are_refreshed_in_the_background(exchange):
+    open_orders = [OPEN_ORDERS[0]]
+    emergency = EmergencyCancels(exchange, open_orders=lambda: list(open_orders), interval=0.01).start()
+    try:
+        assert len(cancel_all_payload(emergency)["action"]["cancels"]) == 1
+        open_orders.append(OPEN_ORDERS[1])
+        deadline = time.monotonic() + 5
+        while len(cancel_all_payload(emergency)["action"]["cancels"]) != 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        emergency.stop()
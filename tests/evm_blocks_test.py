@@ -0,0 +1,120 @@
+import msgpack
+import pytest
+
+from hyperliquid.utils.evm_blocks import (
+    buffer_to_bytes,
+    buffer_to_hex,
+    buffer_to_int,
+    buffers_to_hex,
+    decode_buffer_object,
+    index_evm_block_files,
+    read_evm_block_file,
+)
+
+lz4_frame = pytest.importorskip("lz4.frame")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def buffer(data):
+    return {"type": "Buffer", "data": list(data)}
+
+
+def make_block(number, n_txs, as_buffers):
+    wrap = buffer if as_buffers else bytes
+    transactions = []
+    for i in range(n_txs):
+        content = {
+            "chainId": wrap(b"\x03\xe7"),
+            "nonce": wrap(i.to_bytes(2, "big")),
+            "gas": wrap(b"\x52\x08"),
+            "to": wrap(b"\x11" * 20),
+            "value": wrap((10**20).to_bytes(9, "big")),
+            "input": wrap(b""),
+        }
+        if i % 2:
+            content.update(
+                maxFeePerGas=wrap(b"\x3b\x9a\xca\x00"),
+                maxPriorityFeePerGas=wrap(b"\x01"),
+                accessList=[{"address": wrap(b"\x22" * 20), "storageKeys": []}],
+            )
+            tx_type = "Eip1559"
+        else:
+            content["gasPrice"] = wrap(b"\x3b\x9a\xca\x00")
+            tx_type = "Legacy"
+        transactions.append(
+            {"transaction": {tx_type: content}, "signature": [wrap(b"\x01" * 32), wrap(b"\x02" * 32), wrap(b"\x1b")]}
+        )
+    header = {
+        "parentHash": wrap(bytes([number - 1]) * 32),
+        "sha3Uncles": wrap(b"\x00" * 32),
+        "miner": wrap(b"\x00" * 20),
+        "stateRoot": wrap(b"\x05" * 32),
+        "transactionsRoot": wrap(b"\x06" * 32),
+        "receiptsRoot": wrap(b"\x07" * 32),
+        "number": wrap(number.to_bytes(3, "big")),
+        "gasLimit": wrap((30_000_000).to_bytes(4, "big")),
+        "gasUsed": wrap((21_000 * n_txs).to_bytes(4, "big")),
+        "timestamp": wrap((1_700_000_000 + number).to_bytes(4, "big")),
+        "extraData": wrap(b""),
+        "baseFeePerGas": wrap(b"\x07"),
+    }
+    return {
+        "block": {
+            "Reth115": {
+                "header": {"hash": wrap(bytes([number]) * 32), "header": header},
+                "body": {"transactions": transactions},
+            }
+        }
+    }
+
+
+def test_buffer_decoding():
+    assert buffer_to_bytes(buffer(b"\x01\x02")) == b"\x01\x02"
+    assert buffer_to_bytes(b"\x01\x02") == b"\x01\x02"
+    assert buffer_to_bytes(None) is None
+    assert buffer_to_int(buffer(b"\x01\x00")) == 256 and buffer_to_int(b"") == 0 and buffer_to_int(None) == 0
+    assert buffer_to_hex(buffer(b"\xab\x01")) == buffer_to_hex(b"\xab\x01") == "0xab01" and buffer_to_hex(None) is None
+    with pytest.raises(ValueError):
+        buffer_to_bytes("0x01")
+
+
+def test_buffer_objects_decoded_while_unpacking():
+    block = make_block(3, 2, as_buffers=True)
+    packed = msgpack.packb(block)
+    decoded = msgpack.unpackb(packed, object_hook=decode_buffer_object)
+    assert decoded == msgpack.unpackb(msgpack.packb(make_block(3, 2, as_buffers=False)))
+    assert msgpack.unpackb(msgpack.packb({"type": "Legacy"}), object_hook=decode_buffer_object) == {"type": "Legacy"}
+    assert buffers_to_hex(decoded) == buffers_to_hex(block)
+    assert buffers_to_hex(decoded)["block"]["Reth115"]["header"]["hash"] == "0x" + "03" * 32
+
+
+def test_index_evm_block_files(tmp_path):
+    paths = []
+    for number in range(1, 8):
+        path = str(tmp_path / f"{number}.rmp.lz4")
+        block = make_block(number, number % 3, as_buffers=number % 2 == 0)
+        with open(path, "wb") as f:
+            f.write(lz4_frame.compress(msgpack.packb([block] if number == 7 else block)))
+        paths.append(path)
+    assert len(list(read_evm_block_file(paths[-1]))) == 1
+    raw_block = next(read_evm_block_file(paths[1], decode_buffers=False))
+    assert raw_block["block"]["Reth115"]["header"]["hash"] == buffer(b"\x02" * 32)
+
+    stats = index_evm_block_files(paths, str(tmp_path / "out_"), row_group_size=3)
+    assert stats["blocks"] == 7 and stats["transactions"] == sum(n % 3 for n in range(1, 8))
+
+    blocks = pq.read_table(str(tmp_path / "out_blocks.parquet"))
+    assert pq.ParquetFile(str(tmp_path / "out_blocks.parquet")).num_row_groups == 3
+    assert blocks.column("number").to_pylist() == list(range(1, 8))
+    assert blocks.column("hash").to_pylist()[1] == b"\x02" * 32
+    assert blocks.column("timestamp").to_pylist()[0] == 1_700_000_001
+    assert blocks.column("transactionCount").to_pylist() == [n % 3 for n in range(1, 8)]
+
+    txs = pq.read_table(str(tmp_path / "out_transactions.parquet")).to_pylist()
+    assert [(tx["blockNumber"], tx["index"]) for tx in txs] == [(1, 0), (2, 0), (2, 1), (4, 0), (5, 0), (5, 1), (7, 0)]
+    legacy, eip1559 = txs[1], txs[2]
+    assert legacy["type"] == "Legacy" and legacy["gasPrice"] == 10**9 and legacy["maxFeePerGas"] is None
+    assert eip1559["type"] == "Eip1559" and eip1559["maxFeePerGas"] == 10**9 and eip1559["gasPrice"] is None
+    assert int.from_bytes(legacy["value"], "big") == 10**20 and legacy["to"] == b"\x11" * 20
+    assert legacy["signature"] == [b"\x01" * 32, b"\x02" * 32, b"\x1b"] and legacy["chainId"] == 999
+    assert msgpack.unpackb(eip1559["accessList"])[0]["address"] == b"\x22" * 20
@@ -0,0 +1,66 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hyperliquid.pipelined_exchange import PipelinedExchange
+from hyperliquid.utils.signing import recover_agent_or_user_from_l1_action
+
+
+def test_ladder_orders(exchange, posted, wallet):
+    np = pytest.importorskip("numpy")
+    prices = 1900 - 0.123456 * np.arange(5)
+    sizes = np.full(5, 0.123456)
+    assert (
+        exchange.ladder_orders("ETH", True, sizes, prices, {"limit": {"tif": "Alo"}}, quantize=True)["status"] == "ok"
+    )
+    action, signature, nonce = posted[0]["action"], posted[0]["signature"], posted[0]["nonce"]
+    assert [wire["p"] for wire in action["orders"]] == ["1900", "1899.9", "1899.8", "1899.6", "1899.5"]
+    assert {wire["s"] for wire in action["orders"]} == {"0.1235"}
+    assert {wire["a"] for wire in action["orders"]} == {1}
+    signer = recover_agent_or_user_from_l1_action(action, signature, None, nonce, None, True)
+    assert signer == wallet.address
+
+
+def test_concurrent_actions_get_distinct_nonces(exchange, posted):
+    with ThreadPoolExecutor(32) as executor:
+        list(executor.map(lambda oid: exchange.cancel("ETH", oid), range(256)))
+    nonces = [payload["nonce"] for payload in posted]
+    assert len(set(nonces)) == len(nonces) == 256
+
+
+def test_pipelined_exchange_signs_while_actions_are_in_flight(monkeypatch, wallet, info):
+    payloads = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def post(url_path, payload):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+            payloads.append(payload)
+        return {"status": "ok", "nonce": payload["nonce"]}
+
+    with PipelinedExchange(wallet, info=info, max_in_flight=4) as exchange:
+        monkeypatch.setattr(exchange, "post", post)
+        start = time.monotonic()
+        futures = [exchange.cancel("ETH", oid) for oid in range(8)]
+        exchange.set_expires_after(123)
+        results = [future.result(timeout=5) for future in futures]
+        elapsed = time.monotonic() - start
+    # one at a time the round trips alone would take 8 * 0.05s
+    assert elapsed < 0.3 and max_in_flight >= 2
+    nonces = [result["nonce"] for result in results]
+    assert all(a < b for a, b in zip(nonces, nonces[1:]))
+    for payload in payloads:
+        assert payload["expiresAfter"] is None
+        signer = recover_agent_or_user_from_l1_action(
+            payload["action"], payload["signature"], None, payload["nonce"], None, True
+        )
+        assert signer == wallet.address
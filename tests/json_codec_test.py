@@ -0,0 +1,43 @@
+import pytest
+
+from hyperliquid.info import Info
+from hyperliquid.utils.json_codec import JSON_CODECS, JsonCodec, get_json_codec
+
+TEST_MESSAGE = {
+    "channel": "l2Book",
+    "data": {"coin": "ETH", "time": 1700000000000, "levels": [[{"px": "1900.5", "sz": "1.25", "n": 3}], []]},
+}
+
+
+@pytest.fixture(params=list(JSON_CODECS))
+def codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return get_json_codec(request.param)
+
+
+def test_codec_round_trip(codec):
+    assert codec.name in JSON_CODECS
+    encoded = codec.dumps(TEST_MESSAGE)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == TEST_MESSAGE
+    assert codec.loads(encoded.decode()) == TEST_MESSAGE
+    assert codec.loads("0.1") == 0.1
+
+
+def test_codec_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_get_json_codec():
+    codec = JsonCodec()
+    assert get_json_codec(codec) is codec
+    assert isinstance(get_json_codec(), JsonCodec)
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
+
+
+def test_info_uses_selected_codec():
+    info = Info(skip_ws=True, meta={"universe": []}, spot_meta={"universe": [], "tokens": []}, json_codec="json")
+    assert type(info.json_codec) is JsonCodec
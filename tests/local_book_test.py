@@ -0,0 +1,55 @@
+import pytest
+
+from hyperliquid.utils.local_book import LocalBook
+from hyperliquid.utils.types import L2BookData
+
+TEST_BOOK: L2BookData = {
+    "coin": "ETH",
+    "time": 1000,
+    "levels": (
+        [
+            {"px": "100.0", "sz": "1.0", "n": 1},
+            {"px": "99.5", "sz": "2.0", "n": 2},
+            {"px": "99.0", "sz": "3.0", "n": 1},
+        ],
+        [{"px": "101.0", "sz": "1.5", "n": 1}, {"px": "102.0", "sz": "2.5", "n": 3}],
+    ),
+}
+
+
+def test_local_book_best_prices_and_depth():
+    book = LocalBook("ETH")
+    assert book.best_bid() is None and book.mid() is None
+    assert book.apply_snapshot(TEST_BOOK)
+    assert book.best_bid() == 100.0
+    assert book.best_ask() == 101.0
+    assert book.mid() == 100.5
+    assert book.depth_at_price("B", 99.5) == 2.0
+    assert book.depth_at_price("A", 102.0) == 2.5
+    assert book.depth_at_price("A", 101.5) == 0.0
+    assert book.depth_through_price("B", 99.5) == 3.0
+    assert book.depth_through_price("A", 100.0) == 0.0
+    assert book.depth_through_price("A", 110.0) == 4.0
+
+
+def test_local_book_cumulative_depth_and_vwap():
+    book = LocalBook("ETH")
+    book.apply_snapshot(TEST_BOOK)
+    # 101 * 1.5 = 151.5 of notional at the first ask level, the remaining 48.5 is filled at 102
+    assert book.cumulative_depth("A", 200.0) == pytest.approx(1.5 + 48.5 / 102)
+    assert book.cumulative_depth("A", 10_000.0) == pytest.approx(4.0)
+    assert book.vwap("A", 1.0) == 101.0
+    assert book.vwap("A", 2.0) == pytest.approx((101.0 * 1.5 + 102.0 * 0.5) / 2)
+    assert book.vwap("B", 6.0) == pytest.approx((100.0 + 99.5 * 2 + 99.0 * 3) / 6)
+    assert book.vwap("B", 6.1) is None
+
+
+def test_local_book_ignores_stale_updates():
+    book = LocalBook("ETH")
+    book.apply_snapshot(TEST_BOOK)
+    newer: L2BookData = {"coin": "ETH", "time": 2000, "levels": ([{"px": "100.5", "sz": "1", "n": 1}], [])}
+    book.on_message({"channel": "l2Book", "data": newer})
+    assert book.best_bid() == 100.5
+    assert book.best_ask() is None
+    assert not book.apply_snapshot(TEST_BOOK)
+    assert book.best_bid() == 100.5
@@ -0,0 +1,121 @@
+import json
+import threading
+
+import eth_account
+import pytest
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.utils.constants import MAINNET_API_URL, TESTNET_API_URL
+from hyperliquid.utils.meta_cache import MetaCache
+from hyperliquid.utils.types import Meta, SpotMeta
+
+TEST_SPOT_META: SpotMeta = {
+    "universe": [{"name": "PURR/USDC", "tokens": [1, 0], "index": 0, "isCanonical": True}],
+    "tokens": [
+        {
+            "name": "USDC",
+            "szDecimals": 8,
+            "weiDecimals": 8,
+            "index": 0,
+            "tokenId": "0x6d1e7cde53ba9467b783cb7c530ce054",
+            "isCanonical": True,
+            "evmContract": None,
+            "fullName": None,
+        },
+        {
+            "name": "PURR",
+            "szDecimals": 0,
+            "weiDecimals": 5,
+            "index": 1,
+            "tokenId": "0xc1fb593aeffbeb02f85e0308e9956a90",
+            "isCanonical": True,
+            "evmContract": None,
+            "fullName": None,
+        },
+    ],
+}
+TEST_META: Meta = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+
+
+@pytest.fixture
+def info_requests(monkeypatch):
+    requests = []
+
+    def post(self, url_path, payload=None):
+        requests.append(payload["type"])
+        return {"spotMeta": TEST_SPOT_META, "meta": TEST_META}[payload["type"]]
+
+    monkeypatch.setattr(Info, "post", post)
+    return requests
+
+
+def test_info_loads_asset_tables_from_cache(tmp_path, info_requests):
+    cache = MetaCache(str(tmp_path / "meta"))
+    fresh = Info(skip_ws=True, meta_cache=cache)
+    assert info_requests == ["spotMeta", "meta"]
+
+    cached = Info(skip_ws=True, meta_cache=MetaCache(str(tmp_path / "meta")))
+    assert info_requests == ["spotMeta", "meta"]
+    assert cached.coin_to_asset == fresh.coin_to_asset
+    assert cached.name_to_coin == fresh.name_to_coin
+    assert cached.asset_to_sz_decimals == fresh.asset_to_sz_decimals
+    assert cached.name_to_asset("PURR/USDC") == 10000
+    assert cached.asset_to_sz_decimals[1] == 4
+
+
+def test_expired_or_mismatched_cache_is_refetched(tmp_path, info_requests):
+    path = str(tmp_path / "meta")
+    Info(skip_ws=True, meta_cache=MetaCache(path))
+    Info(skip_ws=True, meta_cache=MetaCache(path, ttl=-1))
+    assert info_requests == ["spotMeta", "meta"] * 2
+    Info("http://localhost:3001", skip_ws=True, meta_cache=MetaCache(path))
+    assert info_requests == ["spotMeta", "meta"] * 3
+
+    entry_path = MetaCache(path)._path(MetaCache._key(MAINNET_API_URL, None))
+    with open(entry_path) as f:
+        data = json.load(f)
+    data["version"] = MetaCache.VERSION + 1
+    with open(entry_path, "w") as f:
+        json.dump(data, f)
+    Info(skip_ws=True, meta_cache=MetaCache(path))
+    assert info_requests == ["spotMeta", "meta"] * 4
+
+
+def test_refresh_meta_bypasses_cache(tmp_path, info_requests):
+    cache = MetaCache(str(tmp_path / "meta"))
+    Info(skip_ws=True, meta_cache=cache)
+    info = Info(skip_ws=True, meta_cache=cache)
+    assert info_requests == ["spotMeta", "meta"]
+    info.refresh_meta()
+    assert info_requests == ["spotMeta", "meta"] * 2
+    assert info.name_to_asset("ETH") == 1
+
+
+def test_exchange_shares_info(info_requests):
+    info = Info(skip_ws=True)
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+    exchange = Exchange(wallet, info=info)
+    assert exchange.info is info
+    assert info_requests == ["spotMeta", "meta"]
+    with pytest.raises(ValueError):
+        Exchange(wallet, meta=TEST_META, info=info)
+    with pytest.raises(ValueError):
+        Exchange(wallet, TESTNET_API_URL, info=info)
+
+
+def test_concurrent_writers_keep_each_others_entries(tmp_path):
+    path = str(tmp_path / "meta")
+    tables = {"coin_to_asset": {"ETH": 1}, "name_to_coin": {"ETH": "ETH"}, "asset_to_sz_decimals": {1: 4}}
+    urls = [f"http://localhost:{port}" for port in range(3000, 3016)]
+    threads = [threading.Thread(target=MetaCache(path).store, args=(url, None, tables)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(MetaCache(path).load(url, None) == tables for url in urls)
+    MetaCache(path).invalidate(urls[0])
+    assert MetaCache(path).load(urls[0], None) is None
+    assert MetaCache(path).load(urls[1], None) == tables
+    MetaCache(path).invalidate()
+    assert MetaCache(path).load(urls[1], None) is None
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from hyperliquid.order_batcher import OrderBatcher
+from hyperliquid.utils.error import ClientError
+from hyperliquid.utils.signing import OrderType
+from hyperliquid.utils.types import Any, Cloid, List
+
+GTC: OrderType = {"limit": {"tif": "Gtc"}}
+
+
+@pytest.fixture
+def respond():
+    def respond(payload):
+        action = payload["action"]
+        statuses: List[Any]
+        if action["type"] == "order":
+            statuses = [{"resting": {"oid": int(wire["p"])}} for wire in action["orders"]]
+        elif action["type"] == "batchModify":
+            statuses = [{"resting": {"oid": wire["oid"]}} for wire in action["modifies"]]
+        else:
+            statuses = ["success"] * len(action["cancels"])
+        return {"status": "ok", "response": {"type": action["type"], "data": {"statuses": statuses}}}
+
+    return respond
+
+
+def test_concurrent_orders_are_sent_as_one_action(exchange, posted):
+    with OrderBatcher(exchange, window=0.2) as batcher:
+        futures = {}
+
+        def place(px):
+            futures[px] = batcher.order("ETH", True, 0.1, px, GTC)
+
+        threads = [threading.Thread(target=place, args=(px,)) for px in range(1000, 1010)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert {px: future.result(timeout=5) for px, future in futures.items()} == {
+            px: {"resting": {"oid": px}} for px in range(1000, 1010)
+        }
+    assert len(posted) == 1 and len(posted[0]["action"]["orders"]) == 10
+    assert batcher.stats() == {"pending": 0, "requests": 10, "actions": 1}
+
+
+def test_batches_are_split_and_cancels_go_first(exchange, posted):
+    batcher = OrderBatcher(exchange, window=60, max_batch_size=2)
+    orders = [batcher.order("BTC", False, 0.001, px, GTC) for px in (50000, 50001, 50002)]
+    modify = batcher.modify_order(7, "ETH", True, 0.1, 2000, GTC)
+    cancel = batcher.cancel("ETH", 12)
+    cancel_by_cloid = batcher.cancel_by_cloid("ETH", Cloid.from_int(5))
+    builder_order = batcher.order("ETH", True, 0.1, 1900, GTC, builder={"b": "0xABC", "f": 1})
+    # the first two orders filled a batch and were sent, the rest is sent by close
+    assert orders[0].result(timeout=5) == {"resting": {"oid": 50000}}
+    batcher.close()
+    assert [f.result() for f in orders] == [{"resting": {"oid": px}} for px in (50000, 50001, 50002)]
+    assert modify.result() == {"resting": {"oid": 7}}
+    assert cancel.result() == "success" and cancel_by_cloid.result() == "success"
+    assert builder_order.result() == {"resting": {"oid": 1900}}
+    actions = [payload["action"] for payload in posted]
+    types = [action["type"] for action in actions]
+    assert [t for t in types if t != "order"] == ["cancel", "cancelByCloid", "batchModify"]
+    assert [len(action["orders"]) for action in actions if action["type"] == "order"] == [2, 1, 1]
+    # the builder order is its own action, sent by close after the cancels
+    assert actions[-1]["builder"] == {"b": "0xabc", "f": 1} and types.index("cancel") < len(types) - 1
+    with pytest.raises(RuntimeError):
+        batcher.cancel("ETH", 13)
+    with OrderBatcher(exchange) as batcher, pytest.raises(KeyError):
+        batcher.order("DOGE", True, 1, 1, GTC)
+
+
+def test_failed_actions_resolve_every_future(exchange, monkeypatch):
+    monkeypatch.setattr(exchange, "_post_action", lambda *args: {"status": "err", "response": "Insufficient margin"})
+    with OrderBatcher(exchange, window=60) as batcher:
+        rejected = [batcher.order("ETH", True, 0.1, px, GTC) for px in (1900, 1901)]
+    assert [future.result() for future in rejected] == [{"error": "Insufficient margin"}] * 2
+
+    def raise_client_error(*args):
+        raise ClientError(429, None, "null", None)
+
+    monkeypatch.setattr(exchange, "_post_action", raise_client_error)
+    with OrderBatcher(exchange, window=60) as batcher:
+        failed = [batcher.cancel("ETH", oid) for oid in (1, 2)]
+    assert all(isinstance(future.exception(), ClientError) for future in failed)
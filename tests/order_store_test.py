@@ -0,0 +1,220 @@
+from types import SimpleNamespace
+
+import asyncio
+import time
+
+import pytest
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.pipelined_exchange import PipelinedExchange
+from hyperliquid.utils.order_store import OrderStore, TrackedOrder
+from hyperliquid.utils.signing import OrderRequest, get_timestamp_ms
+from hyperliquid.utils.types import Any, Cloid, Dict, List, Optional, Tuple
+
+CLOID = Cloid.from_int(7)
+
+
+def ws_order(
+    oid: int, status: str, sz: str = "1.0", coin: str = "ETH", cloid: Optional[str] = None, orig_sz: str = "1.0"
+) -> Dict[str, Any]:
+    order = {"coin": coin, "side": "B", "limitPx": "1900.0", "sz": sz, "oid": oid, "timestamp": 0, "origSz": orig_sz}
+    if cloid is not None:
+        order["cloid"] = cloid
+    return {"order": order, "status": status, "statusTimestamp": 0}
+
+
+def updates(*orders: Dict[str, Any]) -> Dict[str, Any]:
+    return {"channel": "orderUpdates", "data": list(orders)}
+
+
+def fills(*fills_: Tuple[int, int, str], is_snapshot: bool = False) -> Dict[str, Any]:
+    data = [{"coin": "ETH", "px": "1900.0", "sz": sz, "side": "B", "oid": oid, "tid": tid} for oid, tid, sz in fills_]
+    return {"channel": "userFills", "data": {"user": "0x0", "isSnapshot": is_snapshot, "fills": data}}
+
+
+def tracked(store: OrderStore, oid: int) -> TrackedOrder:
+    order = store.get(oid)
+    assert order is not None
+    return order
+
+
+def test_orders_are_indexed_from_responses_and_updates():
+    store = OrderStore()
+    requests: List[OrderRequest] = [
+        {"coin": "ETH", "is_buy": True, "sz": 1.0, "limit_px": 1900.0, "order_type": {}, "reduce_only": False},
+        {"coin": "BTC", "is_buy": False, "sz": 0.01, "limit_px": 70000.0, "order_type": {}, "reduce_only": False},
+        {"coin": "BTC", "is_buy": False, "sz": 0.01, "limit_px": 60000.0, "order_type": {}, "reduce_only": False},
+        {"coin": "BTC", "is_buy": False, "sz": 0.01, "limit_px": 1.0, "order_type": {}, "reduce_only": False},
+    ]
+    requests[0]["cloid"] = CLOID
+    statuses = [{"resting": {"oid": 1}}, {"resting": {"oid": 2}}, {"filled": {"oid": 3}}, {"error": "bad price"}]
+    store.on_order_response(requests, {"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}})
+    assert store.get(1) is store.get_by_cloid(CLOID)
+    assert store.get(1) is store.get_by_cloid(CLOID.to_raw())
+    assert tracked(store, 1).side == "B"
+    assert tracked(store, 2).side == "A"
+    assert tracked(store, 3).status == "filled"
+    assert len(store) == 3
+    assert [order.oid for order in store.live_orders("BTC")] == [2]
+    assert sorted(order.oid for order in store.live_orders()) == [1, 2]
+
+    store.on_order_updates(updates(ws_order(2, "canceled", coin="BTC")))
+    assert tracked(store, 2).status == "canceled"
+    assert store.live_orders("BTC") == []
+    # a late "open" update, response or snapshot never revives a terminal order
+    store.on_order_updates(updates(ws_order(2, "open", coin="BTC")))
+    store.reconcile([ws_order(3, "open")["order"]], get_timestamp_ms() + 1)
+    assert tracked(store, 2).status == "canceled"
+    assert tracked(store, 3).status == "filled"
+
+
+def test_fills_reduce_the_remaining_size_once():
+    store = OrderStore()
+    store.on_order_updates(updates(ws_order(1, "open"), ws_order(2, "open")))
+    store.on_user_fills(fills((1, 10, "0.4")))
+    store.on_user_fills(fills((1, 10, "0.4")))
+    store.on_user_fills(fills((1, 11, "0.4"), (2, 12, "1.0"), is_snapshot=True))
+    assert tracked(store, 1).sz == 0.6
+    assert abs(tracked(store, 1).filled_sz - 0.4) < 1e-12
+    assert tracked(store, 2).sz == 1.0
+    typed = SimpleNamespace(data=SimpleNamespace(is_snapshot=False, fills=[SimpleNamespace(oid=1, tid=13, sz=0.6)]))
+    store.on_user_fills(typed)
+    assert tracked(store, 1).status == "filled"
+    assert tracked(store, 1).sz == 0
+    assert [order.oid for order in store.live_orders()] == [2]
+
+
+def test_fills_already_reflected_by_an_update_are_not_counted_twice():
+    store = OrderStore()
+    store.on_order_updates(updates(ws_order(1, "open", sz="2.0", orig_sz="2.0")))
+    store.on_order_updates(updates(ws_order(1, "open", sz="1.0", orig_sz="2.0")))
+    store.on_user_fills(fills((1, 10, "1.0")))
+    assert tracked(store, 1).sz == 1.0
+    assert tracked(store, 1).status == "open"
+    # and a fill seen before the update is not subtracted from the update's size again
+    store.on_user_fills(fills((1, 11, "0.5")))
+    store.on_order_updates(updates(ws_order(1, "open", sz="0.5", orig_sz="2.0")))
+    assert tracked(store, 1).sz == 0.5
+
+
+def test_reconcile_marks_vanished_orders_and_terminal_orders_are_evicted():
+    store = OrderStore(max_terminal_orders=2)
+    store.on_order_updates(updates(*(ws_order(oid, "open") for oid in range(1, 4))))
+    as_of = get_timestamp_ms() + 1
+    snapshot = [ws_order(1, "open", sz="0.5")["order"], ws_order(9, "open", cloid=CLOID.to_raw())["order"]]
+    store.reconcile(snapshot, as_of)
+    assert tracked(store, 1).sz == 0.5
+    assert tracked(store, 9).status == "open"
+    assert tracked(store, 9) is store.get_by_cloid(CLOID)
+    assert tracked(store, 2).status == "missing"
+    assert tracked(store, 3).status == "missing"
+
+    # orders that changed after the snapshot was requested are left alone
+    store.on_order_updates(updates(ws_order(10, "open")))
+    store.reconcile(snapshot, tracked(store, 10).updated)
+    assert tracked(store, 10).status == "open"
+
+    store.on_order_updates(updates(ws_order(9, "canceled", cloid=CLOID.to_raw())))
+    assert store.get(2) is None
+    assert tracked(store, 9) is store.get_by_cloid(CLOID)
+    assert tracked(store, 9).status == "canceled"
+    store.on_order_updates(updates(ws_order(1, "filled"), ws_order(10, "canceled")))
+    assert len(store) == 2
+    assert store.get_by_cloid(CLOID) is None
+    assert store.live_orders() == []
+
+
+def test_stale_snapshots_do_not_revert_newer_state():
+    store = OrderStore()
+    as_of = get_timestamp_ms() - 1
+    store.on_order_updates(updates(ws_order(1, "open")))
+    store.on_user_fills(fills((1, 10, "0.4")))
+    store.reconcile([ws_order(1, "open")["order"]], as_of)
+    assert tracked(store, 1).sz == 0.6
+
+
+def test_reconcile_only_marks_orders_of_the_covered_dexs_missing():
+    store = OrderStore()
+    store.on_order_updates(updates(ws_order(1, "open"), ws_order(2, "open", coin="test:ABC")))
+    store.reconcile([], get_timestamp_ms() + 1)
+    assert tracked(store, 1).status == "missing"
+    assert tracked(store, 2).status == "open"
+    store.reconcile([], get_timestamp_ms() + 1, ["", "test"])
+    assert tracked(store, 2).status == "missing"
+
+
+def test_info_order_store_subscribes_and_reconciles(monkeypatch):
+    info = Info(skip_ws=True, meta={"universe": []}, spot_meta={"universe": [], "tokens": []})
+    subscriptions: List[Tuple[Any, Any]] = []
+    reconnect_callbacks: List[Any] = []
+    open_orders = [ws_order(1, "open")["order"]]
+    monkeypatch.setattr(
+        info, "subscribe", lambda subscription, callback: subscriptions.append((subscription, callback))
+    )
+    monkeypatch.setattr(info, "add_reconnect_callback", reconnect_callbacks.append)
+    monkeypatch.setattr(info, "frontend_open_orders", lambda address, dex="": list(open_orders))
+
+    store = info.order_store("0xabc", reconcile_interval=0)
+    assert info.order_store("0xabc") is store
+    assert [subscription for subscription, _ in subscriptions] == [
+        {"type": "orderUpdates", "user": "0xabc"},
+        {"type": "userFills", "user": "0xabc"},
+    ]
+    assert tracked(store, 1).status == "open"
+    subscriptions[0][1](updates(ws_order(2, "open")))
+    assert tracked(store, 2).status == "open"
+
+    open_orders.append(ws_order(3, "open")["order"])
+    reconnect_callbacks[0]()
+    deadline = time.monotonic() + 5
+    while store.get(3) is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert tracked(store, 3).status == "open"
+    store.stop()
+
+
+def test_exchange_feeds_order_responses_to_the_store(monkeypatch, wallet, info):
+    response = {"status": "ok", "response": {"type": "order", "data": {"statuses": [{"resting": {"oid": 5}}]}}}
+    exchange = Exchange(wallet, info=info)
+    monkeypatch.setattr(exchange, "_post_action", lambda *args: response)
+    exchange.order_store = OrderStore()
+    exchange.order("ETH", True, 1.0, 1900.0, {"limit": {"tif": "Gtc"}})
+    assert tracked(exchange.order_store, 5).status == "open"
+
+    with PipelinedExchange(wallet, info=info) as pipelined:
+        pipelined.order_store = OrderStore()
+        monkeypatch.setattr(pipelined, "post", lambda url_path, payload: response)
+        assert pipelined.order("ETH", True, 1.0, 1900.0, {"limit": {"tif": "Gtc"}}).result() == response
+    assert tracked(pipelined.order_store, 5).side == "B"
+
+
+def test_async_info_order_store(monkeypatch):
+    pytest.importorskip("aiohttp")
+    from hyperliquid.async_info import AsyncInfo
+
+    subscriptions: List[Any] = []
+    dexs: List[str] = []
+
+    async def frontend_open_orders(address, dex=""):
+        dexs.append(dex)
+        return [ws_order(1, "open", coin=f"{dex}:ABC" if dex else "ETH")["order"]]
+
+    async def run():
+        info = AsyncInfo(skip_ws=True)
+        info._perp_dexs = ["", "test"]
+        monkeypatch.setattr(info, "subscribe", lambda subscription, callback: subscriptions.append(subscription))
+        monkeypatch.setattr(info, "add_reconnect_callback", lambda callback: None)
+        monkeypatch.setattr(info, "frontend_open_orders", frontend_open_orders)
+        try:
+            store = await info.order_store("0xabc", reconcile_interval=0)
+            assert await info.order_store("0xabc") is store
+            return store
+        finally:
+            await info.close()
+
+    store = asyncio.run(run())
+    assert dexs == ["", "test"]
+    assert len(subscriptions) == 2
+    assert tracked(store, 1).status == "open"
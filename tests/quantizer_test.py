@@ -0,0 +1,93 @@
+import random
+
+import eth_account
+import pytest
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.utils.quantizer import Quantizer
+from hyperliquid.utils.signing import float_to_wire
+from hyperliquid.utils.types import Meta, SpotMeta
+
+ASSET_TO_SZ_DECIMALS = {0: 5, 1: 4, 4: 0, 10_000: 2, 10_005: 0, 110_000: 1}
+
+
+@pytest.mark.parametrize(
+    "asset, px, expected",
+    [
+        (4, 1234.56, 1234.6),
+        (4, 123456.7, 123457.0),
+        (4, 0.0012345, 0.001234),
+        (4, 0.00123456, 0.001235),
+        (1, 0.0123456, 0.01),
+        (0, 30123.45, 30123.0),
+        (10_000, 0.00012345, 0.000123),
+        (10_005, 0.00012345, 0.00012345),
+        (110_000, 0.12345678, 0.12346),
+        (4, 9.99996, 10.0),
+        (4, 0.0, 0.0),
+        (4, -1234.56, -1234.6),
+    ],
+)
+def test_round_px(asset, px, expected):
+    quantizer = Quantizer(ASSET_TO_SZ_DECIMALS)
+    assert quantizer.round_px(asset, px) == expected
+    assert quantizer.px_to_wire(asset, px) == float_to_wire(expected)
+
+
+def test_round_sz():
+    quantizer = Quantizer(ASSET_TO_SZ_DECIMALS)
+    assert quantizer.round_sz(0, 0.123456) == 0.12346
+    assert quantizer.round_sz(4, 12.5) == 12.0
+    assert quantizer.round_sz(10_000, 1.005) == 1.0
+    assert quantizer.sz_to_wire(1, 0.1) == "0.1"
+    assert quantizer.sz_to_wire(4, 17.4) == "17"
+    with pytest.raises(ValueError):
+        quantizer.round_sz(0, float("nan"))
+    with pytest.raises(KeyError):
+        quantizer.round_sz(5, 1.0)
+
+
+def test_quantized_values_are_valid_on_the_wire():
+    quantizer = Quantizer(ASSET_TO_SZ_DECIMALS)
+    rng = random.Random(0)
+    for _ in range(5000):
+        asset = rng.choice(list(ASSET_TO_SZ_DECIMALS))
+        px = rng.uniform(0, 1) * 10 ** rng.randrange(-6, 7)
+        sz = rng.uniform(0, 1) * 10 ** rng.randrange(-3, 6)
+        wire_px = quantizer.px_to_wire(asset, px)
+        assert wire_px == float_to_wire(quantizer.round_px(asset, px))
+        assert quantizer.sz_to_wire(asset, sz) == float_to_wire(quantizer.round_sz(asset, sz))
+        whole, _, frac = wire_px.partition(".")
+        assert len(frac) <= quantizer.max_px_decimals(asset)
+        assert not frac or len((whole + frac).lstrip("0")) <= 5
+
+
+def test_vectorized_quantizer_matches_scalar():
+    np = pytest.importorskip("numpy")
+    quantizer = Quantizer(ASSET_TO_SZ_DECIMALS)
+    rng = random.Random(1)
+    px = [rng.uniform(-1, 1) * 10 ** rng.randrange(-6, 7) for _ in range(5000)]
+    px += [0.0, 1.0, 10.0, 1e-3, 1e5, 99999.5, 9.99995]
+    sz = [rng.uniform(0, 1) * 10 ** rng.randrange(-3, 6) for _ in range(5000)]
+    for asset in ASSET_TO_SZ_DECIMALS:
+        rounded_px = quantizer.round_px_array(asset, np.array(px))
+        assert rounded_px.tolist() == [quantizer.round_px(asset, x) for x in px]
+        assert quantizer.round_sz_array(asset, sz).tolist() == [quantizer.round_sz(asset, x) for x in sz]
+    with pytest.raises(ValueError):
+        quantizer.round_px_array(4, [1.0, float("inf")])
+
+
+def test_exchange_slippage_price_uses_quantizer():
+    meta: Meta = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+    spot_meta: SpotMeta = {"universe": [], "tokens": []}
+    info = Info(skip_ws=True, meta=meta, spot_meta=spot_meta)
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+    exchange = Exchange(wallet, info=info)
+    assert exchange._slippage_price("ETH", True, 0.05, 1900.0) == 1995.0
+    assert exchange._slippage_price("BTC", False, 0.01, 30123.0) == 29822.0
+    quantizer = exchange.quantizer
+    assert exchange.quantizer is quantizer
+    info.asset_to_sz_decimals = {0: 5, 1: 2}
+    assert exchange.quantizer is not quantizer
+    assert exchange.quantizer.max_px_decimals(1) == 4
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hyperliquid.api import API
+from hyperliquid.utils.error import ClientError
+from hyperliquid.utils.rate_limiter import (
+    PRIORITY_CANCEL,
+    PRIORITY_EXCHANGE,
+    PRIORITY_INFO,
+    RateLimiter,
+    request_priority,
+    request_weight,
+    response_weight,
+)
+
+CAPACITY = 20
+WEIGHT_PER_SECOND = 100
+
+
+@pytest.fixture
+def stub_server():
+    """Local /info and /exchange endpoint answering 429 once the weight of its own token bucket is used up."""
+    state = {"tokens": float(CAPACITY), "updated": time.monotonic(), "rejected": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            weight = request_weight(self.path, payload)
+            with lock:
+                now = time.monotonic()
+                state["tokens"] = min(CAPACITY, state["tokens"] + (now - state["updated"]) * WEIGHT_PER_SECOND)
+                state["updated"] = now
+                allowed = state["tokens"] >= weight
+                if allowed:
+                    state["tokens"] -= weight
+                else:
+                    state["rejected"] += 1
+            body = b"[]" if allowed else b"null"
+            self.send_response(200 if allowed else 429)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_weights_and_priorities():
+    assert request_weight("/info", {"type": "l2Book", "coin": "ETH"}) == 2
+    assert request_weight("/info", {"type": "userFills", "user": "0x0"}) == 20
+    assert request_weight("/info", {"type": "userRole", "user": "0x0"}) == 60
+    assert request_weight("/exchange", {"action": {"type": "order", "orders": [{}] * 79}}) == 2
+    assert request_weight("/exchange", {"action": {"type": "cancel", "cancels": [{}] * 80}}) == 3
+    assert request_weight("/exchange", {"action": {"type": "updateLeverage"}}) == 1
+    assert response_weight("/info", {"type": "userFills"}, [{}] * 45) == 2
+    assert response_weight("/info", {"type": "candleSnapshot"}, [{}] * 130) == 2
+    assert response_weight("/info", {"type": "l2Book"}, [[], []]) == 0
+    assert request_priority("/exchange", {"action": {"type": "cancelByCloid"}}) == PRIORITY_CANCEL
+    assert request_priority("/exchange", {"action": {"type": "order"}}) == PRIORITY_EXCHANGE
+    assert request_priority("/info", {"type": "l2Book"}) == PRIORITY_INFO
+
+
+def test_bursts_are_rejected_without_a_limiter(stub_server):
+    base_url, state = stub_server
+    api = API(base_url)
+    with pytest.raises(ClientError) as exc_info:
+        for _ in range(30):
+            api.post("/info", {"type": "l2Book", "coin": "ETH"})
+    assert exc_info.value.status_code == 429 and state["rejected"] == 1
+
+
+def test_limiter_keeps_bursts_within_server_limits(stub_server):
+    base_url, state = stub_server
+    # with some headroom, the server counts each request a little later than the client
+    limiter = RateLimiter(weight_per_minute=WEIGHT_PER_SECOND * 60 * 0.9, burst=CAPACITY / 2)
+    api = API(base_url, rate_limiter=limiter)
+    threads = [
+        threading.Thread(target=lambda: [api.post("/info", {"type": "l2Book", "coin": "ETH"}) for _ in range(10)])
+        for _ in range(3)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state["rejected"] == 0
+    # the first 5 requests fit in the bucket, the other 25 wait for 50 weight to refill
+    assert time.monotonic() - start >= 50 / (WEIGHT_PER_SECOND * 0.9) * 0.9
+    stats = limiter.stats()
+    assert stats["acquired"] == 30 and stats["weight"] == 60 and stats["depth"] == 0 and stats["max_depth"] >= 2
+
+
+def test_waiting_requests_are_served_in_priority_order():
+    limiter = RateLimiter(weight_per_minute=600, burst=2)
+    limiter.acquire(2)
+    order = []
+
+    def request(name, priority):
+        limiter.acquire(2, priority)
+        order.append(name)
+
+    threads = []
+    for name, priority in [("info", PRIORITY_INFO), ("order", PRIORITY_EXCHANGE), ("cancel", PRIORITY_CANCEL)]:
+        threads.append(threading.Thread(target=request, args=(name, priority)))
+        threads[-1].start()
+        while limiter.depth < len(threads):
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    assert order == ["cancel", "order", "info"]
+
+
+def test_charge_and_throttle_delay_later_requests():
+    limiter = RateLimiter(weight_per_minute=6000, burst=10)
+    limiter.charge(15)
+    assert limiter.acquire(5) >= 0.09
+    limiter.throttle()
+    assert limiter.acquire(5) >= 0.04
+    # weights above the bucket size are capped instead of waiting forever
+    assert limiter.acquire(100) >= 0.09
@@ -0,0 +1,109 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from hyperliquid.utils.replica_cmds import (
+    read_replica_blocks,
+    read_replica_signed_actions,
+    replica_cmds_paths,
+    scan_replica_signed_actions,
+)
+
+lz4_frame = pytest.importorskip("lz4.frame")
+
+
+def make_block(height, action_types):
+    signed_actions = [
+        {"action": {"type": t, "n": i}, "signature": {"r": "0x1", "s": "0x2", "v": 27}, "nonce": i}
+        for i, t in enumerate(action_types)
+    ]
+    return {
+        "abci_block": {
+            "time": f"2025-01-01T00:00:{height % 60:02d}",
+            "round": height,
+            "signed_action_bundles": [["0xabc", {"signed_actions": signed_actions}], ["0xdef", {"signed_actions": []}]],
+        },
+        "resps": None,
+    }
+
+
+BLOCKS = [
+    make_block(1, ["order", "cancel"]),
+    make_block(2, ["tokenDelegate", "order"]),
+    make_block(3, []),
+    make_block(4, ["order", "tokenDelegate", "tokenDelegate"]),
+]
+
+
+@pytest.fixture(params=[".lz4", ""])
+def replica_file(request, tmp_path):
+    path = str(tmp_path / f"10000{request.param}")
+    data = "".join(json.dumps(block) + "\n" for block in BLOCKS).encode()
+    if request.param:
+        # several frames, as when the file is written in chunks
+        with open(path, "wb") as f:
+            for i in range(0, len(data), 100):
+                f.write(lz4_frame.compress(data[i : i + 100]))
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
+
+
+def test_read_replica_blocks(replica_file):
+    assert list(read_replica_blocks(replica_file)) == BLOCKS
+    assert list(read_replica_blocks(replica_file, ["tokenDelegate"])) == [BLOCKS[1], BLOCKS[3]]
+    assert list(read_replica_blocks(replica_file, ["noSuchAction"], json_codec="json")) == []
+
+
+def test_read_replica_signed_actions(replica_file):
+    actions = [signed_action["action"] for signed_action in read_replica_signed_actions(replica_file)]
+    assert [action["type"] for action in actions] == ["order", "cancel", "tokenDelegate", "order"] + [
+        "order",
+        "tokenDelegate",
+        "tokenDelegate",
+    ]
+    delegates = list(read_replica_signed_actions(replica_file, ["tokenDelegate"]))
+    assert [(d["action"]["type"], d["nonce"]) for d in delegates] == [
+        ("tokenDelegate", 0),
+        ("tokenDelegate", 1),
+        ("tokenDelegate", 2),
+    ]
+
+
+def write_replica_files(tmp_path, n_files):
+    for f in range(n_files):
+        blocks = [make_block(f * 10 + b, ["order", "tokenDelegate"][: b % 3]) for b in range(5)]
+        with open(tmp_path / f"{f * 10000 + 1}.lz4", "wb") as out:
+            out.write(lz4_frame.compress("".join(json.dumps(block) + "\n" for block in blocks).encode()))
+
+
+def collect_nonces(nonces, signed_action):
+    return nonces + [(signed_action["action"]["type"], signed_action["nonce"])]
+
+
+def concat(earlier, later):
+    return earlier + later
+
+
+def test_scan_replica_signed_actions(tmp_path):
+    write_replica_files(tmp_path, 4)
+    paths = replica_cmds_paths(str(tmp_path), 1, 40001)
+    assert paths == [str(tmp_path / f"{height}.lz4") for height in (1, 10001, 20001, 30001)]
+    with pytest.raises(FileNotFoundError):
+        replica_cmds_paths(str(tmp_path), 1, 50001)
+
+    expected = [
+        (signed_action["action"]["type"], signed_action["nonce"])
+        for path in paths
+        for signed_action in read_replica_signed_actions(path)
+    ]
+    assert scan_replica_signed_actions(paths, collect_nonces, list, concat) == expected
+    with ProcessPoolExecutor(2) as executor:
+        assert scan_replica_signed_actions(paths, collect_nonces, list, concat, executor=executor) == expected
+        delegates = scan_replica_signed_actions(
+            paths, collect_nonces, list, concat, action_types=["tokenDelegate"], executor=executor
+        )
+    assert delegates == [item for item in expected if item[0] == "tokenDelegate"] and delegates
+    assert scan_replica_signed_actions([], collect_nonces, list, concat) == []
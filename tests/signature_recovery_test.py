@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import eth_account
+import pytest
+from eth_account.messages import encode_typed_data
+
+from hyperliquid.utils.signature_recovery import (
+    recover_l1_action_signers,
+    recover_signers,
+    recover_user_signed_action_signers,
+    user_signed_signable_message,
+)
+from hyperliquid.utils.signing import (
+    MULTI_SIG_ENVELOPE_SIGN_TYPES,
+    TOKEN_DELEGATE_TYPES,
+    USD_SEND_SIGN_TYPES,
+    WITHDRAW_SIGN_TYPES,
+    sign_l1_action,
+    sign_token_delegate_action,
+    user_signed_payload,
+)
+
+WALLETS = [eth_account.Account.from_key(bytes([i + 1]) * 32) for i in range(3)]
+
+
+def token_delegates(n):
+    signed_actions = []
+    for i in range(n):
+        action = {
+            "type": "tokenDelegate",
+            "validator": "0x5ac99df645f3414876c816caa18b2d234024b487",
+            "wei": 100_000_000 * (i + 1),
+            "isUndelegate": i % 2 == 1,
+            "nonce": 1700000000000 + i,
+        }
+        signature = sign_token_delegate_action(WALLETS[i % len(WALLETS)], action, True)
+        signed_actions.append((action, signature))
+    return signed_actions
+
+
+@pytest.mark.parametrize(
+    "payload_types, primary_type, message",
+    [
+        (TOKEN_DELEGATE_TYPES, "HyperliquidTransaction:TokenDelegate", token_delegates(1)[0][0]),
+        (
+            USD_SEND_SIGN_TYPES,
+            "HyperliquidTransaction:UsdSend",
+            {"signatureChainId": "0xa4b1", "destination": "0x" + "12" * 20, "amount": "1.5", "time": 1},
+        ),
+        (
+            WITHDRAW_SIGN_TYPES,
+            "HyperliquidTransaction:Withdraw",
+            {"signatureChainId": "0x66eee", "destination": "0x" + "12" * 20, "amount": "1", "time": 1},
+        ),
+        (
+            MULTI_SIG_ENVELOPE_SIGN_TYPES,
+            "HyperliquidTransaction:SendMultiSig",
+            {"signatureChainId": "0x66eee", "multiSigActionHash": b"\x07" * 32, "nonce": 5},
+        ),
+    ],
+)
+@pytest.mark.parametrize("is_mainnet", [True, False])
+def test_user_signed_signable_message_matches_encode_typed_data(payload_types, primary_type, message, is_mainnet):
+    message = dict(message, signatureChainId=message.get("signatureChainId", "0x66eee"))
+    original = dict(message)
+    expected = dict(message, hyperliquidChain="Mainnet" if is_mainnet else "Testnet")
+    assert user_signed_signable_message(message, payload_types, primary_type, is_mainnet) == encode_typed_data(
+        full_message=user_signed_payload(primary_type, payload_types, expected)
+    )
+    assert message == original
+
+
+def test_recover_user_signed_action_signers():
+    signed_actions = token_delegates(9)
+    expected = [WALLETS[i % len(WALLETS)].address for i in range(9)]
+    signers = recover_user_signed_action_signers(
+        signed_actions, TOKEN_DELEGATE_TYPES, "HyperliquidTransaction:TokenDelegate", True
+    )
+    assert list(signers) == expected
+    with ProcessPoolExecutor(2) as executor:
+        signers = recover_user_signed_action_signers(
+            iter(signed_actions),
+            TOKEN_DELEGATE_TYPES,
+            "HyperliquidTransaction:TokenDelegate",
+            True,
+            executor=executor,
+            chunk_size=2,
+        )
+        assert list(signers) == expected
+
+
+def test_recover_l1_action_signers_streams_in_order():
+    signed_actions = []
+    for i in range(7):
+        action = {"type": "cancel", "cancels": [{"a": 4, "o": i}]}
+        vault_address = None if i % 2 else "0x1719884eb866cb12b2287399b15f7db5e7d775ea"
+        expires_after = None if i % 3 else 1700000060000
+        signature = sign_l1_action(WALLETS[i % 3], action, vault_address, 1700000000000 + i, expires_after, False)
+        signed_actions.append((action, signature, vault_address, 1700000000000 + i, expires_after))
+
+    consumed = []
+
+    def inputs():
+        for signed_action in signed_actions:
+            consumed.append(signed_action)
+            yield signed_action
+
+    with ThreadPoolExecutor(2) as executor:
+        signers = recover_l1_action_signers(inputs(), False, executor=executor, chunk_size=1, max_pending_chunks=2)
+        assert next(signers) == WALLETS[0].address
+        # only a bounded window of chunks is read ahead
+        assert len(consumed) < len(signed_actions)
+        assert list(signers) == [WALLETS[i % 3].address for i in range(1, 7)]
+    assert list(recover_signers([])) == []
@@ -1,16 +1,36 @@
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+
 import eth_account
+import msgpack
 import pytest
-from eth_utils import to_hex
+from eth_account.messages import encode_typed_data
+from eth_utils import keccak, to_hex
 
+import hyperliquid.utils.signing
 from hyperliquid.utils.signing import (
+    USD_SEND_SIGN_TYPES,
+    NonceAllocator,
     OrderRequest,
+    OrderType,
     ScheduleCancelAction,
     action_hash,
     construct_phantom_agent,
     float_to_int_for_hashing,
+    float_to_wire,
+    get_timestamp_ms,
+    l1_payload,
+    l1_signable_message,
+    ladder_to_order_wires,
     order_request_to_order_wire,
     order_wires_to_order_action,
+    recover_agent_or_user_from_l1_action,
     sign_l1_action,
+    sign_multi_sig_l1_action_payload,
+    sign_multi_sig_l1_action_payloads,
+    sign_multi_sig_user_signed_action_payload,
+    sign_multi_sig_user_signed_action_payloads,
     sign_usd_transfer_action,
     sign_withdraw_from_bridge_action,
 )
@@ -34,6 +54,20 @@ def test_phantom_agent_creation_matches_production():
     assert to_hex(phantom_agent["connectionId"]) == "0x0fcbeda5ae3c4950a548021552a4fea2226858c4453571bf3f24ba017eac2908"
 
 
+@pytest.mark.parametrize("is_mainnet", [True, False, 1, 0, "mainnet", None])
+def test_l1_signable_message_matches_encode_typed_data(is_mainnet):
+    hash = keccak(text="connection id")
+    expected = encode_typed_data(full_message=l1_payload(construct_phantom_agent(hash, is_mainnet)))
+    assert l1_signable_message(hash, is_mainnet) == expected
+
+
+def test_recover_l1_action_signer():
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+    action = {"type": "dummy", "num": float_to_int_for_hashing(1000)}
+    signature = sign_l1_action(wallet, action, None, 0, None, True)
+    assert recover_agent_or_user_from_l1_action(action, signature, None, 0, None, True) == wallet.address
+
+
 def test_l1_action_signing_matches():
     wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
     action = {"type": "dummy", "num": float_to_int_for_hashing(1000)}
@@ -185,6 +219,47 @@ def test_float_to_int_for_hashing():
         float_to_int_for_hashing(0.000012312312)
 
 
+def decimal_float_to_wire(x):
+    rounded = f"{x:.8f}"
+    if abs(float(rounded) - x) >= 1e-12:
+        raise ValueError("float_to_wire causes rounding", x)
+    normalized = f"{Decimal(rounded).normalize():f}"
+    # the previous implementation meant to write negative zero as "0" but compared before normalizing
+    return "0" if normalized == "-0" else normalized
+
+
+def test_float_to_wire():
+    assert float_to_wire(1670.1) == "1670.1"
+    assert float_to_wire(0.0147) == "0.0147"
+    assert float_to_wire(100) == "100"
+    assert float_to_wire(1e-8) == "0.00000001"
+    assert float_to_wire(0.0) == "0" and float_to_wire(-0.0) == "0"
+    for x in (1.000000001, float("nan"), float("inf"), -float("inf")):
+        with pytest.raises(ValueError):
+            float_to_wire(x)
+
+
+def test_float_to_wire_matches_decimal_normalization():
+    rng = random.Random(0)
+    corpus = [0.0, 1.0, -1.0, 1e-8, 5e-9, 1e15, 123456789.12345678]
+    for _ in range(10000):
+        decimals = rng.randrange(10)
+        magnitude = 10 ** rng.randrange(-4, 9)
+        corpus.append(round(rng.uniform(-1, 1) * magnitude, decimals))
+        corpus.append(rng.randrange(-(10**12), 10**12) / 10**decimals)
+        corpus.append(rng.uniform(-1, 1) * magnitude)
+    for x in corpus:
+        float_to_wire.cache_clear()
+        try:
+            expected = decimal_float_to_wire(x)
+        except ValueError:
+            with pytest.raises(ValueError):
+                float_to_wire(x)
+            continue
+        assert float_to_wire(x) == expected
+        assert float_to_wire(x) == expected
+
+
 def test_sign_usd_transfer_action():
     wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
     message = {
@@ -271,3 +346,158 @@ def test_schedule_cancel_action():
     assert signature_testnet["r"] == "0x4e4f2dbd4107c69783e251b7e1057d9f2b9d11cee213441ccfa2be63516dc5bc"
     assert signature_testnet["s"] == "0x706c656b23428c8ba356d68db207e11139ede1670481a9e01ae2dfcdb0e1a678"
     assert signature_testnet["v"] == 27
+
+
+def test_ladder_to_order_wires_matches_order_request_to_order_wire():
+    np = pytest.importorskip("numpy")
+    prices = np.array([1900.5, 1900.0, 1899.5, 1899.0])
+    sizes = np.array([0.1, 0.25, 0.5, 1.0])
+    sides = np.array([True, True, False, False])
+    cloids = [Cloid.from_int(1), None, Cloid.from_int(3), None]
+    order_type: OrderType = {"trigger": {"triggerPx": 1890.0, "isMarket": True, "tpsl": "sl"}}
+    order_wires = ladder_to_order_wires(4, sides, sizes, prices, order_type, True, cloids)
+    expected = []
+    for px, sz, is_buy, cloid in zip(prices.tolist(), sizes.tolist(), sides.tolist(), cloids):
+        order: OrderRequest = {
+            "coin": "ETH",
+            "is_buy": is_buy,
+            "sz": sz,
+            "limit_px": px,
+            "order_type": order_type,
+            "reduce_only": True,
+            "cloid": cloid,
+        }
+        expected.append(order_request_to_order_wire(order, 4))
+    assert order_wires == expected
+    assert action_hash(order_wires_to_order_action(order_wires), None, 0, None) == action_hash(
+        order_wires_to_order_action(expected), None, 0, None
+    )
+
+    assert [wire["b"] for wire in ladder_to_order_wires(4, False, [1, 2], [10, 11], order_type)] == [False, False]
+    assert [wire["b"] for wire in ladder_to_order_wires(4, np.bool_(True), [1, 2], [10, 11], order_type)] == [
+        True,
+        True,
+    ]
+    order_wires[0]["t"]["trigger"]["tpsl"] = "tp"
+    assert order_wires[1]["t"]["trigger"]["tpsl"] == "sl"
+    with pytest.raises(ValueError):
+        ladder_to_order_wires(4, True, sizes[:2], prices, order_type)
+
+
+def packb_action_hash(action, vault_address, nonce, expires_after):
+    data = msgpack.packb(action)
+    data += nonce.to_bytes(8, "big")
+    if vault_address is None:
+        data += b"\x00"
+    else:
+        data += b"\x01"
+        data += bytes.fromhex(vault_address[2:])
+    if expires_after is not None:
+        data += b"\x00"
+        data += expires_after.to_bytes(8, "big")
+    return keccak(data)
+
+
+def test_action_hash_matches_packb():
+    order: OrderRequest = {
+        "coin": "ETH",
+        "is_buy": True,
+        "sz": 100,
+        "limit_px": 100,
+        "reduce_only": False,
+        "order_type": {"limit": {"tif": "Gtc"}},
+        "cloid": Cloid.from_int(7),
+    }
+    actions = [
+        order_wires_to_order_action([order_request_to_order_wire(order, i) for i in range(50)]),
+        {"type": "cancel", "cancels": [{"a": 1, "o": 123}]},
+        {"type": "dummy", "num": float_to_int_for_hashing(1000)},
+    ]
+    cases = [
+        (action, vault_address, nonce, expires_after)
+        for action in actions
+        for vault_address in (None, "0x1719884eb866cb12b2287399b15f7db5e7d775ea")
+        for nonce in (0, 1677777606040)
+        for expires_after in (None, 1677777666040)
+    ]
+    with ThreadPoolExecutor(4) as executor:
+        hashes = list(executor.map(lambda case: action_hash(*case), cases * 20))
+    assert hashes == [packb_action_hash(*case) for case in cases * 20]
+    with pytest.raises(TypeError):
+        action_hash({"type": "dummy", "num": object()}, None, 0, None)
+    assert action_hash(*cases[0]) == packb_action_hash(*cases[0])
+
+
+def test_sign_multi_sig_payloads_match_per_wallet_signing():
+    wallets = [eth_account.Account.from_key(bytes([i + 1]) * 32) for i in range(3)]
+    multi_sig_user = "0x0000000000000000000000000000000000000005"
+    outer_signer = wallets[0].address
+    order_action = {
+        "type": "order",
+        "orders": [{"a": 4, "b": True, "p": "1100", "s": "0.2", "r": False, "t": {"limit": {"tif": "Gtc"}}}],
+        "grouping": "na",
+    }
+    l1_args = (order_action, False, None, 1677777606040, None, multi_sig_user, outer_signer)
+    send_action = {
+        "type": "usdSend",
+        "signatureChainId": "0x66eee",
+        "hyperliquidChain": "Testnet",
+        "destination": "0x0000000000000000000000000000000000000000",
+        "amount": "100.0",
+        "time": 1677777606040,
+    }
+    user_signed_args = (
+        send_action,
+        False,
+        USD_SEND_SIGN_TYPES,
+        "HyperliquidTransaction:UsdSend",
+        multi_sig_user,
+        outer_signer,
+    )
+    expected_l1 = [sign_multi_sig_l1_action_payload(wallet, *l1_args) for wallet in wallets]
+    expected_user_signed = [sign_multi_sig_user_signed_action_payload(wallet, *user_signed_args) for wallet in wallets]
+    assert len({signature["r"] for signature in expected_l1}) == 3
+
+    assert sign_multi_sig_l1_action_payloads(wallets, *l1_args) == expected_l1
+    assert sign_multi_sig_user_signed_action_payloads(wallets, *user_signed_args) == expected_user_signed
+    with ProcessPoolExecutor(2) as executor:
+        assert sign_multi_sig_l1_action_payloads(wallets, *l1_args, executor=executor) == expected_l1
+        assert (
+            sign_multi_sig_user_signed_action_payloads(wallets, *user_signed_args, executor=executor)
+            == expected_user_signed
+        )
+
+
+def test_nonce_allocator_is_unique_and_increasing_under_contention():
+    allocator = NonceAllocator()
+    start = get_timestamp_ms()
+
+    def allocate(_):
+        return [allocator.next() for _ in range(2000)]
+
+    with ThreadPoolExecutor(32) as executor:
+        per_thread = list(executor.map(allocate, range(32)))
+    assert all(all(a < b for a, b in zip(nonces, nonces[1:])) for nonces in per_thread)
+    nonces = [nonce for thread_nonces in per_thread for nonce in thread_nonces]
+    assert len(set(nonces)) == len(nonces) == 64000
+    assert min(nonces) >= start and max(nonces) == allocator.last
+
+
+def test_nonce_allocator_skips_reserved_nonces():
+    allocator = NonceAllocator()
+    first = allocator.next()
+    reserved = [allocator.reserve(0), allocator.reserve(0), allocator.reserve(60_000)]
+    assert reserved[0] > first and reserved[1] > reserved[0] and reserved[2] >= first + 60_000
+    nonces = [allocator.next() for _ in range(3)]
+    assert not set(nonces) & set(reserved) and nonces == sorted(nonces) and nonces[-1] < reserved[2]
+
+
+def test_nonce_allocator_drops_passed_reservations_without_next(monkeypatch):
+    allocator = NonceAllocator()
+    now = [1_000_000]
+    monkeypatch.setattr(hyperliquid.utils.signing, "get_timestamp_ms", lambda: now[0])
+    for _ in range(100):
+        allocator.reserve(5000)
+        now[0] += 1000
+    assert len(allocator.reserved) <= 6
+    assert allocator.next() not in allocator.reserved
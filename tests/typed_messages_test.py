@@ -0,0 +1,108 @@
+import json
+
+import pytest
+import websocket
+
+from hyperliquid.utils.local_book import LocalBook
+from hyperliquid.utils.typed_messages import (
+    AllMidsMsg,
+    BboMsg,
+    L2BookMsg,
+    TradesMsg,
+    TypedMessageDecoder,
+    UserFillsMsg,
+)
+from hyperliquid.utils.types import Any, List
+from hyperliquid.websocket_manager import WebsocketManager, typed_ws_msg_to_identifier
+
+pytest.importorskip("msgspec")
+
+L2_BOOK_MSG = {
+    "channel": "l2Book",
+    "data": {
+        "coin": "ETH",
+        "time": 1700000000000,
+        "levels": [[{"px": "1900.5", "sz": "1.25", "n": 3}], [{"px": "1901", "sz": "0.5", "n": 1}]],
+    },
+}
+FILL = {
+    "coin": "BTC",
+    "px": "30000.0",
+    "sz": "0.01",
+    "side": "B",
+    "time": 1,
+    "startPosition": "0.0",
+    "dir": "Open Long",
+    "closedPnl": "0.0",
+    "hash": "0x00",
+    "oid": 12,
+    "crossed": True,
+    "fee": "0.1",
+    "tid": 7,
+    "feeToken": "USDC",
+}
+
+
+class NullWebsocket(websocket.WebSocketApp):
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        pass
+
+
+def test_decode_typed_messages():
+    decoder = TypedMessageDecoder()
+    book = decoder.decode(json.dumps(L2_BOOK_MSG))
+    assert isinstance(book, L2BookMsg)
+    bids, asks = book.data.levels
+    assert (bids[0].px, bids[0].sz, bids[0].n) == (1900.5, 1.25, 3)
+    assert asks[0].px == 1901.0
+
+    trades = decoder.decode(
+        b'{"channel":"trades","data":[{"coin":"ETH","side":"A","px":"1900","sz":"2","time":1,"hash":"0x0","tid":3}]}'
+    )
+    assert isinstance(trades, TradesMsg)
+    assert trades.data[0].sz == 2.0 and trades.data[0].side == "A"
+
+    bbo = decoder.decode('{"channel":"bbo","data":{"coin":"ETH","time":1,"bbo":[null,{"px":"1","sz":"2","n":1}]}}')
+    assert isinstance(bbo, BboMsg)
+    bid, ask = bbo.data.bbo
+    assert bid is None and ask is not None and ask.sz == 2.0
+
+    fills = decoder.decode(json.dumps({"channel": "userFills", "data": {"user": "0xab", "fills": [FILL]}}))
+    assert isinstance(fills, UserFillsMsg)
+    assert fills.data.fills[0].closed_pnl == 0.0 and fills.data.fills[0].fee_token == "USDC"
+    assert not fills.data.is_snapshot
+
+    mids = decoder.decode('{"channel":"allMids","data":{"mids":{"ETH":"1900.5"}}}')
+    assert isinstance(mids, AllMidsMsg)
+    assert mids.data.mids == {"ETH": 1900.5}
+
+
+def test_other_channels_decode_to_dicts():
+    decoder = TypedMessageDecoder()
+    assert decoder.decode('{"channel":"pong"}') == {"channel": "pong"}
+    order_updates = {"channel": "orderUpdates", "data": [{"status": "open"}]}
+    assert decoder.decode(json.dumps(order_updates)) == order_updates
+    with pytest.raises(ValueError):
+        decoder.decode('{"channel":"l2Book","data":{"coin":"ETH"}}')
+
+
+def test_typed_message_routing():
+    decoder = TypedMessageDecoder()
+    assert typed_ws_msg_to_identifier(decoder.decode(json.dumps(L2_BOOK_MSG))) == "l2Book:eth"
+    assert typed_ws_msg_to_identifier(decoder.decode('{"channel":"trades","data":[]}')) is None
+    assert typed_ws_msg_to_identifier(decoder.decode('{"channel":"allMids","data":{"mids":{}}}')) == "allMids"
+    assert typed_ws_msg_to_identifier(decoder.decode('{"channel":"orderUpdates","data":[]}')) == "orderUpdates"
+
+
+def test_websocket_manager_typed_messages():
+    manager = WebsocketManager("http://localhost", typed_messages=True)
+    manager.ws = NullWebsocket(manager.ws_url)
+    manager.on_open(manager.ws)
+    messages: List[Any] = []
+    book = LocalBook("ETH")
+    manager.subscribe({"type": "l2Book", "coin": "ETH"}, messages.append)
+    manager.subscribe({"type": "l2Book", "coin": "ETH"}, book.on_message)
+    manager.on_message(None, json.dumps(L2_BOOK_MSG))
+    assert isinstance(messages[0], L2BookMsg)
+    assert book.best_bid() == 1900.5 and book.best_ask() == 1901.0
+    assert book.time == 1700000000000
@@ -0,0 +1,271 @@
+import base64
+import hashlib
+import json
+import re
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+import pytest
+import websocket
+
+from hyperliquid.utils.types import (
+    AllMidsSubscription,
+    Any,
+    BboSubscription,
+    L2BookSubscription,
+    List,
+    TradesSubscription,
+)
+from hyperliquid.websocket_manager import WebsocketManager, subscription_to_identifier, ws_msg_to_identifier
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def encode_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    header = bytes([0x80 | opcode])
+    if len(payload) < 126:
+        header += bytes([len(payload)])
+    elif len(payload) < 1 << 16:
+        header += bytes([126]) + struct.pack("!H", len(payload))
+    else:
+        header += bytes([127]) + struct.pack("!Q", len(payload))
+    return header + payload
+
+
+def recv_exact(sock, n):
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return data
+
+
+def read_frame(sock):
+    b1, b2 = recv_exact(sock, 2)
+    length = b2 & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", recv_exact(sock, 2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", recv_exact(sock, 8))
+    mask = recv_exact(sock, 4) if b2 & 0x80 else b"\x00\x00\x00\x00"
+    payload = bytes(b ^ mask[i % 4] for i, b in enumerate(recv_exact(sock, length)))
+    return b1 & 0x0F, payload
+
+
+class WebsocketStandInServer(socketserver.ThreadingTCPServer):
+    """Minimal websocket server speaking just enough of RFC 6455 for the websocket-client library.
+
+    Records every JSON message received, answers pings and can abruptly kill all open connections.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), WebsocketStandInHandler)
+        self.received: List[Any] = []
+        self.connections: List[socket.socket] = []
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def broadcast(self, msg):
+        frame = encode_frame(json.dumps(msg).encode())
+        with self.lock:
+            for conn in self.connections:
+                conn.sendall(frame)
+
+    def kill_connections(self):
+        with self.lock:
+            for conn in self.connections:
+                conn.shutdown(socket.SHUT_RDWR)
+                conn.close()
+            self.connections = []
+
+    def wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if predicate(list(self.received)):
+                    return True
+            time.sleep(0.01)
+        return False
+
+
+class WebsocketStandInHandler(socketserver.BaseRequestHandler):
+    server: WebsocketStandInServer
+
+    def handle(self):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += self.request.recv(4096)
+        match = re.search(rb"Sec-WebSocket-Key:\s*(\S+)", request, re.IGNORECASE)
+        assert match is not None
+        key = match.group(1)
+        accept = base64.b64encode(hashlib.sha1(key + WEBSOCKET_GUID).digest())  # nosec B324
+        self.request.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        with self.server.lock:
+            self.server.connections.append(self.request)
+        self.request.sendall(encode_frame(b"Websocket connection established."))
+        try:
+            while True:
+                opcode, payload = read_frame(self.request)
+                if opcode == 0x8:
+                    break
+                msg = json.loads(payload)
+                with self.server.lock:
+                    self.server.received.append(msg)
+                if msg["method"] == "ping":
+                    self.request.sendall(encode_frame(json.dumps({"channel": "pong"}).encode()))
+        except (ConnectionError, OSError):
+            pass
+
+
+@pytest.fixture
+def ws_server():
+    server = WebsocketStandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "subscription, ws_msg, identifier",
+    [
+        ({"type": "allMids"}, {"channel": "allMids", "data": {"mids": {}}}, "allMids"),
+        ({"type": "l2Book", "coin": "ETH"}, {"channel": "l2Book", "data": {"coin": "ETH"}}, "l2Book:eth"),
+        ({"type": "trades", "coin": "BTC"}, {"channel": "trades", "data": [{"coin": "BTC"}]}, "trades:btc"),
+        ({"type": "userEvents", "user": "0xAb"}, {"channel": "user", "data": {}}, "userEvents"),
+        ({"type": "userFills", "user": "0xAb"}, {"channel": "userFills", "data": {"user": "0xaB"}}, "userFills:0xab"),
+        (
+            {"type": "candle", "coin": "ETH", "interval": "1m"},
+            {"channel": "candle", "data": {"s": "ETH", "i": "1m"}},
+            "candle:eth,1m",
+        ),
+        ({"type": "orderUpdates", "user": "0xAb"}, {"channel": "orderUpdates", "data": []}, "orderUpdates"),
+        ({"type": "webData2", "user": "0xAb"}, {"channel": "webData2", "data": {"user": "0xab"}}, "webData2:0xab"),
+        ({"type": "bbo", "coin": "@1"}, {"channel": "bbo", "data": {"coin": "@1"}}, "bbo:@1"),
+        (
+            {"type": "activeAssetCtx", "coin": "PURR/USDC"},
+            {"channel": "activeSpotAssetCtx", "data": {"coin": "PURR/USDC"}},
+            "activeAssetCtx:purr/usdc",
+        ),
+    ],
+)
+def test_message_routing(subscription, ws_msg, identifier):
+    assert subscription_to_identifier(subscription) == identifier
+    assert ws_msg_to_identifier(ws_msg) == identifier
+    assert ws_msg_to_identifier(ws_msg) is subscription_to_identifier(subscription)
+
+
+def test_unroutable_messages():
+    assert ws_msg_to_identifier({"channel": "pong"}) == "pong"
+    assert ws_msg_to_identifier({"channel": "trades", "data": []}) is None
+    subscription_response: Any = {"channel": "subscriptionResponse", "data": {}}
+    assert ws_msg_to_identifier(subscription_response) is None
+
+
+def subscribe_count(subscription):
+    return lambda received: sum(msg == {"method": "subscribe", "subscription": subscription} for msg in received)
+
+
+def test_reconnect_replays_subscriptions(ws_server):
+    manager = WebsocketManager(ws_server.base_url, reconnect_backoff_min=0.05, reconnect_backoff_max=0.1)
+    messages: List[Any] = []
+    reconnected = threading.Event()
+    manager.add_reconnect_callback(reconnected.set)
+    manager.start()
+    try:
+        all_mids: AllMidsSubscription = {"type": "allMids"}
+        l2_book: L2BookSubscription = {"type": "l2Book", "coin": "ETH"}
+        manager.subscribe(all_mids, messages.append)
+        manager.subscribe(l2_book, messages.append)
+        assert ws_server.wait_for(lambda received: subscribe_count(l2_book)(received) == 1)
+
+        ws_server.kill_connections()
+        assert reconnected.wait(5)
+        assert ws_server.wait_for(lambda received: subscribe_count(all_mids)(received) == 2)
+        assert ws_server.wait_for(lambda received: subscribe_count(l2_book)(received) == 2)
+
+        ws_server.broadcast({"channel": "allMids", "data": {"mids": {"ETH": "1000.0"}}})
+        deadline = time.monotonic() + 5
+        while not messages and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert messages == [{"channel": "allMids", "data": {"mids": {"ETH": "1000.0"}}}]
+    finally:
+        manager.stop()
+        manager.join(5)
+    assert not manager.is_alive()
+
+
+def test_unsubscribed_subscriptions_are_not_replayed(ws_server):
+    manager = WebsocketManager(ws_server.base_url, reconnect_backoff_min=0.05, reconnect_backoff_max=0.1)
+    reconnected = threading.Event()
+    manager.add_reconnect_callback(reconnected.set)
+    manager.start()
+    try:
+        trades: TradesSubscription = {"type": "trades", "coin": "BTC"}
+        bbo: BboSubscription = {"type": "bbo", "coin": "BTC"}
+        trades_id = manager.subscribe(trades, lambda _: None)
+        manager.subscribe(bbo, lambda _: None)
+        assert ws_server.wait_for(lambda received: subscribe_count(bbo)(received) == 1)
+        assert manager.unsubscribe(trades, trades_id)
+
+        ws_server.kill_connections()
+        assert reconnected.wait(5)
+        assert ws_server.wait_for(lambda received: subscribe_count(bbo)(received) == 2)
+        assert subscribe_count(trades)(ws_server.received) == 1
+    finally:
+        manager.stop()
+        manager.join(5)
+
+
+class RecordingWebsocket(websocket.WebSocketApp):
+    def __init__(self, url):
+        super().__init__(url)
+        self.sent: List[Any] = []
+
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        self.sent.append(json.loads(data))
+
+
+def test_unsubscribe_while_reconnecting():
+    manager = WebsocketManager("http://localhost")
+    ws = RecordingWebsocket(manager.ws_url)
+    manager.ws = ws
+    manager.on_open(ws)
+    manager.on_close(ws, None, None)
+    trades: TradesSubscription = {"type": "trades", "coin": "BTC"}
+    trades_id = manager.subscribe(trades, lambda _: None)
+    assert manager.unsubscribe(trades, trades_id)
+    assert not manager.unsubscribe(trades, trades_id)
+
+    manager.on_open(ws)
+    assert manager.active_subscriptions["trades:btc"] == []
+    assert "trades:btc" not in manager.identifier_to_subscription
+    assert ws.sent == []
+
+
+def test_no_reconnect_when_disabled(ws_server):
+    manager = WebsocketManager(ws_server.base_url, reconnect=False)
+    manager.start()
+    try:
+        manager.subscribe({"type": "allMids"}, lambda _: None)
+        assert ws_server.wait_for(lambda received: len(received) == 1)
+        ws_server.kill_connections()
+        manager.join(5)
+        assert not manager.is_alive()
+    finally:
+        manager.stop()